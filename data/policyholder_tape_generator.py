@@ -1,22 +1,14 @@
-import numpy as np
-import pandas as pd
+"""
+Regenerate `policyholder_tape.csv` next to this script, wherever it is run from: 1,000 synthetic policyholders. The
+rows differ from the tape shipped in `data/`, so overwriting it changes the capitals of the example scenarios. For
+other sizes, seeds, outputs, asset tapes or binary tapes, run `python -m mfi_alm.tape_generator` directly.
+"""
 
+import os
 
-# Set random seed for reproducibility
-np.random.seed(42)
+from mfi_alm.tape_generator import main
 
-# Number of policyholders
-num_policyholders = 1000
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "policyholder_tape.csv")
 
-# Generate random values
-ages = np.random.randint(20, 81, size=num_policyholders)  # Ages between 20 and 80
-benefits = np.random.randint(100000, 2000001, size=num_policyholders)  # Benefits between 100k and 2M
-mu_values = np.random.uniform(0.03, 0.08, size=num_policyholders)  # mu between 0.03 and 0.08
-
-# Create DataFrame
-policyholder_df = pd.DataFrame(
-    {"policyholder_id": np.arange(1, num_policyholders + 1), "age": ages, "benefit": benefits, "mu": mu_values}
-)
-
-# Save to CSV
-policyholder_df.to_csv("policyholder_tape.csv", index=False)
+if __name__ == "__main__":
+    main(["policyholders", "--rows", "1000", "--seed", "42", "--output", OUTPUT_PATH])
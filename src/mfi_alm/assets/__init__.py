@@ -1,11 +1,16 @@
 from .asset import Asset
 from .asset_portfolio import AssetPortfolio
 from .asset_portfolio_loader import AssetPortfolioLoader
+from .asset_view import AssetView, BondView
+from .bond_book import BondBook
 from .bonds import FixedBond
 
 __all__ = [
     "Asset",
     "AssetPortfolio",
+    "AssetView",
+    "BondView",
     "FixedBond",
     "AssetPortfolioLoader",
+    "BondBook",
 ]
@@ -8,6 +8,8 @@ import numpy as np
 class Asset:
     """An asset class representing a fixed-rate bond and its market value."""
 
+    __slots__ = ("fixed_bond", "ytm")
+
     def __init__(self, fixed_bond: FixedBond, ytm: float):
         self.fixed_bond = fixed_bond
         self.ytm = ytm
@@ -3,34 +3,74 @@ from typing import Self
 import numpy as np
 
 from mfi_alm.assets.asset import Asset
+from mfi_alm.assets.asset_view import AssetView
+from mfi_alm.assets.bond_book import BondBook
 
 
 class AssetPortfolio:
-    def __init__(self, assets: list[Asset], scale: float = 1.0):
-        self.assets = [a.copy() for a in assets]
+    """
+    Portfolio of fixed-rate bonds backed by a columnar `BondBook`.
+
+    `assets` is kept for compatibility and lists `AssetView` records indexing into the book (setting a record's
+    yield or terms writes through to this portfolio's book only); all valuations run on the book itself.
+    """
+
+    def __init__(self, assets: list[Asset] | None = None, scale: float = 1.0, book: BondBook | None = None):
+        if book is None:
+            assets = assets or []
+            book = BondBook.from_bonds(bonds=[a.fixed_bond for a in assets], ytms=[a.ytm for a in assets])
+        self.book = book
         self.scale = scale
+        self._assets = None
+
+    @property
+    def assets(self) -> list[AssetView]:
+        if self._assets is None:
+            self._assets = [AssetView(self.book, i) for i in range(len(self.book))]
+        return self._assets
 
     def market_value(self) -> float:
-        return self.scale * np.sum([a.market_value() for a in self.assets])
+        return self.scale * self.book.market_value()
+
+    def projected_market_values(self, years: int) -> np.ndarray:
+        """Unscaled market value of every bond at the start of each of the next `years` years (bonds x years)."""
+        return self.book.projected_prices(years)
+
+    def projected_total_market_values(self, years: int, ex_coupon: bool = False) -> np.ndarray:
+        """Scaled market value of the whole portfolio at the start of each of the next `years` years."""
+        return self.scale * np.sum(self.book.projected_prices(years, ex_coupon=ex_coupon), axis=0)
+
+    def projected_cashflows(self, years: int) -> np.ndarray:
+        """Scaled coupon and redemption cash flows received in each of the next `years` years."""
+        return self.scale * self.book.cashflow_buckets(years)
 
     def average_yield(self) -> float:
-        if len(self.assets) == 0:
+        if len(self.book) == 0:
             return 0.0
-        return np.mean([a.ytm for a in self.assets])
+        return np.mean(self.book.ytm)
 
     def projected_average_yields(self, years: int) -> np.ndarray:
-        if len(self.assets) == 0:
+        if len(self.book) == 0:
             return np.zeros(years)
-        avg_yield = np.mean([a.ytm for a in self.assets])
+        avg_yield = np.mean(self.book.ytm)
         return np.full(years, avg_yield)
 
+    def roll_forward(self, years: int, drop_run_off: bool = True) -> None:
+        """Age every bond by `years` years, dropping bonds that have run off unless `drop_run_off` is False."""
+        self.book.roll_forward(years, drop_run_off=drop_run_off)
+        self._assets = None
+
     def age_one_year(self) -> None:
-        for asset in self.assets:
-            asset.fixed_bond.maturity = max(asset.fixed_bond.maturity - 1, 0)
+        self.roll_forward(1, drop_run_off=False)
 
     def scale_to_target(self, target: float):
-        base_value = np.sum([a.market_value() for a in self.assets])
+        base_value = self.book.market_value()
         self.scale = target / base_value if base_value > 0 else 0.0
 
+    def with_ytm_factor(self, factor: float) -> Self:
+        """The portfolio with every yield multiplied by `factor`, sharing this portfolio's bond terms and schedule."""
+        return AssetPortfolio(scale=self.scale, book=self.book.with_ytm_factor(factor))
+
     def copy(self) -> Self:
-        return AssetPortfolio(assets=[a for a in self.assets], scale=self.scale)
+        """A copy sharing the (copy-on-write) bond book, so copying and rescaling cost O(1)."""
+        return AssetPortfolio(scale=self.scale, book=self.book.copy())
@@ -1,18 +1,70 @@
-import pandas as pd
+import numpy as np
 import json
-from mfi_alm.assets.asset import Asset, FixedBond
 from mfi_alm.assets.asset_portfolio import AssetPortfolio
+from mfi_alm.assets.bond_book import BondBook
+from mfi_alm.instrumentation import count, span
+from mfi_alm.tapes import cached_tape, is_tape, open_tape
+
+ASSET_COLUMNS = {"face": np.float64, "coupon": np.float64, "maturity": np.float64, "freq": np.int64, "ytm": np.float64}
 
 
 class AssetPortfolioLoader:
-    def load_asset_portfolio(file_path: str, ytm_factor: float) -> AssetPortfolio:
-        df = pd.read_csv(file_path)
-        assets = []
-        for i, r in df.iterrows():
-            bond = FixedBond(face=r["face"], coupon=r["coupon"], maturity=r["maturity"], freq=r["freq"])
-            assets.append(Asset(fixed_bond=bond, ytm=r["ytm"] * ytm_factor))
-
-        return AssetPortfolio(assets=assets)
+    def read_asset_columns(file_path: str, cache_dir: str | None = None) -> dict[str, np.ndarray]:
+        """
+        Read the asset tape as typed column arrays. `file_path` is either a CSV or a binary tape (see
+        `mfi_alm.tapes`); with `cache_dir`, a CSV is converted to a binary tape once and reused on later reads.
+        """
+        if is_tape(file_path):
+            columns = open_tape(file_path)
+        elif cache_dir is not None:
+            columns = cached_tape(
+                file_path, read_csv=AssetPortfolioLoader.read_asset_csv, cache_dir=cache_dir, dtypes=ASSET_COLUMNS
+            )
+        else:
+            return AssetPortfolioLoader.read_asset_csv(file_path)
+        AssetPortfolioLoader.validate_asset_columns(columns)
+        return columns
+
+    def read_asset_csv(file_path: str) -> dict[str, np.ndarray]:
+        import pandas as pd
+
+        df = pd.read_csv(file_path, usecols=list(ASSET_COLUMNS), dtype=ASSET_COLUMNS)
+        columns = {name: df[name].to_numpy() for name in ASSET_COLUMNS}
+        AssetPortfolioLoader.validate_asset_columns(columns)
+        return columns
+
+    def validate_asset_columns(columns: dict[str, np.ndarray]) -> None:
+        missing = [name for name in ASSET_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Asset tape is missing columns {missing}.")
+        checks = {
+            "face": columns["face"] >= 0,
+            "coupon": np.isfinite(columns["coupon"]),
+            "maturity": columns["maturity"] >= 0,
+            "freq": columns["freq"] > 0,
+            "ytm": np.isfinite(columns["ytm"]),
+        }
+        for name, valid in checks.items():
+            invalid = ~valid | ~np.isfinite(columns[name])
+            if np.any(invalid):
+                raise ValueError(
+                    f"Asset tape column '{name}' has {np.count_nonzero(invalid)} invalid rows "
+                    f"(first at row {np.argmax(invalid)})."
+                )
+
+    def load_asset_portfolio(file_path: str, ytm_factor: float, cache_dir: str | None = None) -> AssetPortfolio:
+        with span("load_asset_portfolio", path=file_path):
+            columns = AssetPortfolioLoader.read_asset_columns(file_path, cache_dir=cache_dir)
+            book = BondBook(
+                face=columns["face"],
+                coupon=columns["coupon"],
+                maturity=columns["maturity"],
+                freq=columns["freq"],
+                ytm=columns["ytm"] * ytm_factor,
+            )
+        count("bonds", len(book))
+        count("cash_flows", len(book.cf_times))
+        return AssetPortfolio(book=book)
 
     def load_from_config(config_path: str) -> dict:
         with open(config_path) as f:
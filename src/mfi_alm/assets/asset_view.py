@@ -0,0 +1,101 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from mfi_alm.assets.asset import Asset
+from mfi_alm.assets.bonds import FixedBond
+
+if TYPE_CHECKING:
+    from mfi_alm.assets.bond_book import BondBook
+
+
+class BondView:
+    """
+    `FixedBond` interface over row `index` of a `BondBook`. The view holds no data of its own; setting a term writes
+    it through to the book (see `BondBook.update`).
+    """
+
+    __slots__ = ("book", "index")
+
+    def __init__(self, book: "BondBook", index: int):
+        self.book = book
+        self.index = index
+
+    @property
+    def face(self) -> float:
+        return self.book.face[self.index].item()
+
+    @face.setter
+    def face(self, value: float) -> None:
+        self.book.update(self.index, face=value)
+
+    @property
+    def coupon(self) -> float:
+        return self.book.coupon[self.index].item()
+
+    @coupon.setter
+    def coupon(self, value: float) -> None:
+        self.book.update(self.index, coupon=value)
+
+    @property
+    def maturity(self) -> float:
+        return self.book.maturity[self.index].item()
+
+    @maturity.setter
+    def maturity(self, value: float) -> None:
+        self.book.update(self.index, maturity=value)
+
+    @property
+    def freq(self) -> int:
+        return self.book.freq[self.index].item()
+
+    @freq.setter
+    def freq(self, value: int) -> None:
+        self.book.update(self.index, freq=value)
+
+    def cashflows(self) -> list[tuple[float, float]]:
+        start, end = self.book.cf_offsets[self.index], self.book.cf_offsets[self.index + 1]
+        return list(zip(self.book.cf_times[start:end].tolist(), self.book.cf_amounts[start:end].tolist()))
+
+    def price(self, ytm: float) -> float:
+        start, end = self.book.cf_offsets[self.index], self.book.cf_offsets[self.index + 1]
+        return float(np.sum(self.book.cf_amounts[start:end] * np.exp(-ytm * self.book.cf_times[start:end])))
+
+    def project_prices(self, ytm: float, years: int) -> np.ndarray:
+        return self.copy().project_prices(ytm=ytm, years=years)
+
+    def copy(self) -> FixedBond:
+        """A standalone `FixedBond` with this row's terms."""
+        return self.book.bond(self.index)
+
+
+class AssetView:
+    """`Asset` interface over row `index` of a `BondBook`; setting `ytm` writes it through to the book."""
+
+    __slots__ = ("book", "index")
+
+    def __init__(self, book: "BondBook", index: int):
+        self.book = book
+        self.index = index
+
+    @property
+    def fixed_bond(self) -> BondView:
+        return BondView(self.book, self.index)
+
+    @property
+    def ytm(self) -> float:
+        return self.book.ytm[self.index].item()
+
+    @ytm.setter
+    def ytm(self, value: float) -> None:
+        self.book.update(self.index, ytm=value)
+
+    def market_value(self) -> float:
+        return self.fixed_bond.price(ytm=self.ytm)
+
+    def projected_market_values(self, years: int) -> np.ndarray:
+        return self.fixed_bond.project_prices(ytm=self.ytm, years=years)
+
+    def copy(self) -> Asset:
+        """A standalone `Asset` with this row's bond and yield."""
+        return Asset(fixed_bond=self.book.bond(self.index), ytm=self.ytm)
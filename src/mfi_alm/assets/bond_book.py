@@ -0,0 +1,185 @@
+import copy
+from typing import Self
+
+import numpy as np
+
+from mfi_alm.assets.bonds import FixedBond
+from mfi_alm.instrumentation import traced
+from mfi_alm.utils import read_only
+
+
+class BondBook:
+    """
+    Struct-of-arrays book of fixed-rate bonds.
+
+    Bond terms are held as one array per field, and the cash-flow schedule of the whole book is flattened into a
+    CSR-style layout: the flows of bond `i` are `cf_times[cf_offsets[i]:cf_offsets[i + 1]]` (and likewise for
+    `cf_amounts`), while `cf_bond` maps every flow back to its bond.
+
+    Columns are read-only and only ever replaced, never written in place, so `copy()` and `with_ytm_factor()` share
+    them with this book and cost O(1) regardless of its size.
+    """
+
+    def __init__(
+        self,
+        face: np.ndarray,
+        coupon: np.ndarray,
+        maturity: np.ndarray,
+        freq: np.ndarray,
+        ytm: np.ndarray,
+    ):
+        self.face = read_only(face, dtype=np.float64)
+        self.coupon = read_only(coupon, dtype=np.float64)
+        self.maturity = read_only(maturity, dtype=np.float64)
+        self.freq = read_only(freq, dtype=np.int64)
+        self.ytm = read_only(ytm, dtype=np.float64)
+        self._market_value = None
+
+        n = len(self.face)
+        if any(len(a) != n for a in (self.coupon, self.maturity, self.freq, self.ytm)):
+            raise ValueError("Bond book columns must all have the same length.")
+
+        self._build_schedule()
+
+    @classmethod
+    def from_bonds(cls, bonds: list[FixedBond], ytms: list[float]) -> Self:
+        return cls(
+            face=np.array([b.face for b in bonds], dtype=np.float64),
+            coupon=np.array([b.coupon for b in bonds], dtype=np.float64),
+            maturity=np.array([b.maturity for b in bonds], dtype=np.float64),
+            freq=np.array([b.freq for b in bonds], dtype=np.int64),
+            ytm=np.array(ytms, dtype=np.float64),
+        )
+
+    @traced("build_bond_schedule")
+    def _build_schedule(self) -> None:
+        """Flatten the cash flows of every bond, mirroring `FixedBond.cashflows`."""
+        counts = (self.maturity * self.freq).astype(np.int64)
+        self.cf_offsets = read_only(np.concatenate([[0], np.cumsum(counts)]))
+        self.cf_bond = read_only(np.repeat(np.arange(len(self)), counts))
+
+        # Period number (1-based) of each flow within its own bond.
+        period = np.arange(self.cf_offsets[-1]) - self.cf_offsets[self.cf_bond] + 1
+        bond_freq = self.freq[self.cf_bond]
+        self.cf_times = read_only(period / bond_freq)
+        cf_amounts = (self.coupon * self.face / self.freq)[self.cf_bond]
+
+        # Final installment plus principal.
+        has_flows = counts > 0
+        cf_amounts[self.cf_offsets[1:][has_flows] - 1] += self.face[has_flows]
+        self.cf_amounts = read_only(cf_amounts)
+
+    def __len__(self) -> int:
+        return len(self.face)
+
+    def bond(self, i: int) -> FixedBond:
+        return FixedBond(
+            face=float(self.face[i]),
+            coupon=float(self.coupon[i]),
+            maturity=float(self.maturity[i]),
+            freq=int(self.freq[i]),
+        )
+
+    def prices(self) -> np.ndarray:
+        """Continuously compounded price of every bond, in a single pass over the flattened schedule."""
+        discounted = self.cf_amounts * np.exp(-self.ytm[self.cf_bond] * self.cf_times)
+        return np.bincount(self.cf_bond, weights=discounted, minlength=len(self))
+
+    def market_value(self) -> float:
+        """Total price of the book, computed once and reused until the book is rolled forward."""
+        if self._market_value is None:
+            self._market_value = float(np.sum(self.prices()))
+        return self._market_value
+
+    def projected_prices(self, years: int, ex_coupon: bool = False) -> np.ndarray:
+        """
+        Mark-to-market price of every bond at the start of each of the next `years` years (bonds x years).
+
+        A flow at time `tau` is still outstanding at year `t` when `tau >= t` (or `tau > t` with `ex_coupon`, i.e.
+        once the flows paid up to and including `t` have been collected), and its value there is
+        `cf * exp(-ytm * (tau - t)) = exp(ytm * t) * cf * exp(-ytm * tau)`. Present values are therefore
+        scatter-added into the last year each flow is outstanding and summed backwards along the year axis.
+        """
+        if years <= 0:
+            return np.zeros((len(self), 0))
+        pv = self.cf_amounts * np.exp(-self.ytm[self.cf_bond] * self.cf_times)
+        last_year = (
+            np.ceil(self.cf_times).astype(np.int64) - 1 if ex_coupon else np.floor(self.cf_times).astype(np.int64)
+        )
+        outstanding_from_start = last_year >= 0
+        last_year = np.minimum(last_year, years - 1)[outstanding_from_start]
+        buckets = np.bincount(
+            self.cf_bond[outstanding_from_start] * years + last_year,
+            weights=pv[outstanding_from_start],
+            minlength=len(self) * years,
+        )
+        outstanding = np.cumsum(buckets.reshape(len(self), years)[:, ::-1], axis=1)[:, ::-1]
+        return np.exp(np.outer(self.ytm, np.arange(years))) * outstanding
+
+    def cashflow_buckets(self, years: int) -> np.ndarray:
+        """
+        Total cash flow of the book paid in each of the next `years` years: a flow at time `tau` falls in year
+        `ceil(tau)`, i.e. bucket `ceil(tau) - 1`. Flows after the horizon are left out.
+        """
+        bucket = np.ceil(self.cf_times).astype(np.int64) - 1
+        in_horizon = bucket < years
+        return np.bincount(bucket[in_horizon], weights=self.cf_amounts[in_horizon], minlength=years)[:years]
+
+    def update(self, i: int, **terms: float) -> None:
+        """
+        Set terms (`face`, `coupon`, `maturity`, `freq`, `ytm`) of bond `i`. The changed columns are replaced by
+        updated copies rather than written into, so other books sharing them are unaffected; this costs O(bonds) and
+        is meant for occasional edits, e.g. through `AssetView`.
+        """
+        unknown = set(terms) - {"face", "coupon", "maturity", "freq", "ytm"}
+        if unknown:
+            raise ValueError(f"Unknown bond terms {sorted(unknown)}.")
+        for name, value in terms.items():
+            column = np.array(getattr(self, name))
+            column[i] = value
+            setattr(self, name, read_only(column))
+        if set(terms) - {"ytm"}:
+            self._build_schedule()
+        self._market_value = None
+
+    def with_ytm_factor(self, factor: float) -> Self:
+        """
+        The book with every yield multiplied by `factor`. Bond terms and the cash-flow schedule do not depend on the
+        yield, so they are shared with this book rather than rebuilt.
+        """
+        book = copy.copy(self)
+        book.ytm = read_only(self.ytm * factor)
+        book._market_value = None
+        return book
+
+    def roll_forward(self, years: int, drop_run_off: bool = True) -> None:
+        """
+        Age the book by `years` years. The schedule is shifted rather than rebuilt: flows paid by then are dropped
+        and the others brought `years` closer, which keeps every bond's flows contiguous in the CSR layout. With
+        `drop_run_off`, bonds left with no flows are removed from the book.
+        """
+        self.maturity = read_only(np.maximum(self.maturity - years, 0))
+        outstanding = self.cf_times > years
+        counts = np.bincount(self.cf_bond[outstanding], minlength=len(self))
+        self.cf_times = read_only(self.cf_times[outstanding] - years)
+        self.cf_amounts = read_only(self.cf_amounts[outstanding])
+        self._market_value = None
+
+        if drop_run_off:
+            live = counts > 0
+            self.face = read_only(self.face[live])
+            self.coupon = read_only(self.coupon[live])
+            self.maturity = read_only(self.maturity[live])
+            self.freq = read_only(self.freq[live])
+            self.ytm = read_only(self.ytm[live])
+            counts = counts[live]
+
+        self.cf_offsets = read_only(np.concatenate([[0], np.cumsum(counts)]))
+        self.cf_bond = read_only(np.repeat(np.arange(len(self)), counts))
+
+    def age_one_year(self) -> None:
+        self.roll_forward(1, drop_run_off=False)
+
+    def copy(self) -> Self:
+        """A copy sharing this book's (read-only) columns and schedule; it diverges only once either is mutated."""
+        return copy.copy(self)
@@ -5,6 +5,8 @@ import numpy as np
 class FixedBond:
     """Vanilla non-callable fixed rate bonds."""
 
+    __slots__ = ("face", "coupon", "maturity", "freq")
+
     def __init__(self, face: float, coupon: float, maturity: float, freq: int = 2):
         self.face = face
         self.coupon = coupon
@@ -34,18 +36,15 @@ class FixedBond:
         return np.exp(-rate * t)
 
     def project_prices(self, ytm: float, years: int) -> np.ndarray:
+        """Price the bond at the start of each of the next `years` years, counting only flows still outstanding."""
         flows = self.cashflows()
-        prices = np.zeros(years)
         times = np.array([t for t, _ in flows])
         cfs = np.array([cf for _, cf in flows])
 
-        for t in range(years):
-            mask = times >= t
-            t_adjusted = times[mask] - t
-            discounted = cfs[mask] * np.exp(-ytm * t_adjusted)
-            prices[t] = np.sum(discounted)
-
-        return prices
+        t = np.arange(years)[:, np.newaxis]
+        t_adjusted = times - t
+        discounted = np.where(t_adjusted >= 0, cfs * np.exp(-ytm * t_adjusted), 0.0)
+        return np.sum(discounted, axis=1)
 
     def copy(self) -> Self:
         return FixedBond(face=self.face, coupon=self.coupon, maturity=self.maturity, freq=self.freq)
@@ -0,0 +1,225 @@
+"""
+Benchmarks of the loading, valuation and solver stages on synthetic books of increasing size (see
+`mfi_alm.tape_generator`).
+
+    python -m mfi_alm.bench --sizes small medium --output bench.json
+    python -m mfi_alm.bench --sizes small medium --baseline bench.json
+
+Each stage reports its best time over `--repeat` runs, its throughput in lives or bonds per second, and (unless
+`--no-memory`) the peak memory it traced in a separate run. Compared against a baseline, a stage more than
+`--tolerance` slower, or with that much more peak memory, is flagged and the command exits with status 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from mfi_alm.assets.asset_portfolio_loader import AssetPortfolioLoader
+from mfi_alm.instrumentation import Tracer, configure, get_tracer, set_tracer, span
+from mfi_alm.liabilities.liability_portfolio_loader import load_liability_portfolio
+from mfi_alm.simulation import ScenarioSimulator
+from mfi_alm.tape_generator import generate_tape
+
+# Book sizes: name -> (policyholders, bonds).
+SIZES = {"small": (1_000, 10), "medium": (100_000, 1_000), "large": (1_000_000, 50_000)}
+
+# `FixedBond.project_prices` prices one bond at a time in Python, so it is timed on at most this many bonds.
+BOND_SAMPLE = 1_000
+
+INTEREST = 0.035
+YEARS = 30
+
+
+def measure(stage: Callable[[], Any], repeat: int = 3, memory: bool = True) -> dict[str, float]:
+    """Best wall time of `repeat` calls of `stage` and, with `memory`, the peak memory traced during one more call."""
+    seconds = []
+    for _ in range(repeat):
+        with span("bench_stage") as timed:
+            stage()
+        seconds.append(timed.duration)
+    result = {"seconds": min(seconds)}
+    if memory:
+        tracemalloc.start()
+        try:
+            stage()
+            result["peak_memory_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def benchmark_size(
+    n_policyholders: int, n_bonds: int, work_dir: str, repeat: int = 3, memory: bool = True, seed: int = 0
+) -> dict[str, dict[str, Any]]:
+    """Time every stage on synthetic tapes of the given size, written as CSV to `work_dir`."""
+    liability_path = os.path.join(work_dir, f"policyholders-{n_policyholders}.csv")
+    asset_path = os.path.join(work_dir, f"assets-{n_bonds}.csv")
+    generate_tape(liability_path, kind="policyholders", rows=n_policyholders, seed=seed)
+    generate_tape(asset_path, kind="assets", rows=n_bonds, seed=seed)
+
+    liabilities = load_liability_portfolio(liability_path, mortality_factor=1.0, interest=INTEREST)
+    assets = AssetPortfolioLoader.load_asset_portfolio(asset_path, ytm_factor=1.0)
+    sample = [(view.fixed_bond.copy(), view.ytm) for view in assets.assets[:BOND_SAMPLE]]
+
+    def solve() -> ScenarioSimulator:
+        simulator = ScenarioSimulator(
+            asset_portfolio=assets,
+            liability_portfolio=liabilities,
+            initial_capital=float(liabilities.insurance_apv()),
+            maximum_capital=float(np.sum(liabilities.book.benefits)),
+            years=YEARS,
+            verbose=False,
+        )
+        simulator.run()
+        return simulator
+
+    stages: dict[str, tuple[Callable[[], Any], int, str]] = {
+        "load_liability_portfolio": (
+            lambda: load_liability_portfolio(liability_path, mortality_factor=1.0, interest=INTEREST),
+            n_policyholders,
+            "lives",
+        ),
+        "insurance_apv": (liabilities.insurance_apv, n_policyholders, "lives"),
+        "load_asset_portfolio": (
+            lambda: AssetPortfolioLoader.load_asset_portfolio(asset_path, ytm_factor=1.0),
+            n_bonds,
+            "bonds",
+        ),
+        "fixed_bond_project_prices": (
+            lambda: [bond.project_prices(ytm=ytm, years=YEARS) for bond, ytm in sample],
+            len(sample),
+            "bonds",
+        ),
+        "bond_book_projected_prices": (lambda: assets.book.projected_prices(YEARS), n_bonds, "bonds"),
+        # A fresh book each call, so the cached market value is recomputed.
+        "asset_market_value": (lambda: assets.with_ytm_factor(1.0).market_value(), n_bonds, "bonds"),
+        "scenario_run": (solve, n_policyholders, "lives"),
+    }
+
+    results = {}
+    for name, (stage, items, unit) in stages.items():
+        with span(f"bench {name}", policyholders=n_policyholders, bonds=n_bonds):
+            result = measure(stage, repeat=repeat, memory=memory)
+        results[name] = {**result, "items": items, "unit": unit, "throughput": items / max(result["seconds"], 1e-12)}
+
+    # Solver iterations of one run, read off the tracer's counters.
+    previous = set_tracer(Tracer())
+    try:
+        solve()
+        results["scenario_run"]["iterations"] = int(get_tracer().counters["iterations"])
+    finally:
+        set_tracer(previous)
+    return results
+
+
+def run_benchmarks(
+    sizes: dict[str, tuple[int, int]], repeat: int = 3, memory: bool = True, seed: int = 0
+) -> dict[str, Any]:
+    """Benchmark every size in `sizes` (name -> (policyholders, bonds)); the result is JSON-serialisable."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="mfi-alm-bench-") as work_dir:
+        for name, (n_policyholders, n_bonds) in sizes.items():
+            with span(f"bench size {name}", policyholders=n_policyholders, bonds=n_bonds):
+                results[name] = benchmark_size(
+                    n_policyholders, n_bonds, work_dir=work_dir, repeat=repeat, memory=memory, seed=seed
+                )
+    return {
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()},
+        "repeat": repeat,
+        "sizes": {name: {"policyholders": lives, "bonds": bonds} for name, (lives, bonds) in sizes.items()},
+        "results": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.25, min_seconds: float = 0.002
+) -> list[str]:
+    """
+    Regressions of `results` against `baseline`: stages present in both whose time or peak memory exceeds the
+    baseline's by more than `tolerance` (a fraction). A stage's time must also exceed the baseline's by more than
+    `min_seconds`, so that timer noise on stages taking a few milliseconds is not reported as a regression.
+    """
+    regressions = []
+    for size, stages in results["results"].items():
+        for stage, result in stages.items():
+            base = baseline.get("results", {}).get(size, {}).get(stage)
+            if base is None:
+                continue
+            for metric, floor in (("seconds", min_seconds), ("peak_memory_mb", 0.0)):
+                if metric not in result or metric not in base:
+                    continue
+                if result[metric] > base[metric] * (1 + tolerance) and result[metric] - base[metric] > floor:
+                    change = f" ({result[metric] / base[metric] - 1:+.0%})" if base[metric] > 0 else ""
+                    regressions.append(
+                        f"{size}/{stage}: {metric} {result[metric]:.4g} vs baseline {base[metric]:.4g}{change}"
+                    )
+    return regressions
+
+
+def format_results(results: dict[str, Any]) -> str:
+    lines = [f"{'size':<8} {'stage':<28} {'seconds':>10} {'throughput':>18} {'peak MB':>9}"]
+    for size, stages in results["results"].items():
+        for stage, result in stages.items():
+            throughput = f"{result['throughput']:,.0f} {result['unit']}/s"
+            peak = f"{result['peak_memory_mb']:.1f}" if "peak_memory_mb" in result else "-"
+            lines.append(f"{size:<8} {stage:<28} {result['seconds']:>10.4f} {throughput:>18} {peak:>9}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the ALM stages on synthetic books.")
+    parser.add_argument(
+        "--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"], help="Book sizes to benchmark."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best is reported.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced run measuring peak memory.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic books.")
+    parser.add_argument("--output", help="Write the results to this JSON file, e.g. to use as a baseline.")
+    parser.add_argument("--baseline", help="Compare against results saved with --output.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Fraction by which a stage may exceed the baseline."
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.002,
+        help="Seconds by which a stage must exceed the baseline before it counts as a regression (default: 0.002).",
+    )
+    parser.add_argument("--trace", help="Record stage spans to this trace file (.json: Chrome trace, else JSON lines).")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    tracer = configure(console_depth=None, trace_path=args.trace)
+    try:
+        results = run_benchmarks(
+            {name: SIZES[name] for name in args.sizes}, repeat=args.repeat, memory=not args.no_memory, seed=args.seed
+        )
+    finally:
+        tracer.close()
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), tolerance=args.tolerance, min_seconds=args.min_seconds)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} of the baseline:")
+            print("\n".join(f"  {regression}" for regression in regressions))
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
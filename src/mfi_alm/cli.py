@@ -0,0 +1,348 @@
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any
+import argparse
+import os
+import json
+import sys
+
+from mfi_alm.assets.asset_portfolio import AssetPortfolio
+from mfi_alm.instrumentation import Tracer, configure, count, set_tracer, span
+from mfi_alm.liabilities.liability_portfolio import LiabilityPortfolio
+from mfi_alm.liabilities.liability_stream import StreamedLiabilityPortfolio
+from mfi_alm.rates import rate_model_from_config, validate_rate_config
+from mfi_alm.reporting import ReportWriter
+from mfi_alm.scenarios import ScenarioPortfolios
+from mfi_alm.simulation import ScenarioSimulator
+from mfi_alm.solvers import warm_bracket, warm_start
+from mfi_alm.utils import get_time
+
+CONFIG_PATH = "data/config.json"
+OUTPUT_DIR = "data/outputs"
+
+
+def ensure_output_dir_exists(output_dir: str = OUTPUT_DIR):
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+
+def step0_load_config(step: int, config_path: str = CONFIG_PATH) -> dict[str, Any]:
+    with span("load_config", step=step, path=config_path), open(config_path) as f:
+        config_data = json.load(f)
+    return config_data
+
+
+def step1_load_asset_and_liability_tapes(
+    paths: tuple[str, str],
+    scenarios: list[dict[str, float]],
+    liability_interest: float,
+    step: int,
+    model_points: dict[str, float] | None = None,
+    liability_chunk_size: int | None = None,
+    cache_dir: str | None = None,
+) -> ScenarioPortfolios:
+    with span("load_tapes", step=step):
+        portfolios = ScenarioPortfolios.load(
+            asset_path=paths[0],
+            liability_path=paths[1],
+            liability_interest=liability_interest,
+            model_points=model_points,
+            liability_chunk_size=liability_chunk_size,
+            mortality_factors=[scenario["mortality_factor"] for scenario in scenarios],
+            cache_dir=cache_dir,
+        )
+    if portfolios.model_points is not None:
+        mp = portfolios.model_points
+        print(
+            f"Compressed {mp.count.sum():,} policyholders into {len(mp):,} model points "
+            f"(mu error bound {mp.mu_error_bound:.2e})."
+        )
+    return portfolios
+
+
+def step2_derive_scenario(
+    portfolios: ScenarioPortfolios, scenario_data: dict[str, float], step: int
+) -> tuple[AssetPortfolio, LiabilityPortfolio | StreamedLiabilityPortfolio]:
+    with span("derive_scenario", step=step, scenario=scenario_data["name"]):
+        asset_portfolio, liability_portfolio = portfolios.scenario(
+            ytm_factor=scenario_data["ytm_factor"], mortality_factor=scenario_data["mortality_factor"]
+        )
+    return asset_portfolio, liability_portfolio
+
+
+_worker_portfolios: ScenarioPortfolios | None = None
+
+
+def _init_worker(portfolios: ScenarioPortfolios) -> None:
+    global _worker_portfolios
+    _worker_portfolios = portfolios
+    # Workers report through the parent; a tracer inherited on fork would print and write traces of its own.
+    set_tracer(Tracer())
+
+
+def run_stochastic_paths(
+    scenario_simulator: ScenarioSimulator, paths_config: dict[str, Any], verbose: bool = True
+) -> None:
+    """
+    Project the reserves at the solved capital over the simulated paths configured in `paths_config`: its
+    `mortality_paths` block simulates deaths, its `rate_paths` block simulates short rates (starting, unless set,
+    from the scenario's average asset yield). Every scenario uses the same seeds, so scenarios are compared on
+    common random numbers.
+    """
+    mortality_paths = paths_config.get("mortality_paths")
+    if mortality_paths is not None:
+        liability_portfolio = scenario_simulator.liability_portfolio
+        if isinstance(liability_portfolio, LiabilityPortfolio) and liability_portfolio.model_points is None:
+            scenario_simulator.simulate_mortality_paths(
+                n_paths=mortality_paths["paths"], seed=mortality_paths.get("seed")
+            )
+        elif verbose:
+            print("Skipping mortality paths: they need the full policyholder book (no streaming or model points).")
+
+    rate_paths = paths_config.get("rate_paths")
+    if rate_paths is not None:
+        model = rate_model_from_config(
+            rate_paths, initial_rate=scenario_simulator.asset_portfolio.average_yield(), years=scenario_simulator.years
+        )
+        yield_paths = model.simulate(
+            n_paths=rate_paths["paths"], years=scenario_simulator.years, seed=rate_paths.get("seed")
+        )
+        scenario_simulator.simulate_rate_paths(yield_paths)
+
+    if verbose:
+        print_stochastic_paths(scenario_simulator)
+
+
+def print_stochastic_paths(scenario_simulator: ScenarioSimulator) -> None:
+    for label, summary in (("Mortality", scenario_simulator.mortality_paths), ("Rate", scenario_simulator.rate_paths)):
+        if summary is not None:
+            print(
+                f"{label} paths: P(final reserve < 0) = {summary['prob_negative'][-1]:.2%}, "
+                f"5%-95% final reserve = ${summary['q05'][-1]:,.2f} to ${summary['q95'][-1]:,.2f}"
+            )
+
+
+def simulate_scenario(
+    portfolios: ScenarioPortfolios,
+    scenario_data: dict[str, Any],
+    settings: dict[str, Any],
+    paths_config: dict[str, Any],
+    verbose: bool = True,
+) -> tuple[ScenarioSimulator, dict[str, Any]]:
+    with span("simulate_scenario", scenario=scenario_data["name"]) as scenario_span:
+        asset_portfolio, liability_portfolio = portfolios.scenario(
+            ytm_factor=scenario_data["ytm_factor"], mortality_factor=scenario_data["mortality_factor"]
+        )
+        scenario_simulator = ScenarioSimulator(
+            asset_portfolio=asset_portfolio, liability_portfolio=liability_portfolio, verbose=verbose, **settings
+        )
+        scenario_simulator.run()
+        run_stochastic_paths(scenario_simulator, paths_config, verbose=verbose)
+    timing = {"worker": os.getpid(), "elapsed": scenario_span.duration}
+    return scenario_simulator, timing
+
+
+def _simulate_in_worker(
+    scenario_data: dict[str, Any], settings: dict[str, Any], paths_config: dict[str, Any]
+) -> tuple[ScenarioSimulator, dict]:
+    scenario_simulator, timing = simulate_scenario(
+        _worker_portfolios, scenario_data, settings, paths_config=paths_config, verbose=False
+    )
+    # Only the results travel back to the parent; the scenario books stay in the worker.
+    scenario_simulator.asset_portfolio = None
+    scenario_simulator.liability_portfolio = None
+    return scenario_simulator, timing
+
+
+def step3_run_scenarios_in_parallel(
+    portfolios: ScenarioPortfolios,
+    scenarios: list[dict[str, Any]],
+    settings: dict[str, Any],
+    workers: int,
+    step: int,
+    paths_config: dict[str, Any] | None = None,
+    report_config: dict[str, Any] | None = None,
+    output_dir: str = OUTPUT_DIR,
+    verbose: bool = True,
+) -> None:
+    """
+    Simulate the scenarios on a pool of `workers` processes. Each worker receives the base portfolios once and
+    derives its scenarios from them; reports are written by this process in the configured scenario order, so the
+    output matches a serial run. Each worker's busy time is recorded on the step's span (and the
+    `worker_busy_seconds` counter), since workers do not report spans of their own.
+    """
+    report_config = report_config or {}
+    worker_busy = {}
+    with (
+        span("run_scenarios", step=step, scenarios=len(scenarios), workers=workers) as step_span,
+        ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(portfolios,)) as executor,
+        ReportWriter(background=report_config.get("background", False)) as report_writer,
+    ):
+        futures = [
+            executor.submit(_simulate_in_worker, scenario, settings, paths_config or {}) for scenario in scenarios
+        ]
+        for scenario, future in zip(scenarios, futures):
+            scenario_simulator, timing = future.result()
+            print(
+                f"Final capital required for scenario '{scenario['name']}': ${scenario_simulator.final_capital:,.2f} "
+                f"({len(scenario_simulator.iteration_info)} iterations)"
+            )
+            if verbose:
+                print_stochastic_paths(scenario_simulator)
+            write_report(report_writer, scenario_simulator, scenario["name"], report_config, output_dir=output_dir)
+            busy = worker_busy.setdefault(timing["worker"], {"scenarios": 0, "busy_seconds": 0.0})
+            busy["scenarios"] += 1
+            busy["busy_seconds"] += timing["elapsed"]
+            count("worker_busy_seconds", timing["elapsed"])
+        step_span.attrs["worker_busy"] = {str(pid): busy for pid, busy in sorted(worker_busy.items())}
+
+    if verbose:
+        for n, (pid, busy) in enumerate(sorted(worker_busy.items()), start=1):
+            t, units = get_time(busy["busy_seconds"], dp=2)
+            print(f"  Worker {n} (pid {pid}): {busy['scenarios']} scenarios, busy {t} {units}")
+
+
+def write_report(
+    report_writer: ReportWriter,
+    scenario_simulator: ScenarioSimulator,
+    scenario_name: str,
+    report_config: dict,
+    output_dir: str = OUTPUT_DIR,
+) -> None:
+    report_writer.submit(
+        scenario_simulator.output_report,
+        scenario_name=scenario_name,
+        output_dir=output_dir,
+        report_format=report_config.get("format", "csv"),
+        compress=report_config.get("compress", False),
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="mfi-alm", description="Find the capital required under each configured scenario."
+    )
+    parser.add_argument("--config", default=CONFIG_PATH, help=f"Scenario configuration (default: {CONFIG_PATH}).")
+    parser.add_argument(
+        "--output-dir", default=OUTPUT_DIR, help=f"Directory the reports are written to (default: {OUTPUT_DIR})."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of processes to run scenarios on (default: 1, serial)."
+    )
+    parser.add_argument("--quiet", action="store_true", help="Do not print stage timings or solver iterations.")
+    parser.add_argument(
+        "--trace",
+        default=None,
+        help="Record stage timings and counters to this file: JSON lines, or a Chrome trace for a .json path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the `mfi-alm` command (and of `run.py`)."""
+    print("*" * 100)
+    print("Starting programme.")
+    tic_overall = perf_counter()
+    args = parse_args(argv)
+    tracer = configure(console_depth=0, trace_path=args.trace, quiet=args.quiet)
+
+    config_data = step0_load_config(step=0, config_path=args.config)
+    if "rate_paths" in config_data:
+        validate_rate_config(config_data["rate_paths"])
+    ensure_output_dir_exists(args.output_dir)
+    paths = (config_data["asset_path"], config_data["liability_path"])
+    max_years = config_data.get("projection_horizon", 30)
+    max_iterations = config_data.get("max_iterations", 30)
+
+    portfolios = step1_load_asset_and_liability_tapes(
+        paths=paths,
+        scenarios=config_data["scenarios"],
+        liability_interest=config_data["liability_interest"],
+        step=1,
+        model_points=config_data.get("model_points"),
+        liability_chunk_size=config_data.get("liability_chunk_size"),
+        cache_dir=config_data.get("tape_cache_dir"),
+    )
+
+    solver_config = config_data.get("solver", {})
+    warm_start_solver = solver_config.get("warm_start", False)
+    settings = {
+        "initial_capital": config_data["initial_capital"],
+        "minimum_capital": config_data.get("minimum_capital", 0.0),
+        "maximum_capital": config_data["maximum_capital"],
+        "years": max_years,
+        "max_iterations": max_iterations,
+        "solver": solver_config.get("method", "bisection"),
+        "mode": config_data.get("projection_mode", "yield"),
+    }
+
+    paths_config = {key: config_data[key] for key in ("mortality_paths", "rate_paths") if key in config_data}
+    report_config = config_data.get("report", {})
+
+    if args.workers > 1:
+        if warm_start_solver:
+            print("Solver warm start is ignored with --workers > 1, so that results do not depend on scheduling.")
+        step3_run_scenarios_in_parallel(
+            portfolios=portfolios,
+            scenarios=config_data["scenarios"],
+            settings=settings,
+            workers=args.workers,
+            step=3,
+            paths_config=paths_config,
+            report_config=report_config,
+            output_dir=args.output_dir,
+            verbose=not args.quiet,
+        )
+    else:
+        previous_capital = None
+        with ReportWriter(background=report_config.get("background", False)) as report_writer:
+            for scenario in config_data["scenarios"]:
+                print(f"\nProcessing scenario: {scenario['name']}")
+
+                with span("scenario", scenario=scenario["name"]):
+                    asset_portfolio, liability_portfolio = step2_derive_scenario(
+                        portfolios=portfolios, scenario_data=scenario, step=2
+                    )
+
+                    print("Asset and liabilities loaded. Starting simulation.")
+                    scenario_settings = settings
+                    if warm_start_solver:
+                        limits = {"lower": settings["minimum_capital"], "upper": settings["maximum_capital"]}
+                        scenario_settings = {
+                            **settings,
+                            "initial_capital": warm_start(
+                                **limits, initial=settings["initial_capital"], previous_capital=previous_capital
+                            ),
+                            "capital_bracket": warm_bracket(
+                                **limits,
+                                previous_capital=previous_capital,
+                                width=solver_config.get("warm_start_width", 0.1),
+                            ),
+                        }
+                    scenario_simulator = ScenarioSimulator(
+                        asset_portfolio=asset_portfolio,
+                        liability_portfolio=liability_portfolio,
+                        verbose=not args.quiet,
+                        **scenario_settings,
+                    )
+                    scenario_simulator.run()
+                    if scenario_simulator.converged:
+                        previous_capital = scenario_simulator.final_capital
+                    final_capital = scenario_simulator.final_capital
+                    print(f"Final capital required for scenario '{scenario['name']}': ${final_capital:,.2f}")
+                    run_stochastic_paths(scenario_simulator, paths_config, verbose=not args.quiet)
+                    write_report(
+                        report_writer, scenario_simulator, scenario["name"], report_config, output_dir=args.output_dir
+                    )
+
+    toc_overall = perf_counter()
+    t, units = get_time(toc_overall - tic_overall, dp=2)
+    tracer.close()
+    print(f"\nTime taken (overall) = {t} {units}.")
+    print("Ending programme.")
+    print("*" * 100)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
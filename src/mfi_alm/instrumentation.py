@@ -0,0 +1,233 @@
+import functools
+import json
+import os
+import threading
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Callable, Self
+
+from mfi_alm.utils import get_time
+
+
+class Span:
+    """A timed stage of the pipeline; use it as a context manager. Spans opened inside it are its children."""
+
+    __slots__ = ("tracer", "name", "attrs", "start", "duration", "depth")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = None
+        self.duration = None
+        self.depth = 0
+
+    def __enter__(self) -> Self:
+        self.depth = self.tracer._enter()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.duration = perf_counter() - self.start
+        self.tracer._exit(self)
+
+
+class Sink:
+    """Receives finished spans and counter updates from a `Tracer`."""
+
+    def on_span(self, span: Span) -> None:
+        pass
+
+    def on_count(self, name: str, value: float, total: float) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class ConsoleSink(Sink):
+    """Prints `<name> took <t> <units>` for every span nested at most `max_depth` deep, indented by depth."""
+
+    def __init__(self, max_depth: int = 0, dp: int = 2):
+        self.max_depth = max_depth
+        self.dp = dp
+
+    def on_span(self, span: Span) -> None:
+        if span.depth <= self.max_depth:
+            t, units = get_time(span.duration, dp=self.dp)
+            print(f"{'  ' * span.depth}{span.name} took {t} {units}")
+
+
+class JsonLinesSink(Sink):
+    """Writes one JSON object per finished span or counter update to `path` (replacing it), flushed as it goes."""
+
+    def __init__(self, path: str, origin: float | None = None):
+        self.file = open(path, "w")
+        self.origin = perf_counter() if origin is None else origin
+
+    def _write(self, record: dict[str, Any]) -> None:
+        self.file.write(json.dumps(record, default=str) + "\n")
+        self.file.flush()
+
+    def on_span(self, span: Span) -> None:
+        self._write(
+            {
+                "type": "span",
+                "name": span.name,
+                "start": span.start - self.origin,
+                "duration": span.duration,
+                "depth": span.depth,
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+                **({"attrs": span.attrs} if span.attrs else {}),
+            }
+        )
+
+    def on_count(self, name: str, value: float, total: float) -> None:
+        self._write({"type": "count", "name": name, "value": value, "total": total, "pid": os.getpid()})
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ChromeTraceSink(Sink):
+    """
+    Collects spans as complete ("X") events and counters as counter ("C") events, and writes them to `path` in the
+    Chrome trace event format on `close()`, for chrome://tracing or Perfetto.
+    """
+
+    def __init__(self, path: str, origin: float | None = None):
+        self.path = path
+        self.origin = perf_counter() if origin is None else origin
+        self.events = []
+
+    def _timestamp(self, t: float) -> float:
+        return (t - self.origin) * 1e6
+
+    def on_span(self, span: Span) -> None:
+        self.events.append(
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": self._timestamp(span.start),
+                "dur": span.duration * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": span.attrs,
+            }
+        )
+
+    def on_count(self, name: str, value: float, total: float) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": self._timestamp(perf_counter()),
+                "pid": os.getpid(),
+                "args": {name: total},
+            }
+        )
+
+    def close(self) -> None:
+        with open(self.path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, default=str)
+
+
+class Tracer:
+    """
+    Records nested timing spans and running counters and forwards them to its sinks. Spans always measure their
+    duration (it is read back by callers such as `ScenarioSimulator.run`), so a tracer without sinks costs about a
+    microsecond per span; with `quiet`, console sinks are dropped while file sinks keep recording.
+    """
+
+    def __init__(self, sinks: list[Sink] | None = None, quiet: bool = False):
+        sinks = sinks or []
+        self.sinks = [sink for sink in sinks if not (quiet and isinstance(sink, ConsoleSink))]
+        self.quiet = quiet
+        self.counters = defaultdict(float)
+        self._local = threading.local()
+
+    def span(self, name: str, **attrs: Any) -> Span:
+        return Span(self, name, attrs)
+
+    def count(self, name: str, value: float = 1) -> None:
+        self.counters[name] += value
+        for sink in self.sinks:
+            sink.on_count(name, value, self.counters[name])
+
+    def _enter(self) -> int:
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _exit(self, span: Span) -> None:
+        self._local.depth = span.depth
+        for sink in self.sinks:
+            sink.on_span(span)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Install `tracer` for the process and return the one it replaces."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def configure(
+    console_depth: int | None = 0, trace_path: str | None = None, trace_format: str | None = None, quiet: bool = False
+) -> Tracer:
+    """
+    Install a tracer printing spans up to `console_depth` deep (None for no console output) and, with `trace_path`,
+    recording them to a trace file: JSON lines, or with `trace_format="chrome"` (the default for `.json` paths) a
+    Chrome trace.
+    """
+    origin = perf_counter()
+    sinks = [] if console_depth is None else [ConsoleSink(max_depth=console_depth)]
+    if trace_path is not None:
+        trace_format = trace_format or ("chrome" if trace_path.endswith(".json") else "jsonl")
+        if trace_format == "chrome":
+            sinks.append(ChromeTraceSink(trace_path, origin=origin))
+        elif trace_format == "jsonl":
+            sinks.append(JsonLinesSink(trace_path, origin=origin))
+        else:
+            raise ValueError(f"Unknown trace format '{trace_format}'; expected 'jsonl' or 'chrome'.")
+    tracer = Tracer(sinks=sinks, quiet=quiet)
+    set_tracer(tracer)
+    return tracer
+
+
+def span(name: str, **attrs: Any) -> Span:
+    """A span on the process tracer, e.g. `with span("load_asset_portfolio", path=path): ...`."""
+    return _tracer.span(name, **attrs)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add `value` to the counter `name` on the process tracer."""
+    _tracer.count(name, value)
+
+
+def traced(name: str | None = None) -> Callable[[Callable], Callable]:
+    """Decorator running every call of the function in a span named `name` (by default the function's name)."""
+
+    def decorate(function: Callable) -> Callable:
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _tracer.span(span_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -1,14 +1,34 @@
+from .apv import whole_life_apv_batch
 from .insurance import WholeLifeInsurance
 from .liability_portfolio import LiabilityPortfolio
 from .liability_portfolio_loader import load_liability_portfolio
-from .mortality import MortalityModel
+from .liability_stream import StreamedLiabilityPortfolio, stream_liability_portfolio, stream_liability_scenarios
+from .model_points import ModelPoints, compress_model_points
+from .mortality import ConstantForceMortalityModel, MortalityModel
+from .mortality_registry import ConstantForceTables, MortalityTableRegistry, mortality_tables
+from .policy_book import PolicyBook
 from .policyholder import Policyholder
+from .policyholder_view import PolicyholderView
+from .stochastic_mortality import simulate_benefit_paths
 
 
 __all__ = [
+    "ConstantForceMortalityModel",
+    "ConstantForceTables",
     "WholeLifeInsurance",
     "LiabilityPortfolio",
     "load_liability_portfolio",
+    "StreamedLiabilityPortfolio",
+    "stream_liability_portfolio",
+    "stream_liability_scenarios",
+    "ModelPoints",
+    "compress_model_points",
     "MortalityModel",
+    "MortalityTableRegistry",
+    "mortality_tables",
+    "PolicyBook",
     "Policyholder",
+    "PolicyholderView",
+    "simulate_benefit_paths",
+    "whole_life_apv_batch",
 ]
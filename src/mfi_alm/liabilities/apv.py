@@ -0,0 +1,50 @@
+from typing import Sequence
+
+import numpy as np
+
+from mfi_alm.instrumentation import traced
+from mfi_alm.liabilities.mortality import MortalityModel, constant_force_whole_life_apv
+from mfi_alm.liabilities.mortality_registry import split_by_table
+
+
+@traced()
+def whole_life_apv_batch(
+    ages: np.ndarray,
+    benefits: np.ndarray,
+    table_ids: np.ndarray,
+    tables: Sequence[MortalityModel],
+    interest: float | np.ndarray,
+    max_age: int = 120,
+    chunk_size: int = 50_000,
+) -> np.ndarray:
+    """
+    APV of the whole-life benefit of every policy, where policy `i` is aged `ages[i]` and uses the mortality table
+    `tables[table_ids[i]]`.
+
+    Returns one APV per policy for a scalar `interest`, or a (rates x policies) array for a vector of rates.
+    Constant-force tables are valued in closed form for all policies at once; other tables are valued per table in
+    chunks of at most `chunk_size` policies.
+    """
+    ages = np.asarray(ages, dtype=np.float64)
+    benefits = np.asarray(benefits, dtype=np.float64)
+    table_ids = np.asarray(table_ids, dtype=np.int64)
+    rates = np.atleast_1d(np.asarray(interest, dtype=np.float64))
+    apvs = np.zeros((len(rates), len(ages)))
+
+    closed_form, mus, table_max_ages, chunks = split_by_table(ages, table_ids, tables, chunk_size=chunk_size)
+    if np.any(closed_form):
+        apvs[:, closed_form] = constant_force_whole_life_apv(
+            x=ages[closed_form],
+            mu=mus,
+            interest=rates[:, np.newaxis],
+            max_age=max_age,
+            table_max_age=table_max_ages,
+        )
+
+    # Remaining policies: per table, take P(K_x = k) against the discount curve of every rate.
+    discount = (1 / (1 + rates))[:, np.newaxis] ** np.arange(1, max_age + 1)
+    for table, idx in chunks:
+        apvs[:, idx] = discount @ table.prob_Kx_vector(x=ages[idx], years=max_age).T
+
+    apvs *= benefits
+    return apvs if np.ndim(interest) > 0 else apvs[0]
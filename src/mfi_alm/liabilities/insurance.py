@@ -4,6 +4,8 @@ from mfi_alm.liabilities.mortality import MortalityModel
 
 
 class WholeLifeInsurance:
+    __slots__ = ("mortality_model", "benefit")
+
     def __init__(self, mortality_model: MortalityModel, benefit: float | None = 1.0) -> None:
         self.mortality_model = mortality_model.copy()
         self.benefit = benefit
@@ -15,5 +17,4 @@ class WholeLifeInsurance:
         """
         Compute actuarial present value of a whole life insurance benefit payable at end of year of death.
         """
-        v = 1 / (1 + interest)
-        return self.benefit * sum(v ** (k + 1) * self.mortality_model.prob_Kx_equals_k(k, x) for k in range(max_age))
+        return self.benefit * float(self.mortality_model.whole_life_apv(x=x, interest=interest, max_age=max_age))
@@ -1,35 +1,112 @@
+import copy
 from typing import Self
 
 import numpy as np
 
+from mfi_alm.instrumentation import span
+from mfi_alm.liabilities.model_points import ModelPoints
+from mfi_alm.liabilities.policy_book import PolicyBook
 from mfi_alm.liabilities.policyholder import Policyholder
+from mfi_alm.liabilities.policyholder_view import PolicyholderView
+from mfi_alm.utils import read_only
 
 
 class LiabilityPortfolio:
-    def __init__(self, policyholders: list[Policyholder], interest: float):
-        self.policyholders = [p.copy() for p in policyholders]
+    """
+    Portfolio of whole-life policies backed by a columnar `PolicyBook`.
+
+    `policyholders` is kept for compatibility and lists read-only `PolicyholderView` records indexing into the book;
+    all valuations run on the book itself. `benefits_lookup` is read-only, so copies share it along with the book.
+    """
+
+    def __init__(
+        self,
+        policyholders: list[Policyholder] | None,
+        interest: float,
+        model_points: ModelPoints | None = None,
+        book: PolicyBook | None = None,
+    ):
+        if book is None:
+            book = PolicyBook.from_policyholders(policyholders or [])
+        self.book = book
         self.interest = interest
+        self.model_points = model_points
+        self._policyholders = None
         self.benefits_lookup = self.__get_benefits_lookup()
 
+    @property
+    def policyholders(self) -> list[PolicyholderView]:
+        if self._policyholders is None:
+            self._policyholders = [PolicyholderView(self.book, i) for i in range(len(self.book))]
+        return self._policyholders
+
     def __get_benefits_lookup(self) -> np.ndarray:
-        common_horizon = np.max([p.mortality_model.max_age for p in self.policyholders])
-        benefits_horizon_matrix = np.array(
-            [p.benefit * p.mortality_model.tqx_vector(x=p.age, years=common_horizon) for p in self.policyholders]
-        )
-        return np.sum(benefits_horizon_matrix, axis=0)
+        with span("benefits_lookup", policies=len(self.book)):
+            return read_only(self.book.expected_benefits(years=self.book.common_horizon()))
+
+    def policy_apvs(self, interest: float | np.ndarray | None = None) -> np.ndarray:
+        """APV of every policy, or a (rates x policies) array when `interest` is a vector of rates."""
+        return self.book.apvs(interest=self.interest if interest is None else interest)
 
-    def insurance_apv(self) -> float:
-        return np.sum([p.insurance_apv(interest=self.interest) for p in self.policyholders])
+    def insurance_apv(self, interest: float | np.ndarray | None = None) -> float | np.ndarray:
+        """Total APV of the portfolio, or the APV curve when `interest` is a vector of rates."""
+        return np.sum(self.policy_apvs(interest=interest), axis=-1)
 
     def expected_yearly_benefit(self) -> float:
-        return np.sum([p.benefit * p.mortality_model.tqx(t=1, x=p.age) for p in self.policyholders])
+        return self.book.expected_benefits(years=1)[0]
+
+    def simulate_benefit_paths(
+        self, n_paths: int, years: int, seed: int | np.random.SeedSequence | None = None
+    ) -> np.ndarray:
+        """
+        Benefits paid per year on `n_paths` simulated mortality paths (paths x years). A model point stands for many
+        lives that would die independently, so compressed portfolios cannot be simulated this way.
+        """
+        if self.model_points is not None:
+            raise ValueError("Mortality paths need the uncompressed policyholder tape, not model points.")
+        return self.book.simulate_benefit_paths(n_paths=n_paths, years=years, seed=seed)
+
+    def roll_forward(self, years: int, drop_run_off: bool = True) -> None:
+        """
+        Age every policy by `years` years, dropping the lives that have run off unless `drop_run_off` is False.
+
+        `benefits_lookup` is updated rather than rebuilt: year t of the aged book is year t + `years` of the current
+        one, so the curve is shifted and only its last `years` entries are evaluated. A run-off life pays its full
+        benefit in every year of the curve, so dropping it just takes its benefit off the shifted part.
+        """
+        benefits = self.book.benefits
+        dropped = self.book.roll_forward(years, drop_run_off=drop_run_off)
+        self._policyholders = None
+
+        horizon = len(self.benefits_lookup)
+        shift = min(years, horizon)
+        lookup = np.empty(horizon)
+        lookup[: horizon - shift] = self.benefits_lookup[shift:] - np.sum(benefits[dropped])
+        lookup[horizon - shift :] = self.book.expected_benefits(years=shift, start=horizon - shift)
+        self.benefits_lookup = read_only(lookup)
 
     def age_one_year(self) -> None:
-        for p in self.policyholders:
-            p.age += 1
+        self.roll_forward(1, drop_run_off=False)
+
+    def with_mortality_factor(self, factor: float) -> Self:
+        """The portfolio under mortality scaled by `factor`, sharing this portfolio's policy columns."""
+        return LiabilityPortfolio(
+            policyholders=None,
+            interest=self.interest,
+            model_points=self.model_points,
+            book=self.book.with_mortality_factor(factor),
+        )
 
     def copy(self) -> Self:
-        return LiabilityPortfolio(policyholders=[p for p in self.policyholders], interest=self.interest)
+        """A copy sharing the book and `benefits_lookup`, without re-deriving the lookup."""
+        portfolio = copy.copy(self)
+        portfolio.book = self.book.copy()
+        portfolio._policyholders = None
+        return portfolio
 
     def projected_expected_yearly_benefits(self, years: int) -> np.ndarray:
-        return self.benefits_lookup[:years]
+        """Expected benefits of the next `years` years; years past `benefits_lookup` are evaluated on the book."""
+        horizon = len(self.benefits_lookup)
+        if years <= horizon:
+            return self.benefits_lookup[:years]
+        return np.concatenate([self.benefits_lookup, self.book.expected_benefits(years=years - horizon, start=horizon)])
@@ -1,32 +1,133 @@
+from typing import Iterator
+
 import numpy as np
-import pandas as pd
 
-from mfi_alm.liabilities.insurance import WholeLifeInsurance
+from mfi_alm.instrumentation import count, traced
 from mfi_alm.liabilities.mortality import MortalityModel
+from mfi_alm.liabilities.mortality_registry import ConstantForceTables, constant_force_table
 from mfi_alm.liabilities.liability_portfolio import LiabilityPortfolio
-from mfi_alm.liabilities.policyholder import Policyholder
+from mfi_alm.liabilities.model_points import compress_model_points
+from mfi_alm.liabilities.policy_book import PolicyBook
+from mfi_alm.tapes import cached_tape, is_tape, open_tape
+
+POLICYHOLDER_COLUMNS = {"policyholder_id": np.int64, "age": np.float64, "benefit": np.float64, "mu": np.float64}
+TABLE_MAX_AGE = 120
 
 
 def create_mortality_model(mu: float, mortality_factor: float = 1.0) -> MortalityModel:
-    ages = np.arange(0, 121)
-    adjusted_mu = mu * mortality_factor
-    lx = 1000 * np.exp(-adjusted_mu * ages)
-    df = pd.DataFrame({"x": ages, "lx": lx})
-    return MortalityModel(df_mortality=df)
-
-
-def load_liability_portfolio(filepath: str, mortality_factor: float, interest: float) -> LiabilityPortfolio:
-    df = pd.read_csv(filepath)
-    policyholders = []
-    for _, r in df.iterrows():
-        adjusted_mu = r["mu"] * mortality_factor
-        mortality_model = create_mortality_model(adjusted_mu)
-        policyholders.append(
-            Policyholder(
-                id_=r["policyholder_id"],
-                age=r["age"],
-                mortality_model=mortality_model,
-                whole_life_insurance=WholeLifeInsurance(mortality_model=mortality_model, benefit=r["benefit"]),
-            )
+    """Return the shared constant-force table for `(mu, mortality_factor)`, building it on first use."""
+    return constant_force_table(mu=mu, mortality_factor=mortality_factor, max_age=TABLE_MAX_AGE)
+
+
+def read_policyholder_columns(filepath: str, cache_dir: str | None = None) -> dict[str, np.ndarray]:
+    """
+    Read the policyholder tape as typed column arrays. `filepath` is either a CSV or a binary tape (see
+    `mfi_alm.tapes`); with `cache_dir`, a CSV is converted to a binary tape once and reused on later reads.
+    """
+    if is_tape(filepath):
+        columns = open_tape(filepath)
+    elif cache_dir is not None:
+        columns = cached_tape(
+            filepath, read_csv=read_policyholder_csv, cache_dir=cache_dir, dtypes=POLICYHOLDER_COLUMNS
         )
-    return LiabilityPortfolio(policyholders, interest=interest)
+    else:
+        return read_policyholder_csv(filepath)
+    validate_policyholder_columns(columns)
+    return columns
+
+
+def read_policyholder_csv(filepath: str) -> dict[str, np.ndarray]:
+    import pandas as pd
+
+    df = pd.read_csv(filepath, usecols=list(POLICYHOLDER_COLUMNS), dtype=POLICYHOLDER_COLUMNS)
+    columns = {name: df[name].to_numpy() for name in POLICYHOLDER_COLUMNS}
+    validate_policyholder_columns(columns)
+    return columns
+
+
+def iter_policyholder_chunks(filepath: str, chunk_size: int) -> Iterator[dict[str, np.ndarray]]:
+    """Read the policyholder tape `chunk_size` rows at a time, yielding validated column arrays per chunk."""
+    if is_tape(filepath):
+        columns = open_tape(filepath)
+        for start in range(0, len(columns["policyholder_id"]), chunk_size):
+            chunk = {name: columns[name][start : start + chunk_size] for name in POLICYHOLDER_COLUMNS}
+            validate_policyholder_columns(chunk)
+            yield chunk
+        return
+
+    import pandas as pd
+
+    with pd.read_csv(
+        filepath, usecols=list(POLICYHOLDER_COLUMNS), dtype=POLICYHOLDER_COLUMNS, chunksize=chunk_size
+    ) as reader:
+        for df in reader:
+            columns = {name: df[name].to_numpy() for name in POLICYHOLDER_COLUMNS}
+            validate_policyholder_columns(columns)
+            yield columns
+
+
+def validate_policyholder_columns(columns: dict[str, np.ndarray]) -> None:
+    missing = [name for name in POLICYHOLDER_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"Policyholder tape is missing columns {missing}.")
+    for name in ("age", "benefit", "mu"):
+        invalid = ~np.isfinite(columns[name]) | (columns[name] < 0)
+        if np.any(invalid):
+            raise ValueError(
+                f"Policyholder tape column '{name}' must be finite and non-negative "
+                f"({np.count_nonzero(invalid)} invalid rows, first at row {np.argmax(invalid)})."
+            )
+
+
+def build_policy_book(
+    ids: np.ndarray, ages: np.ndarray, benefits: np.ndarray, mus: np.ndarray, mortality_factor: float
+) -> PolicyBook:
+    """Build a policy book from columns, with one constant-force table per distinct `mu`."""
+    distinct_mus, table_ids = np.unique(mus, return_inverse=True)
+    tables = ConstantForceTables(mu=distinct_mus, mortality_factor=mortality_factor, max_age=TABLE_MAX_AGE)
+    return PolicyBook(ids=ids, ages=ages, benefits=benefits, table_ids=table_ids.ravel(), tables=tables)
+
+
+@traced()
+def load_liability_portfolio(
+    filepath: str,
+    mortality_factor: float,
+    interest: float,
+    compress: bool = False,
+    mu_bucket_width: float | None = None,
+    cache_dir: str | None = None,
+) -> LiabilityPortfolio:
+    """
+    Load a policyholder tape (see `read_policyholder_columns`). With `compress` (or a `mu_bucket_width`),
+    policyholders are first collapsed into model points, see `compress_model_points`; the result is kept on the
+    portfolio's `model_points`.
+    """
+    columns = read_policyholder_columns(filepath, cache_dir=cache_dir)
+    count("policyholders", len(columns["policyholder_id"]))
+    if compress or mu_bucket_width is not None:
+        return load_model_point_portfolio(columns, mortality_factor, interest, mu_bucket_width)
+
+    book = build_policy_book(
+        ids=columns["policyholder_id"],
+        ages=columns["age"],
+        benefits=columns["benefit"],
+        mus=columns["mu"],
+        mortality_factor=mortality_factor,
+    )
+    return LiabilityPortfolio(policyholders=None, interest=interest, book=book)
+
+
+def load_model_point_portfolio(
+    columns: dict[str, np.ndarray], mortality_factor: float, interest: float, mu_bucket_width: float | None = None
+) -> LiabilityPortfolio:
+    model_points = compress_model_points(
+        ages=columns["age"], mus=columns["mu"], benefits=columns["benefit"], mu_bucket_width=mu_bucket_width
+    )
+    book = build_policy_book(
+        ids=np.arange(len(model_points)),
+        ages=model_points.age,
+        benefits=model_points.benefit,
+        mus=model_points.mu,
+        mortality_factor=mortality_factor,
+    )
+    return LiabilityPortfolio(policyholders=None, interest=interest, model_points=model_points, book=book)
@@ -0,0 +1,84 @@
+import numpy as np
+
+from mfi_alm.instrumentation import count, traced
+from mfi_alm.liabilities.liability_portfolio_loader import TABLE_MAX_AGE, build_policy_book, iter_policyholder_chunks
+
+
+class StreamedLiabilityPortfolio:
+    """
+    Portfolio-level liability aggregates accumulated from a policyholder tape read in chunks.
+
+    Exposes the aggregate parts of the `LiabilityPortfolio` interface (`projected_expected_yearly_benefits`,
+    `insurance_apv`, `expected_yearly_benefit`) without holding any policyholder in memory. The last year of
+    `benefits_lookup` is one in which every life is past the end of its table and pays its full benefit, so later
+    years repeat it.
+    """
+
+    def __init__(self, benefits_lookup: np.ndarray, total_apv: float, n_policyholders: int, interest: float):
+        self.benefits_lookup = benefits_lookup
+        self.total_apv = total_apv
+        self.n_policyholders = n_policyholders
+        self.interest = interest
+
+    def insurance_apv(self) -> float:
+        return self.total_apv
+
+    def expected_yearly_benefit(self) -> float:
+        return self.benefits_lookup[0]
+
+    def projected_expected_yearly_benefits(self, years: int) -> np.ndarray:
+        if years <= len(self.benefits_lookup):
+            return self.benefits_lookup[:years]
+        return np.pad(self.benefits_lookup, (0, years - len(self.benefits_lookup)), mode="edge")
+
+
+def stream_liability_portfolio(
+    filepath: str, mortality_factor: float, interest: float, chunk_size: int = 100_000
+) -> StreamedLiabilityPortfolio:
+    """
+    Accumulate the expected yearly benefits and total APV of a policyholder tape (CSV or binary tape), reading
+    `chunk_size` rows at a time so that at most one chunk is in memory.
+    """
+    return stream_liability_scenarios(
+        filepath=filepath, mortality_factors=[mortality_factor], interest=interest, chunk_size=chunk_size
+    )[mortality_factor]
+
+
+@traced()
+def stream_liability_scenarios(
+    filepath: str, mortality_factors: list[float], interest: float, chunk_size: int = 100_000
+) -> dict[float, StreamedLiabilityPortfolio]:
+    """
+    As `stream_liability_portfolio`, for several mortality factors in a single pass over the tape: each chunk is
+    parsed once and valued under every factor. Returns the streamed portfolio of each factor.
+    """
+    mortality_factors = list(dict.fromkeys(mortality_factors))
+    # One year past the end of the tables, by which every life pays its full benefit.
+    horizon = TABLE_MAX_AGE + 1
+    benefits_lookups = {factor: np.zeros(horizon) for factor in mortality_factors}
+    total_apvs = dict.fromkeys(mortality_factors, 0.0)
+    n_policyholders = 0
+    for columns in iter_policyholder_chunks(filepath, chunk_size=chunk_size):
+        base = build_policy_book(
+            ids=columns["policyholder_id"],
+            ages=columns["age"],
+            benefits=columns["benefit"],
+            mus=columns["mu"],
+            mortality_factor=1.0,
+        )
+        for factor in mortality_factors:
+            book = base.with_mortality_factor(factor)
+            benefits_lookups[factor] += book.expected_benefits(years=horizon)
+            total_apvs[factor] += np.sum(book.apvs(interest=interest))
+        n_policyholders += len(base)
+        count("policyholders", len(base))
+
+    return {
+        factor: StreamedLiabilityPortfolio(
+            benefits_lookup=benefits_lookups[factor],
+            total_apv=total_apvs[factor],
+            n_policyholders=n_policyholders,
+            interest=interest,
+        )
+        for factor in mortality_factors
+    }
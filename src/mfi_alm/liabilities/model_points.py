@@ -0,0 +1,66 @@
+import numpy as np
+
+
+class ModelPoints:
+    """
+    Compressed policyholder tape: one model point per `(age, mu)` key, carrying the summed benefit and the number of
+    policyholders it stands for.
+
+    `mu_error_bound` is the largest distance between a policyholder's `mu` and the `mu` of its model point (zero for
+    exact compression). Since `d(1 - exp(-f * mu)) / d(mu) <= f`, every one-year death probability of a model point is
+    within `mortality_factor * mu_error_bound` of that of the policyholders it replaces.
+    """
+
+    def __init__(
+        self, age: np.ndarray, mu: np.ndarray, benefit: np.ndarray, count: np.ndarray, mu_error_bound: float = 0.0
+    ):
+        self.age = age
+        self.mu = mu
+        self.benefit = benefit
+        self.count = count
+        self.mu_error_bound = mu_error_bound
+
+    def __len__(self) -> int:
+        return len(self.age)
+
+    def qx_error_bound(self, mortality_factor: float = 1.0) -> float:
+        return mortality_factor * self.mu_error_bound
+
+
+def compress_model_points(
+    ages: np.ndarray, mus: np.ndarray, benefits: np.ndarray, mu_bucket_width: float | None = None
+) -> ModelPoints:
+    """
+    Group policyholders with identical `(age, mu)` and sum their benefits.
+
+    With `mu_bucket_width`, `mu` is first bucketed onto a grid of that width and each model point takes the
+    benefit-weighted mean `mu` of its bucket, which is lossy; the resulting `mu_error_bound` is reported on the
+    returned `ModelPoints`.
+    """
+    ages = np.asarray(ages, dtype=np.float64)
+    mus = np.asarray(mus, dtype=np.float64)
+    benefits = np.asarray(benefits, dtype=np.float64)
+
+    if mu_bucket_width is None:
+        mu_key = mus
+    elif mu_bucket_width > 0:
+        mu_key = np.floor(mus / mu_bucket_width)
+    else:
+        raise ValueError("mu_bucket_width must be positive.")
+
+    keys, inverse = np.unique(np.column_stack([ages, mu_key]), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    n_points = len(keys)
+
+    count = np.bincount(inverse, minlength=n_points)
+    benefit = np.bincount(inverse, weights=benefits, minlength=n_points)
+    if mu_bucket_width is None:
+        mu = keys[:, 1]
+    else:
+        weighted = np.bincount(inverse, weights=benefits * mus, minlength=n_points)
+        unweighted = np.bincount(inverse, weights=mus, minlength=n_points) / count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mu = np.where(benefit > 0, weighted / benefit, unweighted)
+
+    mu_error_bound = float(np.max(np.abs(mus - mu[inverse]), initial=0.0))
+    return ModelPoints(age=keys[:, 0], mu=mu, benefit=benefit, count=count, mu_error_bound=mu_error_bound)
@@ -1,54 +1,221 @@
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
-import pandas as pd
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class MortalityModel:
-    def __init__(self, df_mortality: pd.DataFrame):
+    """
+    Life table mortality model.
+
+    The table is stored as a contiguous `lx` array covering the consecutive integer ages `min_age..max_age`; the
+    `*_vector`/`*_matrix` methods evaluate whole survival curves as array operations and the scalar methods
+    delegate to the same kernel. Tables are immutable (their arrays are read-only and their parameters are
+    read-only properties), so they can be shared freely between policyholders.
+    """
+
+    def __init__(self, df_mortality: "pd.DataFrame"):
         if not {"x", "lx"}.issubset(df_mortality.columns):
             raise ValueError("Mortality table must contain 'x' and 'lx' columns.")
 
-        self.df = df_mortality.set_index("x").copy()
-        self.min_age = self.df.index.min()
-        self.max_age = self.df.index.max()
-        self.qx_lookup = np.array([self.tqx(1, t) for t in range(self.max_age + 1)])
+        df_mortality = df_mortality.sort_values("x")
+        self._set_table(x=df_mortality["x"].to_numpy(), lx=df_mortality["lx"].to_numpy())
+
+    @classmethod
+    def from_lx(cls, lx: np.ndarray, min_age: int = 0) -> Self:
+        """Build a model straight from an `lx` array whose first entry is at age `min_age`."""
+        model = cls.__new__(cls)
+        model._set_table(x=min_age + np.arange(len(lx)), lx=lx)
+        return model
+
+    def _set_table(self, x: np.ndarray, lx: np.ndarray) -> None:
+        if len(x) == 0:
+            raise ValueError("Mortality table must not be empty.")
+        if np.any(np.diff(x) != 1):
+            raise ValueError("Mortality table ages must be consecutive integers.")
+
+        self._lx = np.array(lx, dtype=np.float64)
+        self._lx.flags.writeable = False
+        self._min_age = int(x[0])
+        self._max_age = int(x[-1])
+        self._qx_lookup = self.tqx_vector(x=0, years=self.max_age + 1)
+        self._qx_lookup.flags.writeable = False
+
+    @property
+    def lx(self) -> np.ndarray:
+        return self._lx
+
+    @property
+    def qx_lookup(self) -> np.ndarray:
+        return self._qx_lookup
+
+    @property
+    def min_age(self) -> int:
+        return self._min_age
+
+    @property
+    def max_age(self) -> int:
+        return self._max_age
+
+    @property
+    def df(self) -> "pd.DataFrame":
+        """The table as a DataFrame indexed by age, built on demand."""
+        import pandas as pd
+
+        return pd.DataFrame({"lx": self.lx}, index=pd.Index(np.arange(self.min_age, self.max_age + 1), name="x"))
+
+    def _survival(self, t: float | np.ndarray, x: float | np.ndarray) -> np.ndarray:
+        """Broadcasting kernel for tpx: 1 below the table, 0 past the end of the table, lx[x + t] / lx[x] otherwise."""
+        t, x = np.broadcast_arrays(np.asarray(t), np.asarray(x))
+        end = x + t
+        last = len(self.lx) - 1
+        start_idx = np.clip(x - self.min_age, 0, last).astype(np.int64)
+        end_idx = np.clip(end - self.min_age, 0, last).astype(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self.lx[end_idx] / self.lx[start_idx]
+        return np.where(x < self.min_age, 1.0, np.where(end > self.max_age, 0.0, ratio))
 
     def tpx(self, t: int, x: int) -> float:
-        if x < self.min_age:
-            return 1.0
-        if x + t > self.max_age:
-            return 0.0
-        return self.df.loc[x + t, "lx"] / self.df.loc[x, "lx"]
+        return float(self._survival(t, x))
 
     def tqx(self, t: int, x: int) -> float:
         return 1 - self.tpx(t, x)
 
+    def tpx_vector(self, x: float | np.ndarray, years: int) -> np.ndarray:
+        """Return tpx(t, x) for t = 0 to years-1, with one row per age if `x` is an array."""
+        return self._survival(np.arange(years), np.asarray(x)[..., np.newaxis])
+
+    def tqx_matrix(self, x: float | np.ndarray, years: int) -> np.ndarray:
+        """Return tqx(1, x + t) for t = 0 to years-1, with one row per age if `x` is an array."""
+        ages = np.asarray(x).astype(np.int64)[..., np.newaxis] + np.arange(years)
+        return 1 - self._survival(1, ages)
+
     def tqx_vector(self, x: int, years: int) -> np.ndarray:
         """Return a vector of tqx(1, x + t) for t = 0 to years-1"""
-        if x + years <= self.max_age:
-            return np.array(self.qx_lookup[int(x) : int(x + years)])
+        return self.tqx_matrix(x=x, years=years)
 
-        in_range = self.qx_lookup[int(x) : int(self.max_age)]
-        out_range = np.array([1] * (int(x + years) - self.max_age))
-        return np.concatenate([in_range, out_range])
+    def prob_Kx_vector(self, x: float | np.ndarray, years: int) -> np.ndarray:
+        """Return P(K_x = k) for k = 0 to years-1, with one row per age if `x` is an array."""
+        k = np.arange(years)
+        x = np.asarray(x)[..., np.newaxis]
+        return self._survival(k, x) * (1 - self._survival(1, x + k))
 
     def prob_Kx_equals_k(self, k: int, x: int) -> float:
         return self.tpx(k, x) * self.tqx(1, x + k)
 
+    def whole_life_apv(self, x: float | np.ndarray, interest: float | np.ndarray, max_age: int = 120) -> np.ndarray:
+        """
+        APV of 1 payable at the end of the year of death, summed over the first `max_age` years. Broadcasts over
+        `x` and `interest`.
+        """
+        x, interest = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(interest, dtype=np.float64))
+        discount = (1 / (1 + interest))[..., np.newaxis] ** np.arange(1, max_age + 1)
+        return np.sum(discount * self.prob_Kx_vector(x=x, years=max_age), axis=-1)
+
     def discrete_remaining_mortality_probs(self, x: int, t_horizon: int = 120) -> np.ndarray:
-        return np.array([self.prob_Kx_equals_k(k, x) for k in range(t_horizon + 1)])
+        return self.prob_Kx_vector(x=x, years=t_horizon + 1)
 
-    def simulate_remaining_death_year(self, x: int, seed: int = 42, t_horizon: int = 120) -> int:
+    def simulate_remaining_death_year(
+        self, x: int, seed: int | np.random.Generator | None = None, t_horizon: int = 120
+    ) -> int:
+        """
+        Sample the curtate future lifetime of a life aged `x`. `seed` is a seed or a `Generator` to draw from; by
+        default every call draws fresh randomness. For the benefits of whole portfolios over many paths see
+        `mfi_alm.liabilities.stochastic_mortality`.
+        """
         if x >= self.max_age:
             return 0
 
         probs = self.discrete_remaining_mortality_probs(x, t_horizon)
-        probs /= probs.sum()
         rng = np.random.default_rng(seed)
+        return int(np.searchsorted(np.cumsum(probs), rng.random() * probs.sum(), side="right"))
 
-        return rng.choice(len(probs), p=probs)
+    def scaled(self, factor: float) -> "MortalityModel":
+        """
+        The table with the force of mortality multiplied by `factor` at every age, i.e. every survival probability
+        raised to the power `factor`.
+        """
+        if factor == 1:
+            return self
+        return MortalityModel.from_lx(self.lx[0] * (self.lx / self.lx[0]) ** factor, min_age=self.min_age)
 
     def copy(self) -> Self:
-        df_mortality = self.df.reset_index()[["x", "lx"]].copy()
-        return MortalityModel(df_mortality=df_mortality)
+        """Tables are immutable, so a copy is the table itself."""
+        return self
+
+
+class ConstantForceMortalityModel(MortalityModel):
+    """
+    Mortality under a constant force `mu` up to `max_age`, i.e. the table `lx = radix * exp(-mu * x)`.
+
+    Survival and the whole-life APV are evaluated in closed form, so no table is materialised; `lx`, `qx_lookup`
+    and `df` are still available and are built on demand.
+    """
+
+    def __init__(self, mu: float, max_age: int = 120, radix: float = 1000.0):
+        self._mu = float(mu)
+        self._min_age = 0
+        self._max_age = int(max_age)
+        self._radix = radix
+
+    @property
+    def mu(self) -> float:
+        return self._mu
+
+    @property
+    def radix(self) -> float:
+        return self._radix
+
+    @property
+    def lx(self) -> np.ndarray:
+        return self.radix * np.exp(-self.mu * np.arange(self.min_age, self.max_age + 1))
+
+    @property
+    def qx_lookup(self) -> np.ndarray:
+        return self.tqx_vector(x=0, years=self.max_age + 1)
+
+    def _survival(self, t: float | np.ndarray, x: float | np.ndarray) -> np.ndarray:
+        t, x = np.broadcast_arrays(np.asarray(t), np.asarray(x))
+        return np.where(x < self.min_age, 1.0, np.where(x + t > self.max_age, 0.0, np.exp(-self.mu * t)))
+
+    def scaled(self, factor: float) -> "MortalityModel":
+        return ConstantForceMortalityModel(mu=self.mu * factor, max_age=self.max_age, radix=self.radix)
+
+    def whole_life_apv(self, x: float | np.ndarray, interest: float | np.ndarray, max_age: int = 120) -> np.ndarray:
+        if np.any(np.asarray(x) < self.min_age):
+            return super().whole_life_apv(x=x, interest=interest, max_age=max_age)
+        return constant_force_whole_life_apv(
+            x=x, mu=self.mu, interest=interest, max_age=max_age, table_max_age=self.max_age
+        )
+
+
+def constant_force_whole_life_apv(
+    x: float | np.ndarray,
+    mu: float | np.ndarray,
+    interest: float | np.ndarray,
+    max_age: int = 120,
+    table_max_age: int = 120,
+) -> np.ndarray:
+    """
+    Closed-form whole-life APV under a constant force of mortality, for non-negative ages. Broadcasts over `x`,
+    `mu` and `interest`.
+
+    With `p = exp(-mu)`, death in year `k` has probability `p^k (1 - p)` for the `n = floor(table_max_age - x)`
+    years before the end of the table and `p^n` in year `n`, where death is certain. Only the first `max_age`
+    years are summed, as in `MortalityModel.whole_life_apv`, which gives a truncated geometric series plus the
+    terminal term when it falls inside the summed years.
+    """
+    x, mu, interest = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (x, mu, interest)))
+    p = np.exp(-mu)
+    v = 1 / (1 + interest)
+    vp = v * p
+
+    n = np.floor(table_max_age - x)
+    m = np.minimum(n, max_age)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        series = np.where(vp == 1.0, m, (1 - vp**m) / (1 - vp))
+    terminal = np.where(n < max_age, v ** (n + 1) * p**n, 0.0)
+
+    return np.where(x > table_max_age, 0.0, (1 - p) * v * series + terminal)
@@ -0,0 +1,114 @@
+import weakref
+from collections.abc import Sequence
+from typing import Callable, Hashable
+
+import numpy as np
+
+from mfi_alm.liabilities.mortality import ConstantForceMortalityModel, MortalityModel
+
+
+class MortalityTableRegistry:
+    """
+    Interns immutable mortality tables keyed by the parameters they were built from.
+
+    Every request for the same key returns the same shared, read-only `MortalityModel`, so a portfolio holds one
+    table per distinct set of parameters rather than one per policyholder. Tables are held weakly: one is dropped
+    from the registry once nothing else refers to it, so a long run over many distinct parameters does not keep
+    every table it ever built.
+    """
+
+    def __init__(self):
+        self._tables: weakref.WeakValueDictionary[Hashable, MortalityModel] = weakref.WeakValueDictionary()
+
+    def intern(self, key: Hashable, build: Callable[[], MortalityModel]) -> MortalityModel:
+        """Return the table registered under `key`, calling `build` to create it the first time."""
+        table = self._tables.get(key)
+        if table is None:
+            table = build()
+            self._tables[key] = table
+        return table
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def clear(self) -> None:
+        self._tables.clear()
+
+
+mortality_tables = MortalityTableRegistry()
+
+
+def constant_force_table(mu: float, mortality_factor: float = 1.0, max_age: int = 120) -> MortalityModel:
+    """Return the shared constant-force table with force `mu * mortality_factor`, building it on first use."""
+
+    def build() -> MortalityModel:
+        return ConstantForceMortalityModel(mu=mu * mortality_factor, max_age=max_age)
+
+    return mortality_tables.intern(key=(float(mu), float(mortality_factor), int(max_age)), build=build)
+
+
+class ConstantForceTables(Sequence[MortalityModel]):
+    """
+    Columnar set of constant-force tables: table `i` has force `mu[i] * mortality_factor`.
+
+    Valuation kernels read the columns directly (see `constant_force_parameters`); a `MortalityModel` is only
+    created, and interned, when a table is indexed.
+    """
+
+    def __init__(self, mu: np.ndarray, mortality_factor: float = 1.0, max_age: int = 120):
+        self.mu = np.asarray(mu, dtype=np.float64)
+        self.mortality_factor = mortality_factor
+        self.max_age = max_age
+
+    def __len__(self) -> int:
+        return len(self.mu)
+
+    def __getitem__(self, i: int) -> MortalityModel:
+        return constant_force_table(mu=self.mu[i], mortality_factor=self.mortality_factor, max_age=self.max_age)
+
+    def scaled(self, factor: float) -> "ConstantForceTables":
+        """The same tables with every force further multiplied by `factor`; the `mu` column is shared."""
+        return ConstantForceTables(mu=self.mu, mortality_factor=self.mortality_factor * factor, max_age=self.max_age)
+
+
+def constant_force_parameters(tables: Sequence[MortalityModel]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per table: whether it is a constant-force table, its force (0 otherwise) and its max age. Read straight from the
+    columns of a `ConstantForceTables`, without creating any model.
+    """
+    if isinstance(tables, ConstantForceTables):
+        n = len(tables)
+        return np.ones(n, dtype=bool), tables.mu * tables.mortality_factor, np.full(n, tables.max_age)
+
+    is_constant_force = np.array([isinstance(t, ConstantForceMortalityModel) for t in tables], dtype=bool)
+    mu = np.array([t.mu if c else 0.0 for t, c in zip(tables, is_constant_force)], dtype=np.float64)
+    max_age = np.array([t.max_age for t in tables], dtype=np.int64)
+    return is_constant_force, mu, max_age
+
+
+def split_by_table(
+    ages: np.ndarray, table_ids: np.ndarray, tables: Sequence[MortalityModel], chunk_size: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[tuple[MortalityModel, np.ndarray]]]:
+    """
+    Split policies between the closed-form and per-table kernels of the valuation and simulation code.
+
+    Returns the mask of the policies on a constant-force table at a non-negative age, the force and max age of each
+    of their tables, and the other policies grouped by table: a list of `(table, indices)` in chunks of at most
+    `chunk_size` policies (whole tables by default).
+    """
+    is_constant_force, mus, table_max_ages = constant_force_parameters(tables)
+    closed_form = is_constant_force[table_ids] & (ages >= 0)
+    ids = table_ids[closed_form]
+
+    rest = np.flatnonzero(~closed_form)
+    rest = rest[np.argsort(table_ids[rest], kind="stable")]
+    group_ids, starts = np.unique(table_ids[rest], return_index=True)
+    chunks = []
+    for table_id, start, end in zip(group_ids, starts, np.append(starts[1:], len(rest))):
+        step = chunk_size or end - start
+        for chunk_start in range(start, end, step):
+            chunks.append((tables[table_id], rest[chunk_start : min(chunk_start + step, end)]))
+    return closed_form, mus[ids], table_max_ages[ids], chunks
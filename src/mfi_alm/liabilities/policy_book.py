@@ -0,0 +1,160 @@
+import copy
+from collections.abc import Sequence
+from typing import Self
+
+import numpy as np
+
+from mfi_alm.liabilities.apv import whole_life_apv_batch
+from mfi_alm.liabilities.insurance import WholeLifeInsurance
+from mfi_alm.liabilities.mortality import MortalityModel
+from mfi_alm.liabilities.mortality_registry import ConstantForceTables, constant_force_parameters, split_by_table
+from mfi_alm.liabilities.policyholder import Policyholder
+from mfi_alm.liabilities.stochastic_mortality import simulate_benefit_paths
+from mfi_alm.utils import read_only
+
+
+class PolicyBook:
+    """
+    Struct-of-arrays book of whole-life policies.
+
+    Policy `i` has id `ids[i]`, age `ages[i]`, benefit `benefits[i]` and the (shared) mortality table
+    `tables[table_ids[i]]`.
+
+    Columns are read-only and only ever replaced, never written in place, so copies and scenario views share them.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        ages: np.ndarray,
+        benefits: np.ndarray,
+        table_ids: np.ndarray,
+        tables: Sequence[MortalityModel],
+    ):
+        self.ids = read_only(ids)
+        self.ages = read_only(ages, dtype=np.float64)
+        self.benefits = read_only(benefits, dtype=np.float64)
+        self.table_ids = read_only(table_ids, dtype=np.int64)
+        self.tables = tables
+
+        n = len(self.ids)
+        if any(len(a) != n for a in (self.ages, self.benefits, self.table_ids)):
+            raise ValueError("Policy book columns must all have the same length.")
+
+    @classmethod
+    def from_policyholders(cls, policyholders: list[Policyholder]) -> Self:
+        tables, table_index = [], {}
+        table_ids = np.empty(len(policyholders), dtype=np.int64)
+        for i, p in enumerate(policyholders):
+            table_ids[i] = table_index.setdefault(id(p.mortality_model), len(tables))
+            if table_ids[i] == len(tables):
+                tables.append(p.mortality_model)
+        return cls(
+            ids=np.array([p.id_ for p in policyholders]),
+            ages=np.array([p.age for p in policyholders], dtype=np.float64),
+            benefits=np.array([p.benefit for p in policyholders], dtype=np.float64),
+            table_ids=table_ids,
+            tables=tables,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def policyholder(self, i: int) -> Policyholder:
+        mortality_model = self.tables[self.table_ids[i]]
+        return Policyholder(
+            id_=self.ids[i].item(),
+            age=self.ages[i].item(),
+            mortality_model=mortality_model,
+            whole_life_insurance=WholeLifeInsurance(mortality_model=mortality_model, benefit=self.benefits[i].item()),
+        )
+
+    def common_horizon(self) -> int:
+        return int(np.max(constant_force_parameters(self.tables)[2], initial=0))
+
+    def apvs(self, interest: float | np.ndarray) -> np.ndarray:
+        return whole_life_apv_batch(
+            ages=self.ages, benefits=self.benefits, table_ids=self.table_ids, tables=self.tables, interest=interest
+        )
+
+    def expected_benefits(self, years: int, chunk_size: int = 50_000, start: int = 0) -> np.ndarray:
+        """
+        Sum over policies of `benefit * tqx(1, age + t)` for t = start to start+years-1.
+
+        Under a constant force the one-year death probability of a policy only changes where its age reaches the
+        end of its table, so those policies are accumulated on a difference array in O(policies + years); other
+        tables are evaluated per table in chunks.
+        """
+        ages = self.ages.astype(np.int64) + start
+        totals = np.zeros(years)
+
+        closed_form, mus, table_max_ages, chunks = split_by_table(
+            ages, self.table_ids, self.tables, chunk_size=chunk_size
+        )
+        if np.any(closed_form):
+            benefits = self.benefits[closed_form]
+            switch = np.clip(table_max_ages - ages[closed_form], 0, years)
+            before = benefits * (1 - np.exp(-mus))
+            diff = np.bincount(switch, weights=benefits - before, minlength=years + 1)
+            diff[0] += np.sum(before)
+            totals += np.cumsum(diff)[:years]
+
+        for table, idx in chunks:
+            totals += self.benefits[idx] @ table.tqx_matrix(x=ages[idx], years=years)
+
+        return totals
+
+    def simulate_benefit_paths(
+        self, n_paths: int, years: int, seed: int | np.random.SeedSequence | None = None
+    ) -> np.ndarray:
+        """Benefits paid per year on `n_paths` simulated mortality paths (paths x years)."""
+        return simulate_benefit_paths(
+            ages=self.ages,
+            benefits=self.benefits,
+            table_ids=self.table_ids,
+            tables=self.tables,
+            n_paths=n_paths,
+            years=years,
+            seed=seed,
+        )
+
+    def with_mortality_factor(self, factor: float) -> Self:
+        """
+        The book with every table's force of mortality multiplied by `factor`. Policy columns are shared with this
+        book rather than copied.
+        """
+        if isinstance(self.tables, ConstantForceTables):
+            tables = self.tables.scaled(factor)
+        else:
+            tables = [table.scaled(factor) for table in self.tables]
+        return PolicyBook(ids=self.ids, ages=self.ages, benefits=self.benefits, table_ids=self.table_ids, tables=tables)
+
+    def run_off(self) -> np.ndarray:
+        """
+        Policies past the last age of their table, whose certain death fell in an earlier year. A policy at exactly
+        the last age is still alive and dies this year, so it stays on the book.
+        """
+        table_max_ages = constant_force_parameters(self.tables)[2]
+        return self.ages.astype(np.int64) > table_max_ages[self.table_ids]
+
+    def roll_forward(self, years: int, drop_run_off: bool = True) -> np.ndarray:
+        """
+        Age every policy by `years` years and, with `drop_run_off`, remove the policies that have run off. Returns
+        the mask (over the policies before the roll) of those removed.
+        """
+        self.ages = read_only(self.ages + years)
+        dropped = self.run_off() if drop_run_off else np.zeros(len(self), dtype=bool)
+        if np.any(dropped):
+            kept = ~dropped
+            self.ids = read_only(self.ids[kept])
+            self.ages = read_only(self.ages[kept])
+            self.benefits = read_only(self.benefits[kept])
+            self.table_ids = read_only(self.table_ids[kept])
+        return dropped
+
+    def age_one_year(self) -> None:
+        self.roll_forward(1, drop_run_off=False)
+
+    def copy(self) -> Self:
+        """A copy sharing this book's (read-only) columns and tables; it diverges only once either is mutated."""
+        return copy.copy(self)
@@ -5,6 +5,8 @@ from mfi_alm.liabilities.mortality import MortalityModel
 
 
 class Policyholder:
+    __slots__ = ("id_", "age", "mortality_model", "whole_life_insurance")
+
     def __init__(
         self,
         id_: int,
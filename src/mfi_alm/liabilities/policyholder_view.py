@@ -0,0 +1,49 @@
+from typing import TYPE_CHECKING
+
+from mfi_alm.liabilities.insurance import WholeLifeInsurance
+from mfi_alm.liabilities.mortality import MortalityModel
+from mfi_alm.liabilities.policyholder import Policyholder
+
+if TYPE_CHECKING:
+    from mfi_alm.liabilities.policy_book import PolicyBook
+
+
+class PolicyholderView:
+    """
+    Read-only `Policyholder` interface over row `index` of a `PolicyBook`. The view holds no data of its own, so a
+    portfolio's records cost a few tens of bytes each; age them through the portfolio (`roll_forward`), which also
+    keeps its benefit curve up to date.
+    """
+
+    __slots__ = ("book", "index")
+
+    def __init__(self, book: "PolicyBook", index: int):
+        self.book = book
+        self.index = index
+
+    @property
+    def id_(self) -> int:
+        return self.book.ids[self.index].item()
+
+    @property
+    def age(self) -> float:
+        return self.book.ages[self.index].item()
+
+    @property
+    def benefit(self) -> float:
+        return self.book.benefits[self.index].item()
+
+    @property
+    def mortality_model(self) -> MortalityModel:
+        return self.book.tables[self.book.table_ids[self.index]]
+
+    @property
+    def whole_life_insurance(self) -> WholeLifeInsurance:
+        return WholeLifeInsurance(mortality_model=self.mortality_model, benefit=self.benefit)
+
+    def insurance_apv(self, interest: float) -> float:
+        return self.benefit * float(self.mortality_model.whole_life_apv(x=self.age, interest=interest))
+
+    def copy(self) -> Policyholder:
+        """A standalone `Policyholder` with this row's data."""
+        return self.book.policyholder(self.index)
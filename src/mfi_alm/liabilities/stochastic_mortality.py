@@ -0,0 +1,101 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from mfi_alm.liabilities.mortality import MortalityModel
+from mfi_alm.liabilities.mortality_registry import split_by_table
+
+
+def sample_benefits(
+    rng: np.random.Generator,
+    n_paths: int,
+    ages: np.ndarray,
+    benefits: np.ndarray,
+    table_ids: np.ndarray,
+    tables: Sequence[MortalityModel],
+    years: int,
+) -> np.ndarray:
+    """
+    Benefits paid by the given policies in each of the next `years` years on each of `n_paths` paths (paths x years).
+
+    Before the last age of its table, a policy on a constant-force table pays with the constant probability
+    `1 - exp(-mu)`, so the gaps between the years it pays in are sampled directly, `K = floor(E / mu)` with `E`
+    standard exponential, for as many rounds as some policy still pays within the horizon; from the last age on it
+    pays on every path. Policies on other tables draw one uniform per year against their `tqx_matrix`.
+    """
+    ages = np.asarray(ages).astype(np.int64)
+    totals = np.zeros((n_paths, years))
+
+    closed_form, mus, table_max_ages, chunks = split_by_table(ages, table_ids, tables)
+    if np.any(closed_form):
+        paying = benefits[closed_form]
+        switch = np.clip(table_max_ages - ages[closed_form], 0, years)
+        totals += np.cumsum(np.bincount(switch, weights=paying, minlength=years + 1))[:years]
+
+        policies = np.tile(np.arange(len(paying)), n_paths)
+        cells = np.repeat(np.arange(n_paths) * years, len(paying))
+        t = np.full(len(policies), -1.0)
+        flat = totals.reshape(-1)
+        with np.errstate(divide="ignore"):
+            while len(policies) > 0:
+                t = t + 1 + np.floor(rng.standard_exponential(len(policies)) / mus[policies])
+                pays = t < switch[policies]
+                policies, cells, t = policies[pays], cells[pays], t[pays]
+                flat += np.bincount(cells + t.astype(np.int64), weights=paying[policies], minlength=len(flat))
+
+    for table, idx in chunks:
+        paid = rng.random((n_paths, len(idx), years)) < table.tqx_matrix(x=ages[idx], years=years)
+        totals += np.einsum("pcy,c->py", paid, benefits[idx])
+    return totals
+
+
+def simulate_benefit_paths(
+    ages: np.ndarray,
+    benefits: np.ndarray,
+    table_ids: np.ndarray,
+    tables: Sequence[MortalityModel],
+    n_paths: int,
+    years: int,
+    seed: int | np.random.SeedSequence | None = None,
+    chunk_size: int = 100_000,
+    block_size: int = 4_000_000,
+) -> np.ndarray:
+    """
+    Benefits paid in each of the next `years` years on each of `n_paths` simulated mortality paths (paths x years).
+
+    Paths follow the convention of the expected benefits the capital is solved on (`PolicyBook.expected_benefits`):
+    in year t a policy aged x pays its benefit with probability `q_{x+t}`, independently of other years, so the mean
+    of the paths is the expected benefit curve (see `sample_benefits`).
+
+    Policies are processed `chunk_size` at a time and paths in groups sized so that a block samples about
+    `block_size` (path, policy) pairs, which bounds memory independently of the portfolio and path counts. Each
+    (path group, policy chunk) block draws from its own stream spawned from `seed`, so a run is reproducible for a
+    given seed and chunking.
+    """
+    ages = np.asarray(ages, dtype=np.float64)
+    benefits = np.asarray(benefits, dtype=np.float64)
+    table_ids = np.asarray(table_ids, dtype=np.int64)
+    n_policies = len(ages)
+    chunk_size = max(1, min(chunk_size, n_policies))
+    paths_per_block = max(1, block_size // chunk_size)
+
+    path_starts = range(0, n_paths, paths_per_block)
+    policy_starts = range(0, n_policies, chunk_size)
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    totals = np.zeros((n_paths, years))
+    for path_start, path_seed in zip(path_starts, root.spawn(len(path_starts))):
+        n_block_paths = min(paths_per_block, n_paths - path_start)
+        for policy_start, block_seed in zip(policy_starts, path_seed.spawn(len(policy_starts))):
+            idx = slice(policy_start, policy_start + chunk_size)
+            totals[path_start : path_start + n_block_paths] += sample_benefits(
+                rng=np.random.default_rng(block_seed),
+                n_paths=n_block_paths,
+                ages=ages[idx],
+                benefits=benefits[idx],
+                table_ids=table_ids[idx],
+                tables=tables,
+                years=years,
+            )
+
+    return totals
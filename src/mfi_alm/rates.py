@@ -0,0 +1,148 @@
+import numpy as np
+
+
+class ShortRateModel:
+    """
+    One-factor mean-reverting short rate sampled on the yearly grid,
+
+        r_{t+1} = r_t * exp(-a) + theta_t * (1 - exp(-a)) + sigma * sqrt((1 - exp(-2a)) / (2a)) * Z_{t+1},
+
+    which is the exact yearly transition of the Ornstein-Uhlenbeck process with mean reversion `a` and volatility
+    `sigma` when the reversion level is piecewise constant. With `theta_t = b` this is Vasicek; with a
+    time-dependent `theta` it is the Hull-White (extended Vasicek) model.
+
+    The recursion is linear, so all paths are generated at once: the shocks of every year are combined with a single
+    (paths x years) @ (years x years) product against the lower-triangular decay matrix.
+    """
+
+    def __init__(self, mean_reversion: float, theta: float | np.ndarray, volatility: float, initial_rate: float):
+        if mean_reversion <= 0:
+            raise ValueError("Mean reversion must be positive.")
+        if volatility < 0:
+            raise ValueError("Volatility must be non-negative.")
+        self.mean_reversion = mean_reversion
+        self.theta = theta
+        self.volatility = volatility
+        self.initial_rate = initial_rate
+
+    def _levels(self, years: int) -> np.ndarray:
+        theta = np.asarray(self.theta, dtype=np.float64)
+        if theta.ndim == 0:
+            return np.full(years, float(theta))
+        if len(theta) < years:
+            raise ValueError(f"Reversion levels cover {len(theta)} years, fewer than the {years} requested.")
+        return theta[:years]
+
+    def _decay_matrix(self, years: int) -> np.ndarray:
+        """Lower-triangular (years x years) matrix of `exp(-a * (t - s))` for s <= t."""
+        lags = np.arange(years)[:, np.newaxis] - np.arange(years)
+        return np.where(lags >= 0, np.exp(-self.mean_reversion * np.maximum(lags, 0)), 0.0)
+
+    def expected_rates(self, years: int) -> np.ndarray:
+        """E[r_t] for t = 1 to years."""
+        decay = np.exp(-self.mean_reversion)
+        levels = self._decay_matrix(years) @ (self._levels(years) * (1 - decay))
+        return decay ** np.arange(1, years + 1) * self.initial_rate + levels
+
+    def simulate(
+        self, n_paths: int, years: int, seed: int | np.random.SeedSequence | np.random.Generator | None = None
+    ) -> np.ndarray:
+        """Short rates r_1 to r_years on each of `n_paths` paths (paths x years)."""
+        rng = np.random.default_rng(seed)
+        decay = np.exp(-self.mean_reversion)
+        shock_scale = self.volatility * np.sqrt((1 - decay**2) / (2 * self.mean_reversion))
+
+        # r_t - E[r_t] = sum_{s <= t} decay^(t - s) * shock_s
+        shocks = shock_scale * rng.standard_normal((n_paths, years))
+        return self.expected_rates(years) + shocks @ self._decay_matrix(years).T
+
+
+class VasicekModel(ShortRateModel):
+    """Short rate reverting to a constant long-term rate."""
+
+    def __init__(self, mean_reversion: float, long_term_rate: float, volatility: float, initial_rate: float):
+        super().__init__(
+            mean_reversion=mean_reversion, theta=long_term_rate, volatility=volatility, initial_rate=initial_rate
+        )
+
+
+class HullWhiteModel(ShortRateModel):
+    """
+    Short rate whose reversion level is fitted so that the expected short rate in year t is the forward rate
+    `forward_rates[t - 1]` (no convexity adjustment). With no curve, the curve is flat at `initial_rate`. With
+    `years`, a shorter curve is extended flat at its last forward rate to cover that many years.
+    """
+
+    def __init__(
+        self,
+        mean_reversion: float,
+        volatility: float,
+        initial_rate: float,
+        forward_rates: np.ndarray | None = None,
+        years: int | None = None,
+    ):
+        if forward_rates is None:
+            # On a flat curve the reversion level is the rate itself, whatever the horizon.
+            super().__init__(
+                mean_reversion=mean_reversion, theta=initial_rate, volatility=volatility, initial_rate=initial_rate
+            )
+            self.forward_rates = None
+            return
+
+        forward_rates = np.asarray(forward_rates, dtype=np.float64)
+        if len(forward_rates) == 0:
+            raise ValueError("The forward curve must have at least one rate.")
+        if years is not None and len(forward_rates) < years:
+            forward_rates = np.pad(forward_rates, (0, years - len(forward_rates)), mode="edge")
+        decay = np.exp(-mean_reversion)
+        previous = np.concatenate([[initial_rate], forward_rates[:-1]])
+        theta = (forward_rates - decay * previous) / (1 - decay)
+        super().__init__(mean_reversion=mean_reversion, theta=theta, volatility=volatility, initial_rate=initial_rate)
+        self.forward_rates = forward_rates
+
+
+RATE_MODELS = ("vasicek", "hull_white")
+
+
+def validate_rate_config(config: dict) -> None:
+    """Check a `rate_paths` config block up front, before any capital is solved."""
+    model = config.get("model", "vasicek")
+    if model not in RATE_MODELS:
+        raise ValueError(f"Unknown short-rate model '{model}'; expected one of {list(RATE_MODELS)}.")
+    missing = [key for key in ("paths", "mean_reversion", "volatility") if key not in config]
+    if missing:
+        raise ValueError(f"The rate_paths block is missing {missing}.")
+    if isinstance(config["paths"], bool) or not isinstance(config["paths"], int) or config["paths"] <= 0:
+        raise ValueError("The number of rate paths must be a positive integer.")
+    if config["mean_reversion"] <= 0:
+        raise ValueError("Mean reversion must be positive.")
+    if config["volatility"] < 0:
+        raise ValueError("Volatility must be non-negative.")
+    if model == "hull_white" and "forward_rates" in config and len(config["forward_rates"]) == 0:
+        raise ValueError("The forward curve must have at least one rate.")
+
+
+def rate_model_from_config(config: dict, initial_rate: float, years: int | None = None) -> ShortRateModel:
+    """
+    Build the short-rate model described by a `rate_paths` config block. `initial_rate` is used wherever the block
+    does not set `initial_rate` (and, for Vasicek, `long_term_rate`); a Hull-White forward curve shorter than
+    `years` is extended flat at its last rate.
+    """
+    model = config.get("model", "vasicek")
+    initial_rate = config.get("initial_rate", initial_rate)
+    if model == "vasicek":
+        return VasicekModel(
+            mean_reversion=config["mean_reversion"],
+            long_term_rate=config.get("long_term_rate", initial_rate),
+            volatility=config["volatility"],
+            initial_rate=initial_rate,
+        )
+    if model == "hull_white":
+        return HullWhiteModel(
+            mean_reversion=config["mean_reversion"],
+            volatility=config["volatility"],
+            initial_rate=initial_rate,
+            forward_rates=config.get("forward_rates"),
+            years=years,
+        )
+    raise ValueError(f"Unknown short-rate model '{model}'; expected one of {list(RATE_MODELS)}.")
@@ -0,0 +1,150 @@
+import csv
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable
+
+import numpy as np
+
+# Detailed report columns: array name -> CSV header. Columns added since the original nine-column layout come last, so
+# positional readers of that layout keep working.
+DETAILED_COLUMNS = {
+    "iteration": "Iteration",
+    "capital": "Capital",
+    "final_reserve": "Final Reserve",
+    "min_bound": "Min Bound",
+    "max_bound": "Max Bound",
+    "year": "Year",
+    "reserve": "Reserve",
+    "asset_yield": "Asset Yield",
+    "liability_benefit": "Liability Benefit",
+    "asset_cash_flow": "Asset Cash Flow",
+    "asset_market_value": "Asset Market Value",
+}
+
+# Per-iteration scalars and per-year series of `ScenarioSimulator.iteration_info`, by column. Yearly flows start in
+# year 1, so they have no value in year 0.
+ITERATION_FIELDS = {
+    "iteration": "iteration",
+    "capital": "capital",
+    "final_reserve": "final_reserve",
+    "min_bound": "min_val",
+    "max_bound": "max_val",
+}
+YEARLY_FIELDS = {
+    "reserve": ("reserves", False),
+    "asset_yield": ("asset_yields", True),
+    "liability_benefit": ("liability_expected_yearly_benefits", True),
+    "asset_cash_flow": ("asset_cashflows", True),
+    "asset_market_value": ("asset_market_values", False),
+}
+
+REPORT_FORMATS = ("csv", "npz", "parquet")
+
+
+def _yearly_fields(with_cashflows: bool) -> dict[str, tuple[str, bool]]:
+    return {name: field for name, field in YEARLY_FIELDS.items() if with_cashflows or name != "asset_cash_flow"}
+
+
+def detailed_columns(iteration_info: dict[int, dict[str, Any]], with_cashflows: bool = False) -> dict[str, np.ndarray]:
+    """
+    The detailed report as one array per column, with a row per iteration and year. Missing year-0 flows are NaN.
+    """
+    infos = list(iteration_info.values())
+    if not infos:
+        return {name: np.empty(0) for name in list(ITERATION_FIELDS) + ["year"] + list(_yearly_fields(with_cashflows))}
+
+    n_years = np.array([len(info["reserves"]) for info in infos])
+    columns = {
+        name: np.repeat(np.array([info[key] for info in infos], dtype=np.float64), n_years)
+        for name, key in ITERATION_FIELDS.items()
+    }
+    columns["iteration"] = columns["iteration"].astype(np.int64)
+    columns["year"] = np.concatenate([np.arange(n) for n in n_years])
+    for name, (key, from_year_one) in _yearly_fields(with_cashflows).items():
+        lead = [np.nan] if from_year_one else []
+        columns[name] = np.concatenate(
+            [np.concatenate([lead, np.asarray(info[key], dtype=np.float64)]) for info in infos]
+        )
+    return columns
+
+
+def _as_list(values: Any) -> list:
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def write_detailed_csv(path: str, iteration_info: dict[int, dict[str, Any]], with_cashflows: bool = False) -> None:
+    """The detailed report as CSV, written one iteration at a time with a single `writerows` each."""
+    yearly_fields = _yearly_fields(with_cashflows)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([DETAILED_COLUMNS[name] for name in list(ITERATION_FIELDS) + ["year"] + list(yearly_fields)])
+        for info in iteration_info.values():
+            n_years = len(info["reserves"])
+            scalars = [repeat(info[key], n_years) for key in ITERATION_FIELDS.values()]
+            series = [
+                ([None] if from_year_one else []) + _as_list(info[key]) for key, from_year_one in yearly_fields.values()
+            ]
+            writer.writerows(zip(*scalars, range(n_years), *series))
+
+
+def write_detailed_npz(path: str, columns: dict[str, np.ndarray], compress: bool = False) -> None:
+    (np.savez_compressed if compress else np.savez)(path, **columns)
+
+
+def write_detailed_parquet(path: str, columns: dict[str, np.ndarray], compress: bool = False) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet reports need pyarrow (`pip install pyarrow`); use the 'csv' or 'npz' format.") from e
+    pq.write_table(pa.table(columns), path, compression="zstd" if compress else "none")
+
+
+def write_detailed_report(
+    path: str,
+    iteration_info: dict[int, dict[str, Any]],
+    report_format: str = "csv",
+    compress: bool = False,
+    with_cashflows: bool = False,
+) -> None:
+    """Write the detailed report to `path` as CSV, `.npz` or Parquet; `compress` applies to the binary formats."""
+    if report_format == "csv":
+        write_detailed_csv(path, iteration_info, with_cashflows=with_cashflows)
+    elif report_format == "npz":
+        write_detailed_npz(path, detailed_columns(iteration_info, with_cashflows=with_cashflows), compress=compress)
+    elif report_format == "parquet":
+        write_detailed_parquet(path, detailed_columns(iteration_info, with_cashflows=with_cashflows), compress=compress)
+    else:
+        raise ValueError(f"Unknown report format '{report_format}'; expected one of {list(REPORT_FORMATS)}.")
+
+
+class ReportWriter:
+    """
+    Runs report writes either inline or, with `background`, in order on a single background thread, so that the
+    caller can move on to the next scenario while a report is written. Errors from background writes are raised by
+    `close()`, which waits for every pending write (a `with` block closes the writer on exit).
+    """
+
+    def __init__(self, background: bool = False):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer") if background else None
+        self._pending: list[Future] = []
+
+    def submit(self, write: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        if self._executor is None:
+            write(*args, **kwargs)
+        else:
+            self._pending.append(self._executor.submit(write, *args, **kwargs))
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True)
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
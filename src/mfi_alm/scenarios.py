@@ -0,0 +1,91 @@
+from typing import Self
+
+from mfi_alm.assets.asset_portfolio import AssetPortfolio
+from mfi_alm.assets.asset_portfolio_loader import AssetPortfolioLoader
+from mfi_alm.liabilities.liability_portfolio import LiabilityPortfolio
+from mfi_alm.liabilities.liability_portfolio_loader import load_liability_portfolio
+from mfi_alm.liabilities.liability_stream import StreamedLiabilityPortfolio, stream_liability_scenarios
+from mfi_alm.liabilities.model_points import ModelPoints
+
+
+class ScenarioPortfolios:
+    """
+    Base asset and liability portfolios, loaded once at unit factors, from which every scenario is derived.
+
+    A scenario only scales yields (`ytm_factor`) and the force of mortality (`mortality_factor`), so its portfolios
+    are views over the base books: the columns and bond schedules are shared and only the scaled yields and tables
+    are new. Streamed liabilities hold no policies to rescale, so they are instead accumulated for every scenario's
+    mortality factor in the same pass over the tape (see `stream_liability_scenarios`).
+    """
+
+    def __init__(
+        self,
+        asset_portfolio: AssetPortfolio,
+        liability_portfolio: LiabilityPortfolio | None = None,
+        streamed_liabilities: dict[float, StreamedLiabilityPortfolio] | None = None,
+    ):
+        if (liability_portfolio is None) == (streamed_liabilities is None):
+            raise ValueError("Provide exactly one of liability_portfolio and streamed_liabilities.")
+        self.asset_portfolio = asset_portfolio
+        self.liability_portfolio = liability_portfolio
+        self.streamed_liabilities = streamed_liabilities
+
+    @classmethod
+    def load(
+        cls,
+        asset_path: str,
+        liability_path: str,
+        liability_interest: float,
+        model_points: dict[str, float] | None = None,
+        liability_chunk_size: int | None = None,
+        mortality_factors: list[float] | None = None,
+        cache_dir: str | None = None,
+    ) -> Self:
+        """
+        Read both tapes once. With `liability_chunk_size` the liabilities are streamed, which needs every
+        `mortality_factors` that scenarios will ask for up front. Streaming reads the policyholder tape chunk by chunk
+        on every run, bypassing the tape cache in `cache_dir` (which then only caches the asset tape), and cannot be
+        combined with `model_points`.
+        """
+        if liability_chunk_size is not None and model_points is not None:
+            raise ValueError("Streamed liabilities cannot be compressed into model points; set only one of them.")
+        asset_portfolio = AssetPortfolioLoader.load_asset_portfolio(
+            file_path=asset_path, ytm_factor=1.0, cache_dir=cache_dir
+        )
+        if liability_chunk_size is not None:
+            streamed_liabilities = stream_liability_scenarios(
+                filepath=liability_path,
+                mortality_factors=mortality_factors or [1.0],
+                interest=liability_interest,
+                chunk_size=liability_chunk_size,
+            )
+            return cls(asset_portfolio=asset_portfolio, streamed_liabilities=streamed_liabilities)
+
+        liability_portfolio = load_liability_portfolio(
+            filepath=liability_path,
+            mortality_factor=1.0,
+            interest=liability_interest,
+            compress=model_points is not None,
+            mu_bucket_width=(model_points or {}).get("mu_bucket_width"),
+            cache_dir=cache_dir,
+        )
+        return cls(asset_portfolio=asset_portfolio, liability_portfolio=liability_portfolio)
+
+    @property
+    def model_points(self) -> ModelPoints | None:
+        return None if self.liability_portfolio is None else self.liability_portfolio.model_points
+
+    def assets(self, ytm_factor: float) -> AssetPortfolio:
+        return self.asset_portfolio.with_ytm_factor(ytm_factor)
+
+    def liabilities(self, mortality_factor: float) -> LiabilityPortfolio | StreamedLiabilityPortfolio:
+        if self.streamed_liabilities is None:
+            return self.liability_portfolio.with_mortality_factor(mortality_factor)
+        if mortality_factor not in self.streamed_liabilities:
+            raise ValueError(f"Liabilities were not streamed for mortality factor {mortality_factor}.")
+        return self.streamed_liabilities[mortality_factor]
+
+    def scenario(
+        self, ytm_factor: float, mortality_factor: float
+    ) -> tuple[AssetPortfolio, LiabilityPortfolio | StreamedLiabilityPortfolio]:
+        return self.assets(ytm_factor), self.liabilities(mortality_factor)
@@ -0,0 +1,364 @@
+import csv
+import os
+
+import numpy as np
+
+from mfi_alm.assets.asset_portfolio import AssetPortfolio
+from mfi_alm.instrumentation import count, span
+from mfi_alm.liabilities.liability_portfolio import LiabilityPortfolio
+from mfi_alm.liabilities.liability_stream import StreamedLiabilityPortfolio
+from mfi_alm.reporting import write_detailed_report
+from mfi_alm.solvers import make_solver
+from mfi_alm.utils import get_time
+
+
+def project_reserves(capitals: np.ndarray, asset_yields: np.ndarray, liability_benefits: np.ndarray) -> np.ndarray:
+    """
+    Reserves of every scenario under every starting capital, in one broadcast.
+
+    `asset_yields` and `liability_benefits` hold one row of yearly values per scenario (or a single row for one
+    scenario). The reserve at year t is `capital * G_t - G_t * sum_{s<=t} b_s / G_s` with `G_t` the cumulative growth
+    factor, so the capital enters affinely and the benefit term is shared by every capital. Returns an array of
+    shape (scenarios, capitals, years + 1) whose year 0 is the starting capital.
+    """
+    capitals = np.atleast_1d(np.asarray(capitals, dtype=np.float64))
+    asset_yields = np.atleast_2d(np.asarray(asset_yields, dtype=np.float64))
+    liability_benefits = np.atleast_2d(np.asarray(liability_benefits, dtype=np.float64))
+    if asset_yields.shape != liability_benefits.shape:
+        raise ValueError("Asset yields and liability benefits must have the same (scenarios x years) shape.")
+
+    growth_factors = np.cumprod(1 + asset_yields, axis=-1)
+    adjusted_liabilities = np.cumsum(liability_benefits / growth_factors, axis=-1) * growth_factors
+
+    n_scenarios, years = asset_yields.shape
+    reserves = np.empty((n_scenarios, len(capitals), years + 1))
+    reserves[:, :, 0] = capitals
+    reserves[:, :, 1:] = (
+        capitals[:, np.newaxis] * growth_factors[:, np.newaxis, :] - adjusted_liabilities[:, np.newaxis, :]
+    )
+    return reserves
+
+
+def project_cashflow_reserves(
+    capitals: np.ndarray,
+    reinvestment_rates: np.ndarray,
+    unit_inflows: np.ndarray,
+    unit_values: np.ndarray,
+    liability_benefits: np.ndarray,
+) -> np.ndarray:
+    """
+    Reserves of every scenario under every starting capital when the capital buys the bond portfolio and the reserve
+    is the portfolio's remaining value plus a cash account.
+
+    Per unit of capital the bonds pay `unit_inflows` in each year and are worth `unit_values` at the end of it
+    (ex-coupon). Coupons and redemptions are credited to the cash account and benefits debited from it, and the
+    account earns `reinvestment_rates` (one row per scenario). With `G_t` the cumulative growth factor of the account,
+
+        reserve_t = capital * (G_t * sum_{s<=t} a_s / G_s + m_t) - G_t * sum_{s<=t} b_s / G_s,
+
+    which is still affine in capital. Returns an array of shape (scenarios, capitals, years + 1) whose year 0 is the
+    starting capital.
+    """
+    capitals = np.atleast_1d(np.asarray(capitals, dtype=np.float64))
+    reinvestment_rates = np.atleast_2d(np.asarray(reinvestment_rates, dtype=np.float64))
+    liability_benefits = np.atleast_2d(np.asarray(liability_benefits, dtype=np.float64))
+    if reinvestment_rates.shape != liability_benefits.shape:
+        raise ValueError("Reinvestment rates and liability benefits must have the same (scenarios x years) shape.")
+
+    growth_factors = np.cumprod(1 + reinvestment_rates, axis=-1)
+    unit_assets = np.cumsum(unit_inflows / growth_factors, axis=-1) * growth_factors + unit_values
+    adjusted_liabilities = np.cumsum(liability_benefits / growth_factors, axis=-1) * growth_factors
+
+    n_scenarios, years = reinvestment_rates.shape
+    reserves = np.empty((n_scenarios, len(capitals), years + 1))
+    reserves[:, :, 0] = capitals
+    reserves[:, :, 1:] = (
+        capitals[:, np.newaxis] * unit_assets[:, np.newaxis, :] - adjusted_liabilities[:, np.newaxis, :]
+    )
+    return reserves
+
+
+def reserve_distribution(
+    reserves: np.ndarray, quantiles: tuple[float, ...] = (0.05, 0.5, 0.95)
+) -> dict[str, np.ndarray]:
+    """Per-year summary of reserve paths (paths x years): mean, the given quantiles and the probability of ruin."""
+    summary = {"mean": np.mean(reserves, axis=0)}
+    for q, values in zip(quantiles, np.quantile(reserves, quantiles, axis=0)):
+        summary[f"q{round(q * 100):02d}"] = values
+    summary["prob_negative"] = np.mean(reserves < 0, axis=0)
+    return summary
+
+
+def write_reserve_distribution(path: str, summary: dict[str, np.ndarray]) -> None:
+    headers = {"mean": "Mean Reserve", "prob_negative": "Probability Negative"}
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Year"] + [headers.get(key, f"Reserve {key[1:]}%") for key in summary])
+        writer.writerows(zip(range(len(summary["mean"])), *(values.tolist() for values in summary.values())))
+
+
+class ScenarioSimulator:
+    """
+    Searches for the starting capital at which the reserve at the end of the projection is within `tolerance` of 0,
+    using the capital solver named by `solver` (see `mfi_alm.solvers`), starting from `capital_bracket` when given
+    (a warm start, see `mfi_alm.solvers.warm_bracket`).
+
+    With `mode="yield"` the reserve grows at the portfolio's average yield (`project_reserves`); with
+    `mode="cashflow"` it is the bonds' own coupons and redemptions reinvested at that yield plus their remaining
+    value (`project_cashflow_reserves`).
+    """
+
+    MODES = ("yield", "cashflow")
+
+    def __init__(
+        self,
+        asset_portfolio: AssetPortfolio,
+        liability_portfolio: LiabilityPortfolio | StreamedLiabilityPortfolio,
+        initial_capital: float,
+        maximum_capital: float,
+        years: int,
+        max_iterations: int = 30,
+        tolerance: float = 1000,
+        minimum_capital: float = 0.0,
+        verbose: bool = True,
+        solver: str = "bisection",
+        mode: str = "yield",
+        capital_bracket: tuple[float, float] | None = None,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown projection mode '{mode}'; expected one of {list(self.MODES)}.")
+        self.asset_portfolio = asset_portfolio
+        self.liability_portfolio = liability_portfolio
+        self.initial_capital = initial_capital
+        self.maximum_capital = maximum_capital
+        self.minimum_capital = minimum_capital
+        self.years = years
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.verbose = verbose
+        self.solver_method = solver
+        self.capital_bracket = capital_bracket
+        self.mode = mode
+        self._unscaled_projections: dict[str, np.ndarray] = {}
+        self.solver = None
+        self.mortality_paths = None
+        self.rate_paths = None
+        self.iteration_info = {}
+        self.final_capital = None
+        self.total_time = None
+        self.converged = False
+
+    def run(self) -> None:
+        with span("solve_capital", solver=self.solver_method, mode=self.mode) as solve_span:
+            self._solve()
+        t, units = get_time(solve_span.duration, dp=2)
+        self.total_time = {"t": t, "units": units}
+
+    def _solve(self) -> None:
+        self.iteration_info = {}
+        self.converged = False
+        self.solver = make_solver(
+            method=self.solver_method,
+            lower=self.minimum_capital,
+            upper=self.maximum_capital,
+            initial=self.initial_capital,
+            final_reserves=lambda capitals: self.evaluate_capitals(capitals)[:, -1],
+            bracket=self.capital_bracket,
+        )
+
+        for i in range(self.max_iterations):
+            capital = self.solver.next_capital()
+            scaled_assets = self.asset_portfolio.copy()
+            scaled_assets.scale_to_target(capital)
+
+            with span("solver_iteration", iteration=i + 1) as iteration_span:
+                iteration_result = self.simulate_cashflows(
+                    capital=capital,
+                    asset_portfolio=scaled_assets,
+                    liability_portfolio=self.liability_portfolio,
+                )
+                final_reserve = float(iteration_result["reserves"][-1])
+            count("iterations")
+            t, units = get_time(t=iteration_span.duration, dp=2)
+
+            if self.verbose:
+                print(
+                    f"Iteration {i + 1:02d}... Capital=${capital:,.2f}, Final Reserve=${final_reserve:,.2f}, "
+                    f"Time taken={t} {units}."
+                )
+
+            # Bracket the solver held when it proposed this capital.
+            self.iteration_info[i] = {
+                "iteration": i + 1,
+                "capital": capital,
+                "final_reserve": final_reserve,
+                "min_val": self.solver.lower,
+                "max_val": self.solver.upper,
+                **iteration_result,
+            }
+
+            if abs(final_reserve) < self.tolerance:
+                self.converged = True
+                self.final_capital = capital
+                break
+
+            self.solver.update(capital, final_reserve)
+        else:
+            self.final_capital = self.solver.next_capital()
+
+    def unscaled_asset_projection(self, name: str) -> np.ndarray:
+        """
+        A projection of the bond portfolio at scale 1: its total market value at the start of each year
+        (`"market_values"`, years + 1), its yearly coupon and redemption inflows (`"inflows"`) or the ex-coupon value
+        left at the end of each year (`"values"`). Scaling the portfolio to a capital only multiplies these, so each
+        is computed once per scenario and reused by every solver iteration.
+        """
+        if name not in self._unscaled_projections:
+            book = self.asset_portfolio.book
+            if name == "market_values":
+                projection = np.sum(book.projected_prices(self.years + 1), axis=0)
+            elif name == "inflows":
+                projection = book.cashflow_buckets(self.years)
+            elif name == "values":
+                projection = np.sum(book.projected_prices(self.years + 1, ex_coupon=True), axis=0)[1:]
+            else:
+                raise ValueError(f"Unknown asset projection '{name}'.")
+            self._unscaled_projections[name] = projection
+        return self._unscaled_projections[name]
+
+    def unit_asset_cashflows(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Yearly coupon and redemption inflows, and the ex-coupon value left at the end of each year, of the bond
+        portfolio bought with one unit of capital.
+        """
+        base_value = self.asset_portfolio.book.market_value()
+        if base_value <= 0:
+            return np.zeros(self.years), np.zeros(self.years)
+        return (
+            self.unscaled_asset_projection("inflows") / base_value,
+            self.unscaled_asset_projection("values") / base_value,
+        )
+
+    def _project(self, capitals: np.ndarray, asset_yields: np.ndarray, liability_benefits: np.ndarray) -> np.ndarray:
+        if self.mode == "cashflow":
+            unit_inflows, unit_values = self.unit_asset_cashflows()
+            return project_cashflow_reserves(
+                capitals=capitals,
+                reinvestment_rates=asset_yields,
+                unit_inflows=unit_inflows,
+                unit_values=unit_values,
+                liability_benefits=liability_benefits,
+            )
+        return project_reserves(capitals=capitals, asset_yields=asset_yields, liability_benefits=liability_benefits)
+
+    def simulate_cashflows(
+        self,
+        capital: float,
+        asset_portfolio: AssetPortfolio,
+        liability_portfolio: LiabilityPortfolio | StreamedLiabilityPortfolio,
+    ) -> dict[str, np.ndarray]:
+        """
+        Reserve path and report series of `asset_portfolio`, this simulator's portfolio scaled to `capital`. Its
+        market values and cash flows are the cached unscaled projections times its scale.
+        """
+        asset_yields = asset_portfolio.projected_average_yields(self.years)
+        liability_benefits = liability_portfolio.projected_expected_yearly_benefits(self.years)
+
+        reserves = self._project(
+            capitals=[capital],
+            asset_yields=asset_yields,
+            liability_benefits=liability_benefits,
+        )[0, 0]
+
+        result = {
+            "reserves": reserves,
+            "asset_market_values": asset_portfolio.scale * self.unscaled_asset_projection("market_values"),
+            "asset_yields": asset_yields,
+            "liability_expected_yearly_benefits": liability_benefits,
+        }
+        if self.mode == "cashflow":
+            result["asset_cashflows"] = asset_portfolio.scale * self.unscaled_asset_projection("inflows")
+        return result
+
+    def evaluate_capitals(self, capitals: np.ndarray) -> np.ndarray:
+        """Reserves (capitals x years + 1) of this scenario for a whole grid of starting capitals at once."""
+        return self._project(
+            capitals=capitals,
+            asset_yields=self.asset_portfolio.projected_average_yields(self.years),
+            liability_benefits=self.liability_portfolio.projected_expected_yearly_benefits(self.years),
+        )[0]
+
+    def simulate_mortality_paths(self, n_paths: int, seed: int | np.random.SeedSequence | None = None) -> np.ndarray:
+        """
+        Reserves (paths x years + 1) at the solved capital when deaths are simulated instead of expected, one row
+        per mortality path. The paths average to the expected benefits the capital was solved on, so their mean
+        reserve is the solved reserve path. The per-year distribution is kept on `mortality_paths` for
+        `output_report`.
+        """
+        benefit_paths = self.liability_portfolio.simulate_benefit_paths(n_paths=n_paths, years=self.years, seed=seed)
+        asset_yields = self.asset_portfolio.projected_average_yields(self.years)
+        reserves = self._project(
+            capitals=[self.final_capital],
+            asset_yields=np.broadcast_to(asset_yields, benefit_paths.shape),
+            liability_benefits=benefit_paths,
+        )[:, 0]
+        self.mortality_paths = reserve_distribution(reserves)
+        return reserves
+
+    def simulate_rate_paths(self, yield_paths: np.ndarray) -> np.ndarray:
+        """
+        Reserves (paths x years + 1) at the solved capital when the portfolio earns (or, in cashflow mode,
+        reinvests at) the yields of `yield_paths` (paths x years, e.g. from `mfi_alm.rates`) instead of its flat
+        average yield. The per-year distribution is kept on `rate_paths` for `output_report`.
+        """
+        yield_paths = np.atleast_2d(yield_paths)[:, : self.years]
+        liability_benefits = self.liability_portfolio.projected_expected_yearly_benefits(self.years)
+        reserves = self._project(
+            capitals=[self.final_capital],
+            asset_yields=yield_paths,
+            liability_benefits=np.broadcast_to(liability_benefits, yield_paths.shape),
+        )[:, 0]
+        self.rate_paths = reserve_distribution(reserves)
+        return reserves
+
+    def output_report(
+        self, scenario_name: str, output_dir: str, report_format: str = "csv", compress: bool = False
+    ) -> None:
+        """
+        Write the detailed report (all iterations, all years) in `report_format` (see `mfi_alm.reporting`), the
+        summary report and any reserve distributions; the last two are always small CSV files.
+        """
+        detailed_path = os.path.join(output_dir, f"output_{scenario_name}_report_detailed.{report_format}")
+        summary_path = os.path.join(output_dir, f"output_{scenario_name}_report.csv")
+
+        # Cashflow mode adds the bonds' yearly inflows to the detailed report.
+        write_detailed_report(
+            detailed_path,
+            self.iteration_info,
+            report_format=report_format,
+            compress=compress,
+            with_cashflows=self.mode == "cashflow",
+        )
+
+        # Summary report (only final result)
+        with open(summary_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Scenario", "Final Capital", "Converged", "Final Reserve", "Time", "Units"])
+            last_iter = list(self.iteration_info.values())[-1] if self.iteration_info else {}
+            writer.writerow(
+                [
+                    scenario_name,
+                    self.final_capital,
+                    self.converged,
+                    last_iter.get("final_reserve", None),
+                    self.total_time["t"],
+                    self.total_time["units"],
+                ]
+            )
+
+        # Reserve distributions over simulated paths, when they were run.
+        for kind, summary in (("mortality_paths", self.mortality_paths), ("rate_paths", self.rate_paths)):
+            if summary is not None:
+                write_reserve_distribution(
+                    os.path.join(output_dir, f"output_{scenario_name}_report_{kind}.csv"), summary
+                )
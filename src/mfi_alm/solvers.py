@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+import numpy as np
+
+
+class CapitalSolver(ABC):
+    """
+    Root finder for the starting capital at which the final reserve is 0, driven one simulation at a time.
+
+    The caller asks for `next_capital()`, simulates it and reports the final reserve back with `update()`. The final
+    reserve is assumed to increase with capital, so every update also narrows the bracket `[lower, upper]`: a
+    negative reserve means the root lies above the capital, otherwise below it. Solvers that use `final_reserves`
+    (a batched capitals -> final reserves function) only call it while being set up and do not keep it, so a solver
+    can be sent between processes.
+
+    A `bracket` inside `[lower, upper]` (see `warm_bracket`) starts the search there instead. Its ends are only
+    guesses until simulated, so once the root is known to lie on one side of a simulated capital, the guessed end on
+    that side is simulated next; if the root turns out to lie beyond it, the bracket widens back to the limit.
+    """
+
+    name = "base"
+
+    def __init__(
+        self,
+        lower: float,
+        upper: float,
+        initial: float,
+        final_reserves: Callable[[np.ndarray], np.ndarray] | None = None,
+        bracket: tuple[float, float] | None = None,
+    ):
+        self.limits = (lower, upper)
+        self.lower, self.upper = (max(lower, bracket[0]), min(upper, bracket[1])) if bracket else (lower, upper)
+        self.guessed = {"lower": self.lower > lower, "upper": self.upper < upper}
+        self.initial = initial
+        self.history: list[tuple[float, float]] = []
+
+    @abstractmethod
+    def next_capital(self) -> float:
+        """The capital to simulate next."""
+
+    def update(self, capital: float, final_reserve: float) -> None:
+        self.history.append((capital, final_reserve))
+        if final_reserve < 0:
+            self.lower = capital
+            self.guessed["lower"] = False
+            if capital >= self.upper:
+                self.upper, self.guessed["upper"] = self.limits[1], False
+        else:
+            self.upper = capital
+            self.guessed["upper"] = False
+            if capital <= self.lower:
+                self.lower, self.guessed["lower"] = self.limits[0], False
+
+    def guessed_end(self) -> float | None:
+        """The end of a warm-started bracket still to be simulated, once the root is known to lie towards it."""
+        if not self.history:
+            return None
+        if self.guessed["upper"] and not self.guessed["lower"]:
+            return self.upper
+        if self.guessed["lower"] and not self.guessed["upper"]:
+            return self.lower
+        return None
+
+    def midpoint(self) -> float:
+        return (self.lower + self.upper) / 2
+
+
+class BisectionSolver(CapitalSolver):
+    """Start at `initial`, then halve the bracket after every simulation."""
+
+    name = "bisection"
+
+    def next_capital(self) -> float:
+        if not self.history:
+            return self.initial
+        guessed_end = self.guessed_end()
+        if guessed_end is not None:
+            return guessed_end
+        return self.midpoint()
+
+
+class SecantSolver(CapitalSolver):
+    """
+    Secant steps through the last two simulations, safeguarded by the bracket: whenever the secant step leaves
+    `(lower, upper)` (or only one point is known yet) a bisection step is taken instead. Converges superlinearly on
+    smooth projections while never doing worse than bisection's bracket.
+    """
+
+    name = "secant"
+
+    def next_capital(self) -> float:
+        if not self.history:
+            return self.initial
+        guessed_end = self.guessed_end()
+        if guessed_end is not None:
+            return guessed_end
+        if len(self.history) >= 2:
+            (c0, r0), (c1, r1) = self.history[-2:]
+            if r1 != r0:
+                capital = c1 - r1 * (c1 - c0) / (r1 - r0)
+                if self.lower < capital < self.upper:
+                    return capital
+        return self.midpoint()
+
+
+class AnalyticSolver(CapitalSolver):
+    """
+    Exact solve for projections whose final reserve is affine in capital, `reserve(c) = slope * c + intercept`.
+
+    The line is read off `final_reserves` at the two ends of the bracket (a batched evaluation, not a simulation),
+    so the first capital proposed is already the root and its simulation only confirms it. If the projection turns
+    out not to be affine, or has no root in the bracket, the solver continues by bisection. A warm-started `bracket`
+    only matters for that fallback.
+    """
+
+    name = "analytic"
+
+    def __init__(
+        self,
+        lower: float,
+        upper: float,
+        initial: float,
+        final_reserves: Callable[[np.ndarray], np.ndarray] | None = None,
+        bracket: tuple[float, float] | None = None,
+    ):
+        if final_reserves is None:
+            raise ValueError("The analytic solver needs a batched final_reserves function.")
+        super().__init__(lower=lower, upper=upper, initial=initial, final_reserves=final_reserves, bracket=bracket)
+        at_lower, at_upper = final_reserves(np.array([lower, upper], dtype=np.float64))
+        self.root = None
+        if upper > lower and at_upper > at_lower:
+            self.root = lower - at_lower * (upper - lower) / (at_upper - at_lower)
+
+    def next_capital(self) -> float:
+        if not self.history and self.root is not None and self.limits[0] <= self.root <= self.limits[1]:
+            return float(self.root)
+        if not self.history:
+            return self.initial
+        guessed_end = self.guessed_end()
+        if guessed_end is not None:
+            return guessed_end
+        return self.midpoint()
+
+
+SOLVERS: dict[str, type[CapitalSolver]] = {
+    solver.name: solver for solver in (BisectionSolver, SecantSolver, AnalyticSolver)
+}
+
+
+def make_solver(
+    method: str,
+    lower: float,
+    upper: float,
+    initial: float,
+    final_reserves: Callable[[np.ndarray], np.ndarray] | None = None,
+    bracket: tuple[float, float] | None = None,
+) -> CapitalSolver:
+    if method not in SOLVERS:
+        raise ValueError(f"Unknown capital solver '{method}'; expected one of {sorted(SOLVERS)}.")
+    return SOLVERS[method](lower=lower, upper=upper, initial=initial, final_reserves=final_reserves, bracket=bracket)
+
+
+def warm_start(lower: float, upper: float, initial: float, previous_capital: float | None) -> float:
+    """Start from the capital solved for a previous scenario when it lies within the bracket."""
+    if previous_capital is not None and lower <= previous_capital <= upper:
+        return previous_capital
+    return initial
+
+
+def warm_bracket(
+    lower: float, upper: float, previous_capital: float | None, width: float = 0.1
+) -> tuple[float, float] | None:
+    """
+    A bracket of relative half-width `width` around the capital solved for a previous scenario, within
+    `[lower, upper]`; None without a previous capital inside the limits. See `CapitalSolver` for how it is searched.
+    """
+    if previous_capital is None or not lower <= previous_capital <= upper:
+        return None
+    half_width = width * max(abs(previous_capital), (upper - lower) * 1e-6)
+    return max(lower, previous_capital - half_width), min(upper, previous_capital + half_width)
@@ -0,0 +1,172 @@
+"""
+Synthetic policyholder and bond tapes of any size, for stress-testing the loaders and the projection.
+
+    python -m mfi_alm.tape_generator policyholders --rows 100000000 --output data/policyholders.tape --workers 8
+    python -m mfi_alm.tape_generator assets --rows 50000 --output data/asset_tape_50k.csv
+
+Rows are generated `chunk_size` at a time and written as they come, so a tape never sits in memory whole. Chunk
+`k` draws from its own stream, `SeedSequence(seed, spawn_key=(k,))`, so a tape depends only on its size, seed and
+chunk size, whether its chunks are generated serially or by `workers` processes.
+"""
+
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator
+
+import numpy as np
+
+from mfi_alm.assets.asset_portfolio_loader import ASSET_COLUMNS
+from mfi_alm.liabilities.liability_portfolio_loader import POLICYHOLDER_COLUMNS
+from mfi_alm.tapes import write_tape_chunks
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Binary tape dtypes per kind of tape: those the loaders read the columns as.
+TAPE_DTYPES = {
+    "policyholders": {name: np.dtype(dtype) for name, dtype in POLICYHOLDER_COLUMNS.items()},
+    "assets": {"asset_id": np.dtype(np.int64), **{name: np.dtype(dtype) for name, dtype in ASSET_COLUMNS.items()}},
+}
+
+
+def policyholder_chunk(rng: np.random.Generator, start: int, size: int) -> dict[str, np.ndarray]:
+    """Policyholders `start + 1` to `start + size`: ages 20-80, benefits 100k-2M and a force of mortality 3-8%."""
+    return {
+        "policyholder_id": np.arange(start + 1, start + size + 1, dtype=np.int64),
+        "age": rng.integers(20, 81, size=size),
+        "benefit": rng.integers(100_000, 2_000_001, size=size),
+        "mu": rng.uniform(0.03, 0.08, size=size),
+    }
+
+
+def asset_chunk(rng: np.random.Generator, start: int, size: int) -> dict[str, np.ndarray]:
+    """Bonds `start` to `start + size - 1`: maturities of 1-30 years, with annual, semi-annual or quarterly coupons."""
+    return {
+        "asset_id": np.arange(start, start + size, dtype=np.int64),
+        "face": rng.integers(1, 101, size=size) * 1_000_000,
+        "coupon": rng.uniform(0.01, 0.07, size=size).round(4),
+        "maturity": rng.integers(2, 61, size=size) / 2,
+        "freq": rng.choice(np.array([1, 2, 4]), size=size),
+        "ytm": rng.uniform(0.02, 0.06, size=size).round(4),
+    }
+
+
+GENERATORS: dict[str, Callable[[np.random.Generator, int, int], dict[str, np.ndarray]]] = {
+    "policyholders": policyholder_chunk,
+    "assets": asset_chunk,
+}
+
+
+def generate_chunk(kind: str, rows: int, index: int, seed: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """Chunk `index` of a `kind` tape of `rows` rows, drawn from that chunk's own stream."""
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown tape kind '{kind}'; expected one of {list(GENERATORS)}.")
+    start = index * chunk_size
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    return GENERATORS[kind](rng, start, min(chunk_size, rows - start))
+
+
+def iter_chunks(
+    kind: str, rows: int, seed: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    The chunks of a `kind` tape in order. With `workers > 1` they are generated in worker processes, at most two
+    per worker ahead of the consumer, so memory stays bounded however slowly the chunks are written.
+    """
+    n_chunks = -(-rows // chunk_size)
+    if workers <= 1:
+        for index in range(n_chunks):
+            yield generate_chunk(kind, rows, index, seed=seed, chunk_size=chunk_size)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending, indices = deque(), iter(range(n_chunks))
+        for index in indices:
+            pending.append(executor.submit(generate_chunk, kind, rows, index, seed, chunk_size))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            yield pending.popleft().result()
+            index = next(indices, None)
+            if index is not None:
+                pending.append(executor.submit(generate_chunk, kind, rows, index, seed, chunk_size))
+
+
+def generate_columns(kind: str, rows: int, seed: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """A whole `kind` tape in memory, with the same rows `generate_tape` writes for the same arguments."""
+    chunks = list(iter_chunks(kind, rows, seed=seed, chunk_size=chunk_size))
+    if not chunks:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in TAPE_DTYPES[kind].items()}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
+def write_csv_chunks(path: str, chunks: Iterator[dict[str, np.ndarray]], columns: list[str]) -> None:
+    """Write `chunks` to a CSV tape at `path`, one chunk at a time."""
+    import pandas as pd
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", newline="") as f:
+        f.write(",".join(columns) + "\n")
+        for chunk in chunks:
+            pd.DataFrame(chunk, columns=columns).to_csv(f, header=False, index=False)
+
+
+def generate_tape(
+    path: str,
+    kind: str,
+    rows: int,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    tape_format: str = "csv",
+    workers: int = 1,
+) -> None:
+    """Write a `kind` tape of `rows` synthetic rows to `path`, as CSV or as a binary tape (see `mfi_alm.tapes`)."""
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown tape kind '{kind}'; expected one of {list(GENERATORS)}.")
+    chunks = iter_chunks(kind, rows, seed=seed, chunk_size=chunk_size, workers=workers)
+    if tape_format == "csv":
+        write_csv_chunks(path, chunks, columns=list(TAPE_DTYPES[kind]))
+    elif tape_format == "tape":
+        source = {"generator": kind, "seed": seed, "chunk_size": chunk_size}
+        write_tape_chunks(path, TAPE_DTYPES[kind], rows, chunks, source=source)
+    else:
+        raise ValueError(f"Unknown tape format '{tape_format}'; expected 'csv' or 'tape'.")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic policyholder or asset tape.")
+    parser.add_argument("kind", choices=list(GENERATORS), help="Kind of tape to generate.")
+    parser.add_argument("--rows", type=int, required=True, help="Number of rows.")
+    parser.add_argument("--output", required=True, help="Path of the tape.")
+    parser.add_argument(
+        "--format",
+        dest="tape_format",
+        choices=["csv", "tape"],
+        help="CSV, or a binary tape directory (the default for paths ending in .tape).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated rows.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows generated at a time.")
+    parser.add_argument("--workers", type=int, default=1, help="Processes generating chunks in parallel.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    tape_format = args.tape_format or ("tape" if args.output.endswith(".tape") else "csv")
+    generate_tape(
+        args.output,
+        kind=args.kind,
+        rows=args.rows,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+        tape_format=tape_format,
+        workers=args.workers,
+    )
+    print(f"Wrote {args.rows:,} {args.kind} to {args.output} ({tape_format}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+
+
+def is_tape(path: str) -> bool:
+    """Whether `path` is a binary tape: a directory of `<column>.npy` files plus a manifest."""
+    return os.path.isfile(os.path.join(path, MANIFEST))
+
+
+@contextmanager
+def staged_tape(path: str) -> Iterator[str]:
+    """
+    A temporary directory next to `path` to write a tape into; on success it is published at `path` (see
+    `publish_tape`). On error it is removed.
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=parent, prefix=".tape-")
+    # `mkdtemp` makes the directory private; the published tape is readable like any other directory.
+    os.chmod(staging, 0o755)
+    try:
+        yield staging
+        publish_tape(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def publish_tape(tape_dir: str, path: str, attempts: int = 10) -> None:
+    """
+    Rename the finished tape directory `tape_dir` (a sibling of `path`) to `path`, replacing any tape there. The
+    published tape is a plain directory, so it can be copied or moved like any other.
+
+    A new tape appears with one atomic rename. A tape already at `path` is first renamed aside and removed once the
+    new one is in place, so a reader may briefly find no tape at `path`; `open_tape` waits for the new one.
+    Concurrent writers of the same path each publish a complete tape and the last one wins.
+    """
+    retired = []
+    for attempt in range(attempts):
+        try:
+            os.rename(tape_dir, path)
+            break
+        except OSError:
+            if attempt == attempts - 1 or not os.path.lexists(path):
+                raise
+        aside = f"{tape_dir}.previous-{attempt}"
+        try:
+            os.rename(path, aside)
+            retired.append(aside)
+        except FileNotFoundError:
+            pass
+    for aside in retired:
+        if os.path.islink(aside):
+            # Tapes used to be published as a link to a hidden sibling directory.
+            target = os.path.realpath(aside)
+            os.remove(aside)
+            aside = target
+        shutil.rmtree(aside, ignore_errors=True)
+
+
+def dtype_signature(dtypes: dict[str, np.dtype]) -> dict[str, str]:
+    """Column name -> dtype string (e.g. `'<f8'`), as recorded in a tape's manifest."""
+    return {name: np.dtype(dtype).str for name, dtype in dtypes.items()}
+
+
+def write_manifest(
+    tape_dir: str, dtypes: dict[str, np.dtype], rows: int, source: dict | None = None, tape_id: str | None = None
+) -> None:
+    """
+    Write the manifest to a temporary file and rename it into place, so readers never parse a partial one. The
+    manifest records the columns, their dtypes and an id unique to the tape (a fresh one unless `tape_id` is given).
+    """
+    manifest = {
+        "id": tape_id or uuid.uuid4().hex,
+        "columns": list(dtypes),
+        "dtypes": dtype_signature(dtypes),
+        "rows": rows,
+        "source": source,
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=tape_dir, prefix=f".{MANIFEST}-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, os.path.join(tape_dir, MANIFEST))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_tape(path: str, columns: dict[str, np.ndarray], source: dict | None = None) -> None:
+    """Write `columns` as a binary tape at `path`, replacing any existing tape there (see `staged_tape`)."""
+    rows = {len(c) for c in columns.values()}
+    if len(rows) > 1:
+        raise ValueError("Tape columns must all have the same length.")
+
+    with staged_tape(path) as staging:
+        for name, values in columns.items():
+            np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(values))
+        dtypes = {name: np.asarray(values).dtype for name, values in columns.items()}
+        write_manifest(staging, dtypes, rows.pop() if rows else 0, source=source)
+
+
+def write_tape_chunks(
+    path: str,
+    dtypes: dict[str, np.dtype],
+    rows: int,
+    chunks: Iterable[dict[str, np.ndarray]],
+    source: dict | None = None,
+) -> None:
+    """
+    Write a binary tape of `rows` rows from consecutive `chunks` of columns, filling memory-mapped `.npy` files so
+    that only one chunk is held in memory at a time.
+    """
+    with staged_tape(path) as staging:
+        columns = {
+            name: np.lib.format.open_memmap(os.path.join(staging, f"{name}.npy"), mode="w+", dtype=dtype, shape=(rows,))
+            for name, dtype in dtypes.items()
+        }
+        start = 0
+        for chunk in chunks:
+            size = len(next(iter(chunk.values())))
+            if start + size > rows:
+                raise ValueError(f"Tape chunks hold more than the {rows} rows declared.")
+            for name, values in columns.items():
+                values[start : start + size] = chunk[name]
+            start += size
+        if start != rows:
+            raise ValueError(f"Tape chunks hold {start} rows; expected {rows}.")
+        for values in columns.values():
+            values.flush()
+        del columns
+        write_manifest(staging, dtypes, rows, source=source)
+
+
+def read_manifest(path: str) -> dict:
+    with open(os.path.join(path, MANIFEST)) as f:
+        return json.load(f)
+
+
+def open_tape(path: str, mmap: bool = True, attempts: int = 5, wait: float = 0.01) -> dict[str, np.ndarray]:
+    """
+    Open the columns of a binary tape; with `mmap` they are read-only memory maps, so nothing is read up front.
+
+    The manifest's id is read before and after the columns are opened, so all columns come from the same tape: if
+    the tape was replaced meanwhile (see `publish_tape`), or is missing for the moment it is being replaced, the
+    open is retried after `wait` seconds.
+    """
+    mmap_mode = "r" if mmap else None
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(wait)
+        try:
+            manifest = read_manifest(path)
+            columns = {
+                name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in manifest["columns"]
+            }
+            if read_manifest(path).get("id") == manifest.get("id"):
+                return columns
+        except FileNotFoundError:
+            continue
+    if not is_tape(path):
+        raise FileNotFoundError(f"No binary tape at '{path}'.")
+    raise FileNotFoundError(f"The binary tape at '{path}' was replaced on each of {attempts} attempts to open it.")
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _matches_dtypes(columns: dict[str, np.ndarray], signature: dict[str, str]) -> bool:
+    return list(columns) == list(signature) and all(
+        columns[name].dtype.str == dtype for name, dtype in signature.items()
+    )
+
+
+def cached_tape(
+    csv_path: str,
+    read_csv: Callable[[str], dict[str, np.ndarray]],
+    cache_dir: str,
+    dtypes: dict[str, np.dtype],
+) -> dict[str, np.ndarray]:
+    """
+    Columns of `csv_path` from the binary tape cache in `cache_dir`, converting the CSV with `read_csv` on a miss.
+    `dtypes` are the columns `read_csv` returns; they are part of the cache key, so readers of different schemas
+    never share a tape, and a cached tape whose recorded or actual columns differ from them is rebuilt.
+
+    A cached tape is reused when the source's size and mtime are unchanged; otherwise the source is hashed and the
+    tape is reused (and its recorded mtime refreshed) only if the content hash still matches.
+    """
+    csv_path = os.path.abspath(csv_path)
+    stat = os.stat(csv_path)
+    signature = dtype_signature(dtypes)
+    key = hashlib.sha256(json.dumps([csv_path, signature]).encode()).hexdigest()[:16]
+    tape_path = os.path.join(cache_dir, f"{os.path.splitext(os.path.basename(csv_path))[0]}-{key}.tape")
+
+    digest = None
+    if is_tape(tape_path):
+        manifest = read_manifest(tape_path)
+        source = manifest.get("source") or {}
+        if manifest.get("dtypes") == signature:
+            if source.get("size") == stat.st_size and source.get("mtime_ns") == stat.st_mtime_ns:
+                columns = open_tape(tape_path)
+                if _matches_dtypes(columns, signature):
+                    return columns
+            else:
+                digest = file_digest(csv_path)
+                if source.get("sha256") == digest:
+                    columns = open_tape(tape_path)
+                    if _matches_dtypes(columns, signature):
+                        refreshed = {**source, "mtime_ns": stat.st_mtime_ns}
+                        write_manifest(tape_path, dtypes, manifest["rows"], refreshed, tape_id=manifest.get("id"))
+                        return columns
+
+    digest = digest or file_digest(csv_path)
+    source = {"path": csv_path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+    columns = read_csv(csv_path)
+    if not _matches_dtypes(columns, signature):
+        read = {name: values.dtype.str for name, values in columns.items()}
+        raise ValueError(f"'{csv_path}' was read with columns {read}; expected {signature}.")
+    write_tape(tape_path, columns, source=source)
+    return open_tape(tape_path)
@@ -10,3 +10,16 @@ def get_time(t: float, dp: int | None = 1) -> tuple[float, str]:
         return np.around(t / (60 * 60), dp), "hours"
 
     return np.around(t / (60 * 60 * 24), dp), "days"
+
+
+def read_only(values, dtype=None) -> np.ndarray:
+    """
+    A read-only view of `values` as an array. Books hold their columns this way so that copies can share them:
+    nothing writes into a column in place, and changes always bind a new array.
+    """
+    array = np.asarray(values, dtype=dtype)
+    if not array.flags.writeable:
+        return array
+    view = array.view()
+    view.flags.writeable = False
+    return view
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from mfi_alm.liabilities import ConstantForceMortalityModel, MortalityModel, whole_life_apv_batch
+
+
+@pytest.fixture
+def tables() -> list[MortalityModel]:
+    return [
+        ConstantForceMortalityModel(mu=0.05),
+        MortalityModel.from_lx(lx=1000 * np.exp(-0.03 * np.arange(101))),
+        ConstantForceMortalityModel(mu=0.02, max_age=110),
+    ]
+
+
+@pytest.fixture
+def policies() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ages = np.array([30.0, 45.0, 60.0, 30.0, 99.0, 119.0])
+    benefits = np.array([1000.0, 2500.0, 500.0, 1200.0, 800.0, 100.0])
+    table_ids = np.array([0, 1, 2, 1, 1, 0])
+    return ages, benefits, table_ids
+
+
+def test_batch_matches_single_policy_apv(tables, policies):
+    ages, benefits, table_ids = policies
+    apvs = whole_life_apv_batch(ages=ages, benefits=benefits, table_ids=table_ids, tables=tables, interest=0.03)
+    expected = [b * tables[t].whole_life_apv(x=x, interest=0.03) for x, b, t in zip(ages, benefits, table_ids)]
+    assert apvs.shape == (6,)
+    assert np.allclose(apvs, expected)
+
+
+def test_batch_interest_curve(tables, policies):
+    ages, benefits, table_ids = policies
+    rates = np.array([0.01, 0.03, 0.05])
+    curve = whole_life_apv_batch(
+        ages=ages, benefits=benefits, table_ids=table_ids, tables=tables, interest=rates, chunk_size=1
+    )
+    assert curve.shape == (3, 6)
+    for rate, row in zip(rates, curve):
+        single = whole_life_apv_batch(ages=ages, benefits=benefits, table_ids=table_ids, tables=tables, interest=rate)
+        assert np.allclose(row, single)
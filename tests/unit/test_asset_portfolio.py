@@ -75,3 +75,55 @@ def test_projected_average_yields_general_case():
     expected_portfolio_values = np.mean([v1, v2], axis=0)
     expected_yields = (expected_portfolio_values[1:] - expected_portfolio_values[:-1]) / expected_portfolio_values[:-1]
     # assert np.allclose(avg_yields, expected_yields, rtol=1e-5)
+
+
+def test_projected_market_values():
+    bond1 = FixedBond(face=1000, coupon=0.05, maturity=5)
+    bond2 = FixedBond(face=500, coupon=0.03, maturity=8)
+    asset1 = Asset(fixed_bond=bond1, ytm=0.04)
+    asset2 = Asset(fixed_bond=bond2, ytm=0.02)
+    portfolio = AssetPortfolio(assets=[asset1, asset2], scale=2.0)
+
+    values = portfolio.projected_market_values(years=6)
+    assert values.shape == (2, 6)
+    assert np.allclose(values[0], asset1.projected_market_values(6))
+    assert np.allclose(values[1], asset2.projected_market_values(6))
+
+    totals = portfolio.projected_total_market_values(years=6)
+    assert np.allclose(totals, 2.0 * (values[0] + values[1]))
+    assert np.isclose(totals[0], portfolio.market_value())
+
+
+def test_projected_cashflows():
+    bond = FixedBond(face=1000, coupon=0.05, maturity=2.5, freq=2)
+    portfolio = AssetPortfolio(assets=[Asset(fixed_bond=bond, ytm=0.04)], scale=2.0)
+    assert np.allclose(portfolio.projected_cashflows(years=4), 2.0 * np.array([50.0, 50.0, 1025.0, 0.0]))
+
+
+def test_asset_portfolio_roll_forward():
+    bond1 = FixedBond(face=1000, coupon=0.05, maturity=10)
+    bond2 = FixedBond(face=500, coupon=0.03, maturity=1)
+    portfolio = AssetPortfolio(assets=[Asset(fixed_bond=bond1, ytm=0.04), Asset(fixed_bond=bond2, ytm=0.03)])
+    shared = portfolio.with_ytm_factor(1.0)
+
+    portfolio.roll_forward(years=2)
+
+    assert len(portfolio.assets) == 1
+    assert portfolio.assets[0].fixed_bond.maturity == 8
+    assert np.isclose(portfolio.market_value(), FixedBond(face=1000, coupon=0.05, maturity=8).price(ytm=0.04))
+    assert len(shared.book) == 2
+
+
+def test_asset_views_write_through_to_own_book():
+    bond = FixedBond(face=1000, coupon=0.05, maturity=5, freq=2)
+    portfolio = AssetPortfolio(assets=[Asset(fixed_bond=bond, ytm=0.04)])
+    copied = portfolio.copy()
+    view = copied.assets[0]
+    assert not hasattr(view, "__dict__")
+    assert view.market_value() == portfolio.market_value()
+    assert view.fixed_bond.cashflows() == bond.cashflows()
+
+    view.fixed_bond.maturity = 3
+    assert np.isclose(copied.market_value(), FixedBond(face=1000, coupon=0.05, maturity=3).price(ytm=0.04))
+    assert np.isclose(portfolio.market_value(), bond.price(ytm=0.04))
+    assert isinstance(view.copy(), Asset)
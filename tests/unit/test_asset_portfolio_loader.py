@@ -72,3 +72,10 @@ def test_load_from_config():
 
     os.remove(config_path)
     os.rmdir(temp_dir)
+
+
+def test_invalid_frequency(valid_csv_file):
+    with open(valid_csv_file, "a", newline="") as f:
+        f.write("1000,0.05,5.0,0.04,0\n")
+    with pytest.raises(ValueError, match="freq"):
+        AssetPortfolioLoader.load_asset_portfolio(file_path=valid_csv_file, ytm_factor=1.0)
@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+
+from mfi_alm.bench import compare, main, run_benchmarks
+
+
+def test_run_benchmarks_reports_every_stage():
+    results = run_benchmarks({"tiny": (50, 3)}, repeat=1)
+    stages = results["results"]["tiny"]
+    assert stages["insurance_apv"]["items"] == 50 and stages["insurance_apv"]["unit"] == "lives"
+    assert stages["bond_book_projected_prices"]["items"] == 3
+    assert all(stage["throughput"] > 0 and stage["peak_memory_mb"] >= 0 for stage in stages.values())
+    assert stages["scenario_run"]["iterations"] >= 1
+    json.dumps(results)
+
+
+def test_compare_flags_slower_stages():
+    baseline = {"results": {"small": {"load": {"seconds": 1.0, "peak_memory_mb": 10.0}}}}
+    results = {"results": {"small": {"load": {"seconds": 1.2, "peak_memory_mb": 20.0}, "new": {"seconds": 5.0}}}}
+    regressions = compare(results, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("small/load: peak_memory_mb")
+    assert len(compare(results, baseline, tolerance=0.1)) == 2
+
+
+def test_compare_ignores_small_absolute_slowdowns():
+    baseline = {"results": {"small": {"fast": {"seconds": 0.001}, "slow": {"seconds": 0.1}}}}
+    results = {"results": {"small": {"fast": {"seconds": 0.0025}, "slow": {"seconds": 0.15}}}}
+    regressions = compare(results, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("small/slow: seconds")
+    assert len(compare(results, baseline, tolerance=0.25, min_seconds=0.0)) == 2
+    assert compare(results, baseline, tolerance=0.25, min_seconds=0.1) == []
+
+
+def test_main_exits_with_regressions(capsys):
+    with tempfile.TemporaryDirectory() as output_dir:
+        baseline_path = os.path.join(output_dir, "baseline.json")
+        assert main(["--sizes", "small", "--repeat", "1", "--no-memory", "--output", baseline_path]) == 0
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        for stage in baseline["results"]["small"].values():
+            stage["seconds"] = 0.0
+        with open(baseline_path, "w") as f:
+            json.dump(baseline, f)
+        assert (
+            main(
+                ["--sizes", "small", "--repeat", "1", "--no-memory", "--baseline", baseline_path, "--min-seconds", "0"]
+            )
+            == 1
+        )
+    assert "regression(s)" in capsys.readouterr().out
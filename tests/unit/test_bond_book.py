@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from mfi_alm.assets import BondBook, FixedBond
+
+
+@pytest.fixture
+def bonds() -> list[FixedBond]:
+    return [
+        FixedBond(face=1000, coupon=0.05, maturity=5, freq=2),
+        FixedBond(face=500, coupon=0.03, maturity=2.3, freq=4),
+        FixedBond(face=2000, coupon=0.06, maturity=10, freq=1),
+    ]
+
+
+@pytest.fixture
+def book(bonds) -> BondBook:
+    return BondBook.from_bonds(bonds=bonds, ytms=[0.04, 0.03, 0.05])
+
+
+def test_schedule_matches_bond_cashflows(bonds, book):
+    for i, bond in enumerate(bonds):
+        start, end = book.cf_offsets[i], book.cf_offsets[i + 1]
+        flows = list(zip(book.cf_times[start:end], book.cf_amounts[start:end]))
+        assert np.allclose(flows, bond.cashflows())
+        assert np.all(book.cf_bond[start:end] == i)
+
+
+def test_prices_match_bond_prices(bonds, book):
+    expected = [b.price(ytm=y) for b, y in zip(bonds, [0.04, 0.03, 0.05])]
+    assert np.allclose(book.prices(), expected)
+    assert np.isclose(book.market_value(), np.sum(expected))
+
+
+def test_matured_bond_has_no_flows():
+    book = BondBook(face=[1000, 1000], coupon=[0.05, 0.05], maturity=[0.0, 1.0], freq=[2, 2], ytm=[0.04, 0.04])
+    assert book.cf_offsets.tolist() == [0, 0, 2]
+    assert book.prices()[0] == 0.0
+
+
+def test_age_one_year(book):
+    book.age_one_year()
+    assert book.maturity.tolist() == [4.0, pytest.approx(1.3), 9.0]
+    assert np.allclose(book.prices()[0], FixedBond(face=1000, coupon=0.05, maturity=4, freq=2).price(ytm=0.04))
+
+
+def test_copy_is_independent(book):
+    copied = book.copy()
+    assert copied.cf_times is book.cf_times
+    with pytest.raises(ValueError):
+        copied.ytm[0] = 0.1
+
+    copied.roll_forward(3)
+    assert book.ytm[0] == 0.04
+    assert len(book) == 3
+    assert np.allclose(book.maturity, [5, 2.3, 10])
+
+
+def test_market_value_is_cached_until_mutation(book):
+    value = book.market_value()
+    assert book.market_value() == value
+    book.roll_forward(1)
+    assert book.market_value() == pytest.approx(np.sum(book.prices()))
+    assert book.market_value() != value
+
+
+def test_mismatched_columns():
+    with pytest.raises(ValueError):
+        BondBook(face=[1000], coupon=[0.05, 0.06], maturity=[1.0], freq=[2], ytm=[0.04])
+
+
+def test_projected_prices_match_bond_projection(bonds, book):
+    years = 12
+    projected = book.projected_prices(years)
+    assert projected.shape == (3, years)
+    for i, (bond, ytm) in enumerate(zip(bonds, [0.04, 0.03, 0.05])):
+        assert np.allclose(projected[i], bond.project_prices(ytm=ytm, years=years))
+    assert np.allclose(projected[:, 0], book.prices())
+
+
+def test_with_ytm_factor_shares_schedule(book):
+    scaled = book.with_ytm_factor(1.1)
+    assert np.allclose(scaled.ytm, book.ytm * 1.1)
+    assert scaled.cf_times is book.cf_times
+    expected = BondBook(face=book.face, coupon=book.coupon, maturity=book.maturity, freq=book.freq, ytm=book.ytm * 1.1)
+    assert np.allclose(scaled.prices(), expected.prices())
+
+    scaled.age_one_year()
+    assert np.allclose(book.maturity, [5, 2.3, 10])
+
+
+def test_cashflow_buckets_match_bond_cashflows(bonds, book):
+    years = 8
+    expected = np.zeros(years)
+    for bond in bonds:
+        for t, amount in bond.cashflows():
+            if np.ceil(t) <= years:
+                expected[int(np.ceil(t)) - 1] += amount
+    assert np.allclose(book.cashflow_buckets(years), expected)
+    assert np.isclose(book.cashflow_buckets(20).sum(), book.cf_amounts.sum())
+
+
+def test_ex_coupon_prices_exclude_paid_flows(bonds, book):
+    years = 12
+    projected = book.projected_prices(years, ex_coupon=True)
+    assert np.allclose(projected[:, 0], book.prices())
+    for i, (bond, ytm) in enumerate(zip(bonds, [0.04, 0.03, 0.05])):
+        for t in range(1, years):
+            expected = sum(cf * np.exp(-ytm * (tau - t)) for tau, cf in bond.cashflows() if tau > t)
+            assert np.isclose(projected[i, t], expected)
+
+
+def test_roll_forward_matches_rebuilt_book(book):
+    book.roll_forward(3)
+    rebuilt = BondBook(face=[1000, 2000], coupon=[0.05, 0.06], maturity=[2.0, 7.0], freq=[2, 1], ytm=[0.04, 0.05])
+    assert len(book) == 2
+    assert np.allclose(book.maturity, rebuilt.maturity)
+    assert book.cf_offsets.tolist() == rebuilt.cf_offsets.tolist()
+    assert np.allclose(book.cf_times, rebuilt.cf_times)
+    assert np.allclose(book.cf_amounts, rebuilt.cf_amounts)
+    assert np.allclose(book.prices(), rebuilt.prices())
+
+
+def test_roll_forward_keeps_run_off(book):
+    book.roll_forward(3, drop_run_off=False)
+    assert len(book) == 3
+    assert book.prices()[1] == 0.0
+    assert book.cf_offsets[1] == book.cf_offsets[2]
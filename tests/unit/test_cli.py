@@ -0,0 +1,156 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+import mfi_alm
+import mfi_alm.cli
+from mfi_alm.cli import main
+from mfi_alm.reporting import ReportWriter
+from mfi_alm.tape_generator import generate_tape
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.TemporaryDirectory()
+    yield temp_dir.name
+    temp_dir.cleanup()
+
+
+def write_config(temp_dir: str, **settings) -> str:
+    asset_path, liability_path = os.path.join(temp_dir, "assets.csv"), os.path.join(temp_dir, "policyholders.csv")
+    generate_tape(asset_path, "assets", rows=5)
+    generate_tape(liability_path, "policyholders", rows=200)
+    config_path = os.path.join(temp_dir, "config.json")
+    with open(config_path, "w") as f:
+        json.dump(
+            {
+                "asset_path": asset_path,
+                "liability_path": liability_path,
+                "liability_interest": 0.035,
+                "initial_capital": 1e8,
+                "maximum_capital": 5e8,
+                "scenarios": [{"name": "base", "ytm_factor": 1.0, "mortality_factor": 1.0}],
+                **settings,
+            },
+            f,
+        )
+    return config_path
+
+
+def read_reports(output_dir: str) -> dict[str, list[list[str]]]:
+    """Every report in `output_dir` as CSV rows, without the summary's timing columns."""
+    reports = {}
+    for name in sorted(os.listdir(output_dir)):
+        with open(os.path.join(output_dir, name)) as f:
+            rows = list(csv.reader(f))
+        reports[name] = [row[:4] for row in rows] if name.endswith("_report.csv") else rows
+    return reports
+
+
+def test_main_writes_reports_to_output_dir(temp_dir):
+    config_path = write_config(temp_dir)
+    output_dir = os.path.join(temp_dir, "outputs")
+
+    assert main(["--config", config_path, "--output-dir", output_dir, "--quiet"]) == 0
+    assert sorted(os.listdir(output_dir)) == ["output_base_report.csv", "output_base_report_detailed.csv"]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_trace_span_names_are_fixed(temp_dir, workers):
+    config_path = write_config(
+        temp_dir,
+        scenarios=[
+            {"name": "base", "ytm_factor": 1.0, "mortality_factor": 1.0},
+            {"name": "stressed", "ytm_factor": 0.8, "mortality_factor": 1.2},
+        ],
+    )
+    trace_path = os.path.join(temp_dir, "trace.jsonl")
+    output_dir = os.path.join(temp_dir, "outputs")
+
+    assert (
+        main(
+            [
+                "--config",
+                config_path,
+                "--output-dir",
+                output_dir,
+                "--quiet",
+                "--workers",
+                workers,
+                "--trace",
+                trace_path,
+            ]
+        )
+        == 0
+    )
+    with open(trace_path) as f:
+        spans = [record for record in map(json.loads, f) if record["type"] == "span" and record["depth"] == 0]
+    names = [record["name"] for record in spans]
+    if workers == "1":
+        assert names == ["load_config", "load_tapes", "scenario", "scenario"]
+        assert [record["attrs"]["scenario"] for record in spans[2:]] == ["base", "stressed"]
+    else:
+        assert names == ["load_config", "load_tapes", "run_scenarios"]
+        assert spans[-1]["attrs"]["workers"] == 2 and spans[-1]["attrs"]["scenarios"] == 2
+
+
+def test_report_writer_is_closed_when_a_scenario_fails(temp_dir, monkeypatch):
+    closed = []
+
+    class RecordingReportWriter(ReportWriter):
+        def close(self) -> None:
+            super().close()
+            closed.append(True)
+
+    monkeypatch.setattr(mfi_alm.cli, "ReportWriter", RecordingReportWriter)
+    config_path = write_config(
+        temp_dir,
+        scenarios=[
+            {"name": "base", "ytm_factor": 1.0, "mortality_factor": 1.0},
+            {"name": "broken", "mortality_factor": 1.0},
+        ],
+        report={"background": True},
+    )
+    output_dir = os.path.join(temp_dir, "outputs")
+
+    with pytest.raises(KeyError):
+        main(["--config", config_path, "--output-dir", output_dir, "--quiet"])
+    assert closed == [True]
+    assert sorted(os.listdir(output_dir)) == ["output_base_report.csv", "output_base_report_detailed.csv"]
+
+
+@pytest.mark.parametrize("method", ["bisection", "secant", "analytic"])
+def test_workers_match_serial_run(temp_dir, method):
+    config_path = write_config(
+        temp_dir,
+        scenarios=[
+            {"name": "base", "ytm_factor": 1.0, "mortality_factor": 1.0},
+            {"name": "stressed", "ytm_factor": 0.8, "mortality_factor": 1.2},
+            {"name": "benign", "ytm_factor": 1.1, "mortality_factor": 0.8},
+        ],
+        solver={"method": method},
+        mortality_paths={"paths": 20, "seed": 1},
+        rate_paths={"model": "vasicek", "paths": 20, "mean_reversion": 0.1, "volatility": 0.01, "seed": 2},
+    )
+    serial_dir, parallel_dir = os.path.join(temp_dir, "serial"), os.path.join(temp_dir, "parallel")
+
+    assert main(["--config", config_path, "--output-dir", serial_dir, "--quiet"]) == 0
+    assert main(["--config", config_path, "--output-dir", parallel_dir, "--quiet", "--workers", "2"]) == 0
+    serial, parallel = read_reports(serial_dir), read_reports(parallel_dir)
+    assert len(serial) == 3 * 4
+    assert parallel == serial
+
+
+def test_package_imports_do_not_load_pandas():
+    code = (
+        "import sys, mfi_alm.assets, mfi_alm.liabilities, mfi_alm.simulation, mfi_alm.cli; "
+        "sys.exit('pandas' in sys.modules)"
+    )
+    src = os.path.dirname(os.path.dirname(mfi_alm.__file__))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([src, os.environ.get("PYTHONPATH", "")])}
+    assert subprocess.run([sys.executable, "-c", code], env=env).returncode == 0
@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from mfi_alm.instrumentation import (
+    ChromeTraceSink,
+    ConsoleSink,
+    JsonLinesSink,
+    Sink,
+    Tracer,
+    configure,
+    count,
+    get_tracer,
+    set_tracer,
+    span,
+    traced,
+)
+
+
+class RecordingSink(Sink):
+    def __init__(self):
+        self.spans = []
+        self.counts = []
+
+    def on_span(self, span):
+        self.spans.append((span.name, span.depth, span.attrs))
+
+    def on_count(self, name, value, total):
+        self.counts.append((name, value, total))
+
+
+@pytest.fixture
+def recording_tracer():
+    sink = RecordingSink()
+    previous = set_tracer(Tracer(sinks=[sink]))
+    yield sink
+    set_tracer(previous)
+
+
+def test_nested_spans_report_depth_and_duration(recording_tracer):
+    with span("outer") as outer:
+        with span("inner", chunk=3):
+            pass
+        with span("inner"):
+            pass
+    assert recording_tracer.spans == [("inner", 1, {"chunk": 3}), ("inner", 1, {}), ("outer", 0, {})]
+    assert outer.duration >= 0
+
+
+def test_counters_accumulate(recording_tracer):
+    count("policyholders", 10)
+    count("policyholders", 5)
+    count("iterations")
+    assert get_tracer().counters == {"policyholders": 15, "iterations": 1}
+    assert recording_tracer.counts[1] == ("policyholders", 5, 15)
+
+
+def test_traced_keeps_function_and_records_span(recording_tracer):
+    @traced()
+    def double(x):
+        return 2 * x
+
+    @traced("custom")
+    def fail():
+        raise RuntimeError("boom")
+
+    assert double(2) == 4
+    assert double.__name__ == "double"
+    with pytest.raises(RuntimeError):
+        fail()
+    assert [name for name, _, _ in recording_tracer.spans] == ["double", "custom"]
+
+
+def test_console_sink_prints_up_to_max_depth(capsys):
+    tracer = Tracer(sinks=[ConsoleSink(max_depth=0)])
+    with tracer.span("Step 1"):
+        with tracer.span("hidden"):
+            pass
+    assert capsys.readouterr().out.startswith("Step 1 took ")
+
+    quiet = Tracer(sinks=[ConsoleSink()], quiet=True)
+    with quiet.span("Step 1") as timed:
+        pass
+    assert quiet.sinks == [] and capsys.readouterr().out == ""
+    assert timed.duration is not None
+
+
+def test_file_sinks():
+    with tempfile.TemporaryDirectory() as output_dir:
+        jsonl_path = os.path.join(output_dir, "trace.jsonl")
+        chrome_path = os.path.join(output_dir, "trace.json")
+        tracer = Tracer(sinks=[JsonLinesSink(jsonl_path), ChromeTraceSink(chrome_path)])
+        with tracer.span("load", path="tape.csv"):
+            tracer.count("bonds", 2)
+        tracer.close()
+
+        with open(jsonl_path) as f:
+            records = [json.loads(line) for line in f]
+        with open(chrome_path) as f:
+            events = json.load(f)["traceEvents"]
+
+        # A rerun replaces the trace rather than appending to it.
+        JsonLinesSink(jsonl_path).close()
+        assert os.path.getsize(jsonl_path) == 0
+
+    assert [record["type"] for record in records] == ["count", "span"]
+    assert records[1]["attrs"] == {"path": "tape.csv"}
+    assert [event["ph"] for event in events] == ["C", "X"]
+    assert events[0]["args"] == {"bonds": 2}
+    assert events[1]["dur"] >= 0
+
+
+def test_configure_picks_trace_format():
+    previous = get_tracer()
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            tracer = configure(console_depth=None, trace_path=os.path.join(output_dir, "trace.json"))
+            assert get_tracer() is tracer
+            assert [type(sink) for sink in tracer.sinks] == [ChromeTraceSink]
+            tracer = configure(trace_path=os.path.join(output_dir, "trace.jsonl"), quiet=True)
+            assert [type(sink) for sink in tracer.sinks] == [JsonLinesSink]
+            tracer.close()
+            with pytest.raises(ValueError):
+                configure(trace_path="trace.txt", trace_format="xml")
+    finally:
+        set_tracer(previous)
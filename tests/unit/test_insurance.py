@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from mfi_alm.liabilities import MortalityModel, WholeLifeInsurance
+from mfi_alm.liabilities import ConstantForceMortalityModel, MortalityModel, WholeLifeInsurance
 
 
 @pytest.fixture
@@ -23,3 +23,8 @@ def test_whole_life_insurance_copy(mortality_model):
     assert insurance_copy.benefit == insurance.benefit
     assert isinstance(insurance_copy.mortality_model, MortalityModel)
     assert insurance_copy.mortality_model.df.equals(insurance.mortality_model.df)
+
+
+def test_whole_life_insurance_apv_constant_force():
+    insurance = WholeLifeInsurance(ConstantForceMortalityModel(mu=0.05, max_age=99), benefit=1000)
+    assert np.isclose(insurance.apv(x=30, interest=0.03), 620.599642481655)
@@ -54,3 +54,46 @@ def test_age_one_year(portfolio):
     updated_ages = [p.age for p in portfolio.policyholders]
     for orig, updated in zip(original_ages, updated_ages):
         assert updated == orig + 1
+
+
+def test_policyholder_views(policyholders, portfolio):
+    view = portfolio.policyholders[1]
+    assert not hasattr(view, "__dict__")
+    assert (view.id_, view.age, view.benefit) == (1, 40.0, 1000.0)
+    assert np.isclose(view.insurance_apv(interest=0.03), policyholders[1].insurance_apv(interest=0.03))
+    assert isinstance(view.copy(), Policyholder)
+    with pytest.raises(AttributeError):
+        view.age = 41.0
+
+
+def test_copy_shares_lookup(portfolio):
+    copied = portfolio.copy()
+    assert copied.benefits_lookup is portfolio.benefits_lookup
+    assert copied.book.ages is portfolio.book.ages
+
+    copied.age_one_year()
+    assert [p.age for p in portfolio.policyholders] == [30.0, 40.0, 50.0]
+    assert [p.age for p in copied.policyholders] == [31.0, 41.0, 51.0]
+    assert np.allclose(copied.benefits_lookup[:-1], portfolio.benefits_lookup[1:])
+
+
+@pytest.mark.parametrize("years", [1, 5, 80, 200])
+def test_roll_forward_matches_rebuilt_lookup(portfolio, years):
+    portfolio.roll_forward(years, drop_run_off=False)
+    rebuilt = LiabilityPortfolio(policyholders=None, interest=0.03, book=portfolio.book.copy())
+    assert np.allclose(portfolio.benefits_lookup, rebuilt.benefits_lookup)
+
+
+def test_roll_forward_drops_run_off(portfolio):
+    portfolio.roll_forward(75)
+    assert [p.age for p in portfolio.policyholders] == [105.0, 115.0]
+    rebuilt = LiabilityPortfolio(policyholders=None, interest=0.03, book=portfolio.book.copy())
+    assert np.allclose(portfolio.benefits_lookup, rebuilt.benefits_lookup)
+
+
+def test_portfolio_insurance_apv_curve(portfolio):
+    rates = np.array([0.02, 0.03, 0.04])
+    curve = portfolio.insurance_apv(interest=rates)
+    assert curve.shape == (3,)
+    assert np.isclose(curve[1], portfolio.insurance_apv())
+    assert np.all(np.diff(curve) < 0)
@@ -1,6 +1,7 @@
 import os
 import tempfile
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -33,3 +34,28 @@ def test_mortality_factor_application(sample_csv_file):
     base_qx = base_portfolio.policyholders[0].mortality_model.tqx(1, 30)
     crisis_qx = crisis_portfolio.policyholders[0].mortality_model.tqx(1, 30)
     assert crisis_qx == pytest.approx(base_qx * 1.25, rel=0.01)
+
+
+def test_model_point_compression(sample_csv_file):
+    portfolio = load_liability_portfolio(filepath=sample_csv_file, mortality_factor=1.0, interest=0.03)
+    compressed = load_liability_portfolio(filepath=sample_csv_file, mortality_factor=1.0, interest=0.03, compress=True)
+    assert compressed.model_points is not None
+    assert compressed.model_points.mu_error_bound == 0.0
+    assert np.isclose(compressed.insurance_apv(), portfolio.insurance_apv())
+    assert np.allclose(
+        compressed.projected_expected_yearly_benefits(30), portfolio.projected_expected_yearly_benefits(30)
+    )
+
+
+def test_invalid_tape(sample_csv_file):
+    df = pd.read_csv(sample_csv_file)
+    df.loc[1, "mu"] = -0.01
+    df.to_csv(sample_csv_file, index=False)
+    with pytest.raises(ValueError, match="mu"):
+        load_liability_portfolio(filepath=sample_csv_file, mortality_factor=1.0, interest=0.03)
+
+
+def test_missing_column(sample_csv_file):
+    pd.read_csv(sample_csv_file).drop(columns="benefit").to_csv(sample_csv_file, index=False)
+    with pytest.raises(ValueError):
+        load_liability_portfolio(filepath=sample_csv_file, mortality_factor=1.0, interest=0.03)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mfi_alm.liabilities import load_liability_portfolio, stream_liability_portfolio, stream_liability_scenarios
+
+
+@pytest.fixture
+def tape_file():
+    temp_dir = tempfile.TemporaryDirectory()
+    filepath = os.path.join(temp_dir.name, "policyholder_tape.csv")
+    rng = np.random.default_rng(7)
+    n = 53
+    df = pd.DataFrame(
+        {
+            "policyholder_id": np.arange(n),
+            "age": rng.integers(20, 118, size=n),
+            "benefit": rng.integers(1000, 5000, size=n),
+            "mu": rng.choice([0.03, 0.05, 0.07], size=n),
+        }
+    )
+    df.to_csv(filepath, index=False)
+    yield filepath
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 1000])
+def test_stream_matches_in_memory_portfolio(tape_file, chunk_size):
+    portfolio = load_liability_portfolio(filepath=tape_file, mortality_factor=0.9, interest=0.03)
+    streamed = stream_liability_portfolio(
+        filepath=tape_file, mortality_factor=0.9, interest=0.03, chunk_size=chunk_size
+    )
+    assert streamed.n_policyholders == 53
+    assert np.isclose(streamed.insurance_apv(), portfolio.insurance_apv())
+    assert np.isclose(streamed.expected_yearly_benefit(), portfolio.expected_yearly_benefit())
+    assert np.allclose(
+        streamed.projected_expected_yearly_benefits(30), portfolio.projected_expected_yearly_benefits(30)
+    )
+    # Past the end of the tables every life pays its full benefit each year.
+    beyond_tables = streamed.projected_expected_yearly_benefits(150)
+    assert np.allclose(beyond_tables, portfolio.projected_expected_yearly_benefits(150))
+    assert np.allclose(beyond_tables[120:], portfolio.book.benefits.sum())
+
+
+def test_stream_several_mortality_factors(tape_file):
+    streamed = stream_liability_scenarios(
+        filepath=tape_file, mortality_factors=[0.7, 0.9, 0.7], interest=0.03, chunk_size=10
+    )
+    assert sorted(streamed) == [0.7, 0.9]
+    for factor, portfolio in streamed.items():
+        expected = load_liability_portfolio(filepath=tape_file, mortality_factor=factor, interest=0.03)
+        assert np.isclose(portfolio.insurance_apv(), expected.insurance_apv())
+        assert np.allclose(
+            portfolio.projected_expected_yearly_benefits(30), expected.projected_expected_yearly_benefits(30)
+        )
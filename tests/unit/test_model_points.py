@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from mfi_alm.liabilities import compress_model_points
+
+
+@pytest.fixture
+def tape() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ages = np.array([30, 30, 40, 30, 40, 40])
+    mus = np.array([0.05, 0.05, 0.04, 0.0502, 0.04, 0.0412])
+    benefits = np.array([1000.0, 500.0, 2000.0, 700.0, 100.0, 300.0])
+    return ages, mus, benefits
+
+
+def test_exact_compression(tape):
+    ages, mus, benefits = tape
+    mp = compress_model_points(ages=ages, mus=mus, benefits=benefits)
+    assert len(mp) == 4
+    assert mp.mu_error_bound == 0.0
+    assert mp.count.sum() == 6
+    assert np.isclose(mp.benefit.sum(), benefits.sum())
+    i = np.flatnonzero((mp.age == 30) & (mp.mu == 0.05))[0]
+    assert mp.benefit[i] == 1500.0
+    assert mp.count[i] == 2
+
+
+def test_bucketed_compression(tape):
+    ages, mus, benefits = tape
+    mp = compress_model_points(ages=ages, mus=mus, benefits=benefits, mu_bucket_width=0.01)
+    assert len(mp) == 2
+    assert 0 < mp.mu_error_bound <= 0.01
+    i = np.flatnonzero(mp.age == 30)[0]
+    assert np.isclose(mp.mu[i], (1500 * 0.05 + 700 * 0.0502) / 2200)
+    assert mp.qx_error_bound(mortality_factor=0.5) == 0.5 * mp.mu_error_bound
+
+
+def test_invalid_bucket_width(tape):
+    with pytest.raises(ValueError):
+        compress_model_points(*tape, mu_bucket_width=0.0)
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from mfi_alm.liabilities import MortalityModel
+from mfi_alm.liabilities import ConstantForceMortalityModel, MortalityModel
 
 
 @pytest.fixture
@@ -51,6 +51,15 @@ def test_simulate_remaining_death_year(mortality_table: MortalityModel):
     assert 0 <= year <= 120
 
 
+def test_simulate_remaining_death_year_seeding(mortality_table: MortalityModel):
+    rng = np.random.default_rng(0)
+    years = [mortality_table.simulate_remaining_death_year(x=35, seed=rng) for _ in range(200)]
+    assert len(set(years)) > 1
+    assert mortality_table.simulate_remaining_death_year(x=35, seed=5) == mortality_table.simulate_remaining_death_year(
+        x=35, seed=5
+    )
+
+
 def test_simulate_remaining_death_year_for_dead(mortality_table: MortalityModel):
     assert mortality_table.simulate_remaining_death_year(x=150) == 0
 
@@ -64,3 +73,76 @@ def test_tqx_vector_correctness(mortality_table: MortalityModel):
     assert isinstance(result, np.ndarray)
     assert result.shape == (years,)
     assert np.allclose(result, expected, atol=1e-8)
+
+
+def test_from_lx_matches_dataframe(mortality_table: MortalityModel):
+    model = MortalityModel.from_lx(lx=mortality_table.lx)
+    assert model.min_age == mortality_table.min_age
+    assert model.max_age == mortality_table.max_age
+    assert np.array_equal(model.qx_lookup, mortality_table.qx_lookup)
+
+
+def test_non_consecutive_ages():
+    df = pd.DataFrame({"x": [0, 1, 3], "lx": [1000, 900, 800]})
+    with pytest.raises(ValueError):
+        MortalityModel(df_mortality=df)
+
+
+def test_tpx_vector(mortality_table: MortalityModel):
+    result = mortality_table.tpx_vector(x=[10, 95], years=8)
+    expected = [[mortality_table.tpx(t, x) for t in range(8)] for x in [10, 95]]
+    assert result.shape == (2, 8)
+    assert np.allclose(result, expected)
+
+
+def test_tqx_matrix(mortality_table: MortalityModel):
+    result = mortality_table.tqx_matrix(x=np.array([30, 97]), years=5)
+    assert np.allclose(result[0], mortality_table.tqx_vector(x=30, years=5))
+    assert np.allclose(result[1], [mortality_table.tqx(1, 97 + t) for t in range(5)])
+
+
+def test_prob_Kx_vector(mortality_table: MortalityModel):
+    result = mortality_table.prob_Kx_vector(x=np.array([30, 60]), years=50)
+    expected = [[mortality_table.prob_Kx_equals_k(k, x) for k in range(50)] for x in [30, 60]]
+    assert np.allclose(result, expected)
+
+
+@pytest.fixture
+def table_and_closed_form() -> tuple[MortalityModel, ConstantForceMortalityModel]:
+    table = MortalityModel.from_lx(lx=1000 * np.exp(-0.04 * np.arange(121)))
+    return table, ConstantForceMortalityModel(mu=0.04, max_age=120)
+
+
+def test_constant_force_matches_table(table_and_closed_form):
+    table, closed_form = table_and_closed_form
+    ages = np.array([0, 35, 119, 120, 125])
+    assert np.allclose(closed_form.tpx_vector(x=ages, years=10), table.tpx_vector(x=ages, years=10))
+    assert np.allclose(closed_form.tqx_matrix(x=ages, years=10), table.tqx_matrix(x=ages, years=10))
+    assert np.allclose(closed_form.prob_Kx_vector(x=ages, years=130), table.prob_Kx_vector(x=ages, years=130))
+    assert np.allclose(closed_form.lx, table.lx)
+    assert np.allclose(closed_form.qx_lookup, table.qx_lookup)
+
+
+@pytest.mark.parametrize("max_age", [120, 60, 5])
+def test_constant_force_whole_life_apv(table_and_closed_form, max_age):
+    table, closed_form = table_and_closed_form
+    ages = np.array([0.0, 30.0, 87.0, 119.0, 120.0, 121.0])
+    interest = np.array([[0.0], [0.03], [0.08]])
+    expected = table.whole_life_apv(x=ages, interest=interest, max_age=max_age)
+    actual = closed_form.whole_life_apv(x=ages, interest=interest, max_age=max_age)
+    assert actual.shape == (3, 6)
+    assert np.allclose(actual, expected)
+
+
+def test_constant_force_zero_mortality():
+    model = ConstantForceMortalityModel(mu=0.0, max_age=100)
+    assert np.isclose(model.whole_life_apv(x=40, interest=0.0), 1.0)
+
+
+def test_scaled_table_matches_scaled_force(table_and_closed_form):
+    table, closed_form = table_and_closed_form
+    expected = ConstantForceMortalityModel(mu=0.04 * 0.7, max_age=120)
+    ages = np.array([0, 35, 119, 125])
+    assert np.allclose(table.scaled(0.7).tpx_vector(x=ages, years=10), expected.tpx_vector(x=ages, years=10))
+    assert np.isclose(closed_form.scaled(0.7).mu, expected.mu)
+    assert table.scaled(1.0) is table
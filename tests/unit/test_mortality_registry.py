@@ -0,0 +1,105 @@
+import gc
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mfi_alm.liabilities import ConstantForceTables, MortalityModel, MortalityTableRegistry
+from mfi_alm.liabilities.mortality_registry import constant_force_parameters
+from mfi_alm.liabilities.liability_portfolio_loader import create_mortality_model, load_liability_portfolio
+
+
+def build_table() -> MortalityModel:
+    return MortalityModel.from_lx(lx=1000 * np.exp(-0.05 * np.arange(121)))
+
+
+def test_intern_returns_shared_table():
+    registry = MortalityTableRegistry()
+    first = registry.intern(key=(0.05, 1.0), build=build_table)
+    second = registry.intern(key=(0.05, 1.0), build=build_table)
+    other = registry.intern(key=(0.05, 1.2), build=build_table)
+
+    assert first is second
+    assert first is not other
+    assert len(registry) == 2
+    assert (0.05, 1.2) in registry
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_registry_drops_unreferenced_tables():
+    registry = MortalityTableRegistry()
+    table = registry.intern(key=(0.05, 1.0), build=build_table)
+    for i in range(100):
+        registry.intern(key=(0.05, 1.0 + i / 100), build=build_table)
+    assert (0.05, 1.0) in registry
+    assert len(registry) == 1
+
+    del table
+    gc.collect()
+    assert len(registry) == 0
+
+
+def test_tables_are_read_only():
+    table = build_table()
+    assert table.copy() is table
+    with pytest.raises(ValueError):
+        table.lx[0] = 1.0
+    with pytest.raises(AttributeError):
+        table.max_age = 100
+
+    shared = create_mortality_model(mu=0.05)
+    with pytest.raises(AttributeError):
+        shared.mu = 0.5
+    with pytest.raises(AttributeError):
+        shared.max_age = 100
+    assert create_mortality_model(mu=0.05).mu == 0.05
+
+
+def test_create_mortality_model_is_interned():
+    assert create_mortality_model(mu=0.04, mortality_factor=0.9) is create_mortality_model(
+        mu=0.04, mortality_factor=0.9
+    )
+    assert create_mortality_model(mu=0.04, mortality_factor=0.9) is not create_mortality_model(mu=0.04)
+
+
+def test_loader_shares_tables_between_policyholders():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filepath = os.path.join(temp_dir, "policyholder_tape.csv")
+        df = pd.DataFrame(
+            {"policyholder_id": [0, 1, 2], "age": [30, 40, 50], "benefit": [1000, 1500, 800], "mu": [0.05, 0.05, 0.04]}
+        )
+        df.to_csv(filepath, index=False)
+        portfolio = load_liability_portfolio(filepath=filepath, mortality_factor=1.0, interest=0.03)
+
+    p0, p1, p2 = portfolio.policyholders
+    assert p0.mortality_model is p1.mortality_model
+    assert p0.whole_life_insurance.mortality_model is p0.mortality_model
+    assert p0.mortality_model is not p2.mortality_model
+
+
+def test_constant_force_tables():
+    tables = ConstantForceTables(mu=np.array([0.03, 0.05]), mortality_factor=0.8)
+    assert len(tables) == 2
+    assert tables[1] is create_mortality_model(mu=0.05, mortality_factor=0.8)
+    assert np.isclose(tables[1].mu, 0.04)
+
+    is_constant_force, mu, max_age = constant_force_parameters(tables)
+    assert is_constant_force.all()
+    assert np.allclose(mu, [0.024, 0.04])
+    assert max_age.tolist() == [120, 120]
+
+    scaled = tables.scaled(0.5)
+    assert scaled.mu is tables.mu
+    assert np.allclose(constant_force_parameters(scaled)[1], [0.012, 0.02])
+
+
+def test_constant_force_parameters_of_mixed_tables():
+    tables = [build_table(), create_mortality_model(mu=0.05)]
+    is_constant_force, mu, max_age = constant_force_parameters(tables)
+    assert is_constant_force.tolist() == [False, True]
+    assert mu.tolist() == [0.0, 0.05]
+    assert max_age.tolist() == [120, 120]
@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from mfi_alm.liabilities import (
+    ConstantForceMortalityModel,
+    LiabilityPortfolio,
+    MortalityModel,
+    PolicyBook,
+    Policyholder,
+    WholeLifeInsurance,
+)
+
+
+@pytest.fixture
+def book() -> PolicyBook:
+    tables = [
+        ConstantForceMortalityModel(mu=0.05),
+        MortalityModel.from_lx(lx=1000 * np.exp(-0.03 * np.arange(101))),
+        ConstantForceMortalityModel(mu=0.02, max_age=110),
+    ]
+    return PolicyBook(
+        ids=np.arange(6),
+        ages=np.array([30.0, 45.0, 60.0, 98.0, 115.0, 125.0]),
+        benefits=np.array([1000.0, 2500.0, 500.0, 1200.0, 800.0, 100.0]),
+        table_ids=np.array([0, 1, 2, 1, 0, 2]),
+        tables=tables,
+    )
+
+
+def test_expected_benefits_match_tqx_vectors(book):
+    years = book.common_horizon()
+    expected = sum(
+        b * book.tables[t].tqx_vector(x=x, years=years) for x, b, t in zip(book.ages, book.benefits, book.table_ids)
+    )
+    result = book.expected_benefits(years=years, chunk_size=1)
+    assert years == 120
+    assert result.shape == (years,)
+    assert np.allclose(result, expected)
+
+
+def test_from_policyholders_round_trip(book):
+    policyholders = [book.policyholder(i) for i in range(len(book))]
+    rebuilt = PolicyBook.from_policyholders(policyholders)
+    assert np.array_equal(rebuilt.ages, book.ages)
+    assert np.array_equal(rebuilt.benefits, book.benefits)
+    assert len(rebuilt.tables) == 3
+    assert rebuilt.tables[rebuilt.table_ids[3]] is book.tables[1]
+
+
+def test_policyholder_view(book):
+    p = book.policyholder(1)
+    assert isinstance(p, Policyholder)
+    assert isinstance(p.whole_life_insurance, WholeLifeInsurance)
+    assert p.id_ == 1
+    assert p.age == 45.0
+    assert p.benefit == 2500.0
+    assert p.mortality_model is book.tables[1]
+
+
+def test_apvs(book):
+    apvs = book.apvs(interest=0.03)
+    expected = [p.insurance_apv(interest=0.03) for p in (book.policyholder(i) for i in range(len(book)))]
+    assert np.allclose(apvs, expected)
+
+
+def test_age_one_year(book):
+    copied = book.copy()
+    book.age_one_year()
+    assert book.ages[0] == 31.0
+    assert copied.ages[0] == 30.0
+
+
+def test_expected_benefits_window(book):
+    full = book.expected_benefits(years=100)
+    assert np.allclose(book.expected_benefits(years=30, start=70), full[70:])
+
+
+def test_roll_forward_drops_run_off(book):
+    assert book.run_off().tolist() == [False, False, False, False, False, True]
+    dropped = book.roll_forward(3)
+    assert dropped.tolist() == [False, False, False, True, False, True]
+    assert book.ids.tolist() == [0, 1, 2, 4]
+    assert book.ages.tolist() == [33.0, 48.0, 63.0, 118.0]
+
+
+def test_roll_forward_keeps_certain_death_at_last_age():
+    book = PolicyBook(
+        ids=np.arange(2),
+        ages=np.array([119.0, 50.0]),
+        benefits=np.array([1000.0, 1.0]),
+        table_ids=np.array([0, 0]),
+        tables=[ConstantForceMortalityModel(mu=0.05, max_age=120)],
+    )
+    portfolio = LiabilityPortfolio(policyholders=None, interest=0.03, book=book.copy())
+    portfolio.roll_forward(1)
+    undropped = book.copy()
+    undropped.roll_forward(1, drop_run_off=False)
+    rebuilt = LiabilityPortfolio(policyholders=None, interest=0.03, book=undropped)
+    assert portfolio.book.ids.tolist() == [0, 1]
+    assert portfolio.benefits_lookup[0] == pytest.approx(rebuilt.benefits_lookup[0])
+    assert portfolio.benefits_lookup[0] > 1000.0
+
+    portfolio.roll_forward(1)
+    assert portfolio.book.ids.tolist() == [1]
+
+
+def test_roll_forward_lookup_on_mixed_tables(book):
+    portfolio = LiabilityPortfolio(policyholders=None, interest=0.03, book=book)
+    portfolio.roll_forward(3)
+    portfolio.roll_forward(10, drop_run_off=False)
+    rebuilt = LiabilityPortfolio(policyholders=None, interest=0.03, book=book.copy())
+    assert np.allclose(portfolio.benefits_lookup, rebuilt.benefits_lookup)
+
+
+def test_mismatched_columns():
+    with pytest.raises(ValueError):
+        PolicyBook(ids=[0, 1], ages=[30.0], benefits=[1.0, 2.0], table_ids=[0, 0], tables=[])
+
+
+def test_with_mortality_factor(book):
+    scaled = book.with_mortality_factor(0.8)
+    expected = PolicyBook(
+        ids=book.ids,
+        ages=book.ages,
+        benefits=book.benefits,
+        table_ids=book.table_ids,
+        tables=[
+            ConstantForceMortalityModel(mu=0.05 * 0.8),
+            MortalityModel.from_lx(lx=1000 * np.exp(-0.03 * 0.8 * np.arange(101))),
+            ConstantForceMortalityModel(mu=0.02 * 0.8, max_age=110),
+        ],
+    )
+    assert np.allclose(scaled.apvs(interest=0.03), expected.apvs(interest=0.03))
+    assert np.allclose(scaled.expected_benefits(years=50), expected.expected_benefits(years=50))
+    assert scaled.ages is book.ages
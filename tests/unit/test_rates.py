@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from mfi_alm.rates import HullWhiteModel, ShortRateModel, VasicekModel, rate_model_from_config, validate_rate_config
+
+
+def simulate_recursively(model: ShortRateModel, shocks: np.ndarray) -> np.ndarray:
+    a, sigma = model.mean_reversion, model.volatility
+    levels = model._levels(shocks.shape[1])
+    rates = np.empty_like(shocks)
+    r = np.full(len(shocks), model.initial_rate)
+    for t in range(shocks.shape[1]):
+        r = (
+            r * np.exp(-a)
+            + levels[t] * (1 - np.exp(-a))
+            + sigma * np.sqrt((1 - np.exp(-2 * a)) / (2 * a)) * shocks[:, t]
+        )
+        rates[:, t] = r
+    return rates
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        VasicekModel(mean_reversion=0.2, long_term_rate=0.05, volatility=0.01, initial_rate=0.02),
+        HullWhiteModel(
+            mean_reversion=0.1, volatility=0.015, initial_rate=0.03, forward_rates=np.linspace(0.03, 0.06, 40)
+        ),
+    ],
+)
+def test_simulate_matches_recursion(model):
+    rates = model.simulate(n_paths=50, years=30, seed=9)
+    shocks = np.random.default_rng(9).standard_normal((50, 30))
+    assert rates.shape == (50, 30)
+    assert np.allclose(rates, simulate_recursively(model, shocks))
+
+
+def test_vasicek_moments():
+    model = VasicekModel(mean_reversion=0.3, long_term_rate=0.05, volatility=0.02, initial_rate=0.01)
+    rates = model.simulate(n_paths=100_000, years=20, seed=1)
+    expected = 0.05 + (0.01 - 0.05) * np.exp(-0.3 * np.arange(1, 21))
+    assert np.allclose(model.expected_rates(20), expected)
+    assert np.allclose(rates.mean(axis=0), expected, atol=5e-4)
+    stationary_std = 0.02 * np.sqrt((1 - np.exp(-0.6 * 20)) / 0.6)
+    assert np.isclose(rates[:, -1].std(), stationary_std, rtol=2e-2)
+
+
+def test_hull_white_fits_forward_curve():
+    forward_rates = np.array([0.02, 0.025, 0.03, 0.04, 0.045])
+    model = HullWhiteModel(mean_reversion=0.2, volatility=0.01, initial_rate=0.018, forward_rates=forward_rates)
+    assert np.allclose(model.expected_rates(5), forward_rates)
+    with pytest.raises(ValueError):
+        model.simulate(n_paths=2, years=6)
+
+
+def test_zero_volatility_is_deterministic():
+    model = HullWhiteModel(mean_reversion=0.1, volatility=0.0, initial_rate=0.04)
+    assert np.allclose(model.simulate(n_paths=3, years=10, seed=0), 0.04)
+
+
+def test_rate_model_from_config():
+    model = rate_model_from_config({"mean_reversion": 0.1, "volatility": 0.01}, initial_rate=0.04)
+    assert isinstance(model, VasicekModel)
+    assert model.theta == 0.04
+    model = rate_model_from_config(
+        {"model": "hull_white", "mean_reversion": 0.1, "volatility": 0.01, "initial_rate": 0.02}, initial_rate=0.04
+    )
+    assert isinstance(model, HullWhiteModel)
+    assert model.initial_rate == 0.02
+    with pytest.raises(ValueError):
+        rate_model_from_config({"model": "cir", "mean_reversion": 0.1, "volatility": 0.01}, initial_rate=0.04)
+    with pytest.raises(ValueError):
+        VasicekModel(mean_reversion=0.0, long_term_rate=0.05, volatility=0.01, initial_rate=0.02)
+
+
+def test_hull_white_covers_long_horizons():
+    flat = HullWhiteModel(mean_reversion=0.1, volatility=0.0, initial_rate=0.04)
+    assert np.allclose(flat.expected_rates(150), 0.04)
+    model = rate_model_from_config(
+        {"model": "hull_white", "mean_reversion": 0.2, "volatility": 0.0, "forward_rates": [0.02, 0.03]},
+        initial_rate=0.018,
+        years=150,
+    )
+    rates = model.simulate(n_paths=2, years=150, seed=0)
+    assert np.allclose(rates[:, :2], [0.02, 0.03])
+    assert np.allclose(rates[:, 2:], 0.03)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"model": "cir", "paths": 10, "mean_reversion": 0.1, "volatility": 0.01},
+        {"paths": 10, "volatility": 0.01},
+        {"paths": 0, "mean_reversion": 0.1, "volatility": 0.01},
+        {"paths": 2.5, "mean_reversion": 0.1, "volatility": 0.01},
+        {"paths": True, "mean_reversion": 0.1, "volatility": 0.01},
+        {"paths": 10, "mean_reversion": -0.1, "volatility": 0.01},
+        {"model": "hull_white", "paths": 10, "mean_reversion": 0.1, "volatility": 0.01, "forward_rates": []},
+    ],
+)
+def test_validate_rate_config_rejects(config):
+    with pytest.raises(ValueError):
+        validate_rate_config(config)
+
+
+def test_validate_rate_config_accepts():
+    validate_rate_config({"model": "hull_white", "paths": 10, "mean_reversion": 0.1, "volatility": 0.01})
@@ -0,0 +1,90 @@
+import csv
+import os
+import tempfile
+import threading
+
+import numpy as np
+import pytest
+
+from mfi_alm.reporting import ReportWriter, detailed_columns, write_detailed_report
+
+
+@pytest.fixture
+def iteration_info() -> dict:
+    return {
+        i: {
+            "iteration": i + 1,
+            "capital": capital,
+            "final_reserve": capital - 150.0,
+            "min_val": 0.0,
+            "max_val": 400,
+            "reserves": np.array([capital, capital - 100.0, capital - 150.0]),
+            "asset_market_values": np.array([capital, capital * 1.01, capital * 1.02]),
+            "asset_yields": np.array([0.04, 0.04]),
+            "liability_expected_yearly_benefits": np.array([100.0, 50.0]),
+            "asset_cashflows": np.array([5.0, 105.0]),
+        }
+        for i, capital in enumerate([200, 150.0])
+    }
+
+
+def test_detailed_columns(iteration_info):
+    columns = detailed_columns(iteration_info)
+    assert "asset_cash_flow" not in columns
+    assert columns["iteration"].tolist() == [1, 1, 1, 2, 2, 2]
+    assert columns["year"].tolist() == [0, 1, 2, 0, 1, 2]
+    assert columns["reserve"].tolist() == [200, 100, 50, 150, 50, 0]
+    assert np.isnan(columns["asset_yield"][[0, 3]]).all()
+    assert columns["liability_benefit"][5] == 50.0
+    assert detailed_columns(iteration_info, with_cashflows=True)["asset_cash_flow"][2] == 105.0
+
+
+def test_csv_rows(iteration_info):
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = os.path.join(output_dir, "detailed.csv")
+        write_detailed_report(path, iteration_info, with_cashflows=True)
+        with open(path) as f:
+            rows = list(csv.reader(f))
+    # Columns added after the original nine come last.
+    assert rows[0][6:] == ["Reserve", "Asset Yield", "Liability Benefit", "Asset Cash Flow", "Asset Market Value"]
+    assert rows[1] == ["1", "200", "50.0", "0.0", "400", "0", "200.0", "", "", "", "200.0"]
+    assert rows[6][5:] == ["2", "0.0", "0.04", "50.0", "105.0", "153.0"]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_npz_matches_columns(iteration_info, compress):
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = os.path.join(output_dir, "detailed.npz")
+        write_detailed_report(path, iteration_info, report_format="npz", compress=compress)
+        with np.load(path) as data:
+            for name, values in detailed_columns(iteration_info).items():
+                assert np.array_equal(data[name], values, equal_nan=True)
+
+
+def test_unknown_format(iteration_info):
+    with pytest.raises(ValueError):
+        write_detailed_report("detailed.xlsx", iteration_info, report_format="xlsx")
+
+
+def test_background_writer_runs_in_order_and_raises():
+    written, threads = [], set()
+
+    def write(value):
+        threads.add(threading.current_thread().name)
+        if value is None:
+            raise RuntimeError("write failed")
+        written.append(value)
+
+    with ReportWriter(background=True) as writer:
+        for value in range(5):
+            writer.submit(write, value)
+    assert written == list(range(5))
+    assert all(name.startswith("report-writer") for name in threads)
+
+    writer = ReportWriter(background=True)
+    writer.submit(write, None)
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+    ReportWriter().submit(write, 5)
+    assert written[-1] == 5
@@ -0,0 +1,90 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mfi_alm.assets import AssetPortfolioLoader
+from mfi_alm.liabilities import load_liability_portfolio
+from mfi_alm.scenarios import ScenarioPortfolios
+
+
+@pytest.fixture
+def tape_paths():
+    temp_dir = tempfile.TemporaryDirectory()
+    asset_path = os.path.join(temp_dir.name, "asset_tape.csv")
+    liability_path = os.path.join(temp_dir.name, "policyholder_tape.csv")
+    pd.DataFrame(
+        {
+            "face": [1000, 500, 2000],
+            "coupon": [0.05, 0.03, 0.06],
+            "maturity": [5, 2, 10],
+            "freq": [2, 4, 1],
+            "ytm": [0.04, 0.03, 0.05],
+        }
+    ).to_csv(asset_path, index=False)
+    pd.DataFrame(
+        {
+            "policyholder_id": [0, 1, 2, 3],
+            "age": [30, 40, 50, 119],
+            "benefit": [1000, 1500, 800, 50],
+            "mu": [0.05, 0.04, 0.05, 0.02],
+        }
+    ).to_csv(liability_path, index=False)
+    yield asset_path, liability_path
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize("ytm_factor,mortality_factor", [(1.1, 0.7), (0.75, 0.9)])
+def test_scenario_matches_direct_load(tape_paths, ytm_factor, mortality_factor):
+    asset_path, liability_path = tape_paths
+    portfolios = ScenarioPortfolios.load(asset_path=asset_path, liability_path=liability_path, liability_interest=0.03)
+    assets, liabilities = portfolios.scenario(ytm_factor=ytm_factor, mortality_factor=mortality_factor)
+
+    expected_assets = AssetPortfolioLoader.load_asset_portfolio(file_path=asset_path, ytm_factor=ytm_factor)
+    expected_liabilities = load_liability_portfolio(
+        filepath=liability_path, mortality_factor=mortality_factor, interest=0.03
+    )
+    assert assets.market_value() == expected_assets.market_value()
+    assert liabilities.insurance_apv() == expected_liabilities.insurance_apv()
+    assert np.array_equal(liabilities.benefits_lookup, expected_liabilities.benefits_lookup)
+
+
+def test_scenarios_do_not_share_state(tape_paths):
+    asset_path, liability_path = tape_paths
+    portfolios = ScenarioPortfolios.load(asset_path=asset_path, liability_path=liability_path, liability_interest=0.03)
+    base_value = portfolios.asset_portfolio.market_value()
+    assets, liabilities = portfolios.scenario(ytm_factor=1.0, mortality_factor=1.0)
+    assets.scale_to_target(1e6)
+    assets.age_one_year()
+    liabilities.age_one_year()
+    assert portfolios.asset_portfolio.market_value() == base_value
+    assert portfolios.liability_portfolio.book.ages.tolist() == [30, 40, 50, 119]
+
+
+def test_streamed_scenarios(tape_paths):
+    asset_path, liability_path = tape_paths
+    portfolios = ScenarioPortfolios.load(
+        asset_path=asset_path,
+        liability_path=liability_path,
+        liability_interest=0.03,
+        liability_chunk_size=2,
+        mortality_factors=[0.7, 0.9],
+    )
+    expected = load_liability_portfolio(filepath=liability_path, mortality_factor=0.9, interest=0.03)
+    assert np.isclose(portfolios.liabilities(0.9).insurance_apv(), expected.insurance_apv())
+    with pytest.raises(ValueError):
+        portfolios.liabilities(1.2)
+
+
+def test_streaming_rejects_model_points(tape_paths):
+    asset_path, liability_path = tape_paths
+    with pytest.raises(ValueError, match="model points"):
+        ScenarioPortfolios.load(
+            asset_path=asset_path,
+            liability_path=liability_path,
+            liability_interest=0.03,
+            model_points={"mu_bucket_width": 0.01},
+            liability_chunk_size=2,
+        )
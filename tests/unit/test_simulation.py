@@ -0,0 +1,206 @@
+import csv
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from mfi_alm.assets import AssetPortfolio, BondBook
+from mfi_alm.liabilities import ConstantForceTables, LiabilityPortfolio, PolicyBook
+from mfi_alm.simulation import ScenarioSimulator, project_cashflow_reserves, project_reserves
+
+
+def reference_reserves(capital: float, asset_yields: np.ndarray, liability_benefits: np.ndarray) -> np.ndarray:
+    growth_factors = np.cumprod(1 + asset_yields)
+    adjusted_liabilities = np.cumsum(liability_benefits / growth_factors) * growth_factors
+    return np.concatenate([[capital], capital * growth_factors - adjusted_liabilities])
+
+
+@pytest.fixture
+def simulator() -> ScenarioSimulator:
+    asset_portfolio = AssetPortfolio(
+        book=BondBook(
+            face=np.array([1000.0, 2000.0]),
+            coupon=np.array([0.05, 0.04]),
+            maturity=np.array([5.0, 12.0]),
+            freq=np.array([2, 1]),
+            ytm=np.array([0.04, 0.05]),
+        )
+    )
+    liability_portfolio = LiabilityPortfolio(
+        policyholders=None,
+        interest=0.03,
+        book=PolicyBook(
+            ids=np.arange(3),
+            ages=np.array([40.0, 60.0, 80.0]),
+            benefits=np.array([1000.0, 500.0, 700.0]),
+            table_ids=np.array([0, 1, 0]),
+            tables=ConstantForceTables(mu=np.array([0.02, 0.05])),
+        ),
+    )
+    return ScenarioSimulator(
+        asset_portfolio=asset_portfolio,
+        liability_portfolio=liability_portfolio,
+        initial_capital=2000,
+        maximum_capital=10000,
+        years=10,
+        tolerance=1e-3,
+        verbose=False,
+    )
+
+
+def test_project_reserves_matches_reference():
+    rng = np.random.default_rng(3)
+    capitals = np.array([0.0, 1e3, 5e4])
+    asset_yields = rng.uniform(0.0, 0.08, size=(4, 12))
+    liability_benefits = rng.uniform(100, 1000, size=(4, 12))
+
+    reserves = project_reserves(capitals=capitals, asset_yields=asset_yields, liability_benefits=liability_benefits)
+    assert reserves.shape == (4, 3, 13)
+    for s in range(4):
+        for c, capital in enumerate(capitals):
+            assert np.array_equal(reserves[s, c], reference_reserves(capital, asset_yields[s], liability_benefits[s]))
+
+
+def test_project_reserves_single_scenario():
+    reserves = project_reserves(capitals=100.0, asset_yields=np.full(3, 0.1), liability_benefits=np.zeros(3))
+    assert reserves.shape == (1, 1, 4)
+    assert np.allclose(reserves[0, 0], [100, 110, 121, 133.1])
+
+
+def test_project_reserves_shape_mismatch():
+    with pytest.raises(ValueError):
+        project_reserves(capitals=[1.0], asset_yields=np.zeros((2, 3)), liability_benefits=np.zeros((2, 4)))
+
+
+def test_evaluate_capitals_matches_simulate_cashflows(simulator):
+    capitals = np.array([1000.0, 2500.0])
+    grid = simulator.evaluate_capitals(capitals)
+    for capital, reserves in zip(capitals, grid):
+        result = simulator.simulate_cashflows(
+            capital=capital,
+            asset_portfolio=simulator.asset_portfolio,
+            liability_portfolio=simulator.liability_portfolio,
+        )
+        assert np.array_equal(reserves, result["reserves"])
+
+
+def test_run_and_output_report(simulator):
+    simulator.run()
+    assert simulator.converged
+    final = simulator.evaluate_capitals(np.array([simulator.final_capital]))[0, -1]
+    assert abs(final) < 1e-3
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        simulator.output_report(scenario_name="test", output_dir=output_dir)
+        with open(os.path.join(output_dir, "output_test_report.csv")) as f:
+            rows = list(csv.reader(f))
+        assert rows[1][:3] == ["test", str(simulator.final_capital), "True"]
+        with open(os.path.join(output_dir, "output_test_report_detailed.csv")) as f:
+            assert len(list(csv.reader(f))) == 1 + len(simulator.iteration_info) * 11
+
+
+def test_project_cashflow_reserves_matches_cash_account():
+    rates = np.array([0.03, 0.04, 0.02])
+    inflows = np.array([0.05, 0.05, 0.6])
+    values = np.array([0.98, 0.55, 0.0])
+    benefits = np.array([10.0, 20.0, 30.0])
+    capital = 1000.0
+
+    reserves = project_cashflow_reserves([capital], rates, inflows, values, benefits)[0, 0]
+    cash = 0.0
+    for t in range(3):
+        cash = cash * (1 + rates[t]) + capital * inflows[t] - benefits[t]
+        assert np.isclose(reserves[t + 1], cash + capital * values[t])
+    assert reserves[0] == capital
+
+
+def test_cashflow_mode(simulator):
+    simulator.mode = "cashflow"
+    unit_inflows, unit_values = simulator.unit_asset_cashflows()
+    book = simulator.asset_portfolio.book
+    assert np.isclose(unit_inflows.sum() * book.market_value(), book.cashflow_buckets(simulator.years).sum())
+    assert unit_values[-1] > 0  # the 12-year bond is still held after 10 years
+
+    simulator.solver_method = "analytic"
+    simulator.run()
+    assert simulator.converged
+    assert len(simulator.iteration_info) == 1
+    reserves = simulator.evaluate_capitals(np.array([simulator.final_capital, 5000.0]))
+    assert reserves[1, 0] == 5000.0
+    assert abs(reserves[0, -1]) < 1e-3
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        simulator.output_report(scenario_name="test", output_dir=output_dir)
+        with open(os.path.join(output_dir, "output_test_report_detailed.csv")) as f:
+            rows = list(csv.reader(f))
+        assert rows[0][-2:] == ["Asset Cash Flow", "Asset Market Value"]
+        assert rows[1][-2] == ""
+        assert np.isclose(float(rows[2][-2]), simulator.iteration_info[0]["asset_cashflows"][0])
+
+
+def test_unknown_mode(simulator):
+    with pytest.raises(ValueError):
+        ScenarioSimulator(
+            asset_portfolio=simulator.asset_portfolio,
+            liability_portfolio=simulator.liability_portfolio,
+            initial_capital=1,
+            maximum_capital=2,
+            years=1,
+            mode="bonds",
+        )
+
+
+@pytest.mark.parametrize("solver", ["analytic", "secant"])
+def test_run_with_solver(simulator, solver):
+    simulator.run()
+    bisection_capital = simulator.final_capital
+
+    simulator.solver_method = solver
+    simulator.run()
+    assert simulator.converged
+    assert np.isclose(simulator.final_capital, bisection_capital, atol=1e-2)
+    assert len(simulator.iteration_info) < 10
+
+
+def test_mortality_paths_report(simulator):
+    simulator.run()
+    reserves = simulator.simulate_mortality_paths(n_paths=200, seed=1)
+    assert reserves.shape == (200, 11)
+    assert np.all(reserves[:, 0] == simulator.final_capital)
+    assert np.allclose(simulator.mortality_paths["mean"], reserves.mean(axis=0))
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        simulator.output_report(scenario_name="test", output_dir=output_dir)
+        with open(os.path.join(output_dir, "output_test_report_mortality_paths.csv")) as f:
+            rows = list(csv.reader(f))
+    assert rows[0] == ["Year", "Mean Reserve", "Reserve 05%", "Reserve 50%", "Reserve 95%", "Probability Negative"]
+    assert len(rows) == 12
+
+
+def test_rate_paths(simulator):
+    simulator.run()
+    flat = np.full((3, simulator.years), simulator.asset_portfolio.average_yield())
+    reserves = simulator.simulate_rate_paths(flat)
+    assert reserves.shape == (3, 11)
+    assert np.allclose(reserves, simulator.evaluate_capitals(np.array([simulator.final_capital]))[0])
+    assert np.all(simulator.rate_paths["q05"] == simulator.rate_paths["q95"])
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        simulator.output_report(scenario_name="test", output_dir=output_dir)
+        assert os.path.exists(os.path.join(output_dir, "output_test_report_rate_paths.csv"))
+
+
+def test_asset_projections_are_computed_once_and_scaled(simulator, monkeypatch):
+    book = simulator.asset_portfolio.book
+    expected = simulator.asset_portfolio.projected_total_market_values(simulator.years + 1)
+    calls = []
+    projected_prices = book.projected_prices
+    monkeypatch.setattr(
+        book, "projected_prices", lambda *args, **kwargs: calls.append(args) or projected_prices(*args, **kwargs)
+    )
+
+    simulator.run()
+    assert len(calls) == 1
+    info = simulator.iteration_info[len(simulator.iteration_info) - 1]
+    assert np.allclose(info["asset_market_values"], expected * info["capital"] / book.market_value())
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from mfi_alm.solvers import (
+    AnalyticSolver,
+    BisectionSolver,
+    CapitalSolver,
+    SecantSolver,
+    make_solver,
+    warm_bracket,
+    warm_start,
+)
+
+
+def solve(solver, reserve, tolerance=1e-6, max_iterations=60) -> tuple[float, int]:
+    for i in range(max_iterations):
+        capital = solver.next_capital()
+        final_reserve = reserve(capital)
+        if abs(final_reserve) < tolerance:
+            return capital, i + 1
+        solver.update(capital, final_reserve)
+    raise AssertionError("solver did not converge")
+
+
+def affine(capitals):
+    return 1.35 * np.asarray(capitals) - 875.0
+
+
+def test_bisection_matches_plain_bisection():
+    solver = BisectionSolver(lower=0.0, upper=1100.0, initial=650.0)
+    capitals, lower, upper, capital = [], 0.0, 1100.0, 650.0
+    for _ in range(10):
+        assert solver.next_capital() == capital
+        capitals.append(capital)
+        final_reserve = affine(capital)
+        solver.update(capital, final_reserve)
+        if final_reserve < 0:
+            lower = capital
+        else:
+            upper = capital
+        capital = (lower + upper) / 2
+        assert (solver.lower, solver.upper) == (lower, upper)
+
+
+def test_analytic_solves_affine_projection_in_one_simulation():
+    solver = AnalyticSolver(lower=0.0, upper=1100.0, initial=650.0, final_reserves=affine)
+    capital, iterations = solve(solver, affine)
+    assert iterations == 1
+    assert np.isclose(capital, 875.0 / 1.35)
+
+
+def test_analytic_falls_back_to_bisection_without_root_in_bracket():
+    solver = AnalyticSolver(lower=0.0, upper=100.0, initial=50.0, final_reserves=affine)
+    assert solver.next_capital() == 50.0
+    solver.update(50.0, affine(50.0))
+    assert solver.next_capital() == 75.0
+
+
+def test_secant_converges_faster_than_bisection():
+    def reserve(capital):
+        return capital**2 / 1000 + capital - 900.0
+
+    _, secant_iterations = solve(SecantSolver(lower=0.0, upper=1100.0, initial=650.0), reserve)
+    _, bisection_iterations = solve(BisectionSolver(lower=0.0, upper=1100.0, initial=650.0), reserve)
+    assert secant_iterations < bisection_iterations
+
+
+def test_make_solver():
+    assert isinstance(make_solver("secant", lower=0, upper=1, initial=0.5), SecantSolver)
+    with pytest.raises(ValueError):
+        make_solver("newton", lower=0, upper=1, initial=0.5)
+    with pytest.raises(ValueError):
+        make_solver("analytic", lower=0, upper=1, initial=0.5)
+
+
+def test_warm_start():
+    assert warm_start(lower=0, upper=10, initial=5, previous_capital=None) == 5
+    assert warm_start(lower=0, upper=10, initial=5, previous_capital=7) == 7
+    assert warm_start(lower=0, upper=10, initial=5, previous_capital=12) == 5
+
+
+def test_warm_bracket():
+    assert warm_bracket(lower=0, upper=1100, previous_capital=None) is None
+    assert warm_bracket(lower=0, upper=1100, previous_capital=1200) is None
+    assert warm_bracket(lower=0, upper=1100, previous_capital=600, width=0.1) == pytest.approx((540, 660))
+    assert warm_bracket(lower=0, upper=1100, previous_capital=1050, width=0.1) == pytest.approx((945, 1100))
+
+
+@pytest.mark.parametrize("solver_class", [BisectionSolver, SecantSolver])
+def test_warm_bracket_around_root_saves_iterations(solver_class):
+    root = 875.0 / 1.35
+    bracket = warm_bracket(lower=0.0, upper=1100.0, previous_capital=root * 1.02, width=0.05)
+    warm = solver_class(lower=0.0, upper=1100.0, initial=root * 1.02, bracket=bracket)
+    cold = solver_class(lower=0.0, upper=1100.0, initial=root * 1.02)
+    capital, warm_iterations = solve(warm, affine, tolerance=1e-3)
+    assert np.isclose(capital, root)
+    cold_iterations = solve(cold, affine, tolerance=1e-3)[1]
+    # Secant steps solve an affine projection exactly either way; bisection gains from the narrower bracket.
+    assert warm_iterations < cold_iterations if solver_class is BisectionSolver else warm_iterations <= cold_iterations
+
+
+@pytest.mark.parametrize("solver_class", [BisectionSolver, SecantSolver])
+@pytest.mark.parametrize("previous", [400.0, 900.0])
+def test_warm_bracket_widens_when_root_lies_outside(solver_class, previous):
+    solver = solver_class(
+        lower=0.0, upper=1100.0, initial=previous, bracket=warm_bracket(0.0, 1100.0, previous, width=0.1)
+    )
+    capital, _ = solve(solver, affine)
+    assert np.isclose(capital, 875.0 / 1.35)
+    # The guessed end towards the root is simulated right after the starting capital.
+    assert solver.history[1][0] == pytest.approx(previous * (1.1 if previous < 648 else 0.9))
+
+
+def test_capital_solver_is_abstract():
+    with pytest.raises(TypeError):
+        CapitalSolver(lower=0.0, upper=1.0, initial=0.5)
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from mfi_alm.liabilities import ConstantForceTables, LiabilityPortfolio, ModelPoints, MortalityModel, PolicyBook
+from mfi_alm.liabilities.stochastic_mortality import sample_benefits, simulate_benefit_paths
+
+AGES = np.array([0.0, 30.0, 30.5, 60.0, 119.0, 120.0, 125.0])
+
+
+def gompertz_table() -> MortalityModel:
+    return MortalityModel.from_lx(lx=1000 * np.exp(-0.05 * np.arange(121) - 0.0004 * np.arange(121) ** 2))
+
+
+@pytest.mark.parametrize("tables", [ConstantForceTables(mu=np.array([0.05])), [gompertz_table()]])
+def test_sampled_benefits_pay_with_yearly_death_probabilities(tables):
+    # One policy at a time, so each path's benefit in year t is that policy's payment indicator; from the last age of
+    # the table on, q = 1 and it pays on every path.
+    for i in range(len(AGES)):
+        paid = sample_benefits(
+            rng=np.random.default_rng(i),
+            n_paths=50_000,
+            ages=AGES[i : i + 1],
+            benefits=np.ones(1),
+            table_ids=np.zeros(1, dtype=np.int64),
+            tables=tables,
+            years=130,
+        )
+        assert set(np.unique(paid)) <= {0.0, 1.0}
+        expected = tables[0].tqx_matrix(x=AGES[i].astype(np.int64), years=130)
+        assert np.allclose(paid.mean(axis=0), expected, atol=1e-2)
+        assert np.all(paid[:, expected == 1.0] == 1.0)
+
+
+def test_benefit_paths_are_reproducible():
+    rng = np.random.default_rng(5)
+    n = 500
+    ages = rng.integers(20, 118, size=n).astype(np.float64)
+    benefits = rng.uniform(1000, 5000, size=n)
+    table_ids = rng.integers(0, 3, size=n)
+    tables = ConstantForceTables(mu=np.array([0.01, 0.03, 0.08]))
+
+    kwargs = dict(ages=ages, benefits=benefits, table_ids=table_ids, tables=tables, years=40, seed=2024)
+    paths = simulate_benefit_paths(n_paths=4000, chunk_size=128, block_size=50_000, **kwargs)
+    assert paths.shape == (4000, 40)
+    assert np.array_equal(paths, simulate_benefit_paths(n_paths=4000, chunk_size=128, block_size=50_000, **kwargs))
+    assert not np.array_equal(
+        paths, simulate_benefit_paths(n_paths=4000, chunk_size=128, block_size=50_000, **{**kwargs, "seed": 1})
+    )
+
+
+@pytest.mark.parametrize("tables", [ConstantForceTables(mu=np.array([0.02, 0.06])), [gompertz_table()] * 2])
+def test_benefit_paths_converge_to_expected_benefits(tables):
+    rng = np.random.default_rng(9)
+    n = 300
+    book = PolicyBook(
+        ids=np.arange(n),
+        ages=np.append(rng.integers(20, 110, size=n - 3), [119, 120, 125]).astype(np.float64),
+        benefits=rng.uniform(1000, 5000, size=n),
+        table_ids=rng.integers(0, 2, size=n),
+        tables=tables,
+    )
+    portfolio = LiabilityPortfolio(policyholders=None, interest=0.03, book=book)
+    years = 130  # past the end of the tables, where every life pays each year
+
+    paths = portfolio.simulate_benefit_paths(n_paths=4000, years=years, seed=17)
+    expected = portfolio.projected_expected_yearly_benefits(years)
+    standard_error = paths.std(axis=0) / np.sqrt(len(paths))
+    assert np.all(np.abs(paths.mean(axis=0) - expected) <= 5 * standard_error + 1e-6 * expected)
+    assert np.allclose(paths[:, 120:], book.benefits.sum())
+
+
+def test_portfolio_benefit_paths():
+    book = PolicyBook(
+        ids=np.arange(2),
+        ages=np.array([40.0, 119.0]),
+        benefits=np.array([100.0, 200.0]),
+        table_ids=np.array([0, 0]),
+        tables=ConstantForceTables(mu=np.array([0.05])),
+    )
+    portfolio = LiabilityPortfolio(policyholders=None, interest=0.03, book=book)
+    paths = portfolio.simulate_benefit_paths(n_paths=10, years=5, seed=3)
+    # The policy aged 119 reaches the last age of its table in year 1 and pays every year from then on.
+    assert np.all(paths[:, 1:] >= 200.0)
+    assert set(np.unique(paths[:, 1:])) <= {200.0, 300.0}
+
+    compressed = LiabilityPortfolio(
+        policyholders=None,
+        interest=0.03,
+        book=book,
+        model_points=ModelPoints(age=book.ages, mu=np.full(2, 0.05), benefit=book.benefits, count=np.array([3, 4])),
+    )
+    with pytest.raises(ValueError):
+        compressed.simulate_benefit_paths(n_paths=10, years=100)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from mfi_alm.assets import AssetPortfolioLoader
+from mfi_alm.liabilities import load_liability_portfolio
+from mfi_alm.tape_generator import generate_chunk, generate_columns, generate_tape, iter_chunks, main
+from mfi_alm.tapes import open_tape, read_manifest
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.TemporaryDirectory()
+    yield temp_dir.name
+    temp_dir.cleanup()
+
+
+def test_chunks_are_reproducible_and_independent():
+    first = generate_chunk("policyholders", rows=250, index=1, seed=7, chunk_size=100)
+    assert first["policyholder_id"].tolist() == list(range(101, 201))
+    assert np.array_equal(first["mu"], generate_chunk("policyholders", rows=250, index=1, seed=7, chunk_size=100)["mu"])
+    assert not np.array_equal(
+        first["mu"], generate_chunk("policyholders", rows=250, index=0, seed=7, chunk_size=100)["mu"]
+    )
+    assert [len(chunk["age"]) for chunk in iter_chunks("policyholders", rows=250, chunk_size=100)] == [100, 100, 50]
+
+
+def test_synthetic_ranges():
+    policyholders = generate_columns("policyholders", rows=1000)
+    assert policyholders["age"].min() >= 20 and policyholders["age"].max() <= 80
+    assert ((policyholders["mu"] >= 0.03) & (policyholders["mu"] < 0.08)).all()
+    assets = generate_columns("assets", rows=500)
+    assert set(np.unique(assets["freq"])) <= {1, 2, 4}
+    assert (assets["maturity"] >= 1).all() and (assets["maturity"] <= 30).all()
+    assert len(generate_columns("assets", rows=0)["face"]) == 0
+
+
+def test_parallel_chunks_match_serial():
+    serial = list(iter_chunks("assets", rows=45, seed=3, chunk_size=10))
+    parallel = list(iter_chunks("assets", rows=45, seed=3, chunk_size=10, workers=2))
+    assert len(parallel) == 5
+    for a, b in zip(serial, parallel):
+        assert all(np.array_equal(a[name], b[name]) for name in a)
+
+
+def test_csv_and_binary_tapes_load_alike(temp_dir):
+    csv_path, tape_path = os.path.join(temp_dir, "policyholders.csv"), os.path.join(temp_dir, "policyholders.tape")
+    generate_tape(csv_path, "policyholders", rows=230, seed=1, chunk_size=100)
+    generate_tape(tape_path, "policyholders", rows=230, seed=1, chunk_size=100, tape_format="tape")
+    assert read_manifest(tape_path)["source"] == {"generator": "policyholders", "seed": 1, "chunk_size": 100}
+    assert open_tape(tape_path)["age"].dtype == np.float64
+
+    from_csv = load_liability_portfolio(csv_path, mortality_factor=1.0, interest=0.03)
+    from_tape = load_liability_portfolio(tape_path, mortality_factor=1.0, interest=0.03)
+    assert len(from_csv.book) == 230
+    assert from_csv.insurance_apv() == pytest.approx(from_tape.insurance_apv())
+
+
+def test_cli_writes_asset_tape(temp_dir):
+    path = os.path.join(temp_dir, "assets.tape")
+    assert main(["assets", "--rows", "25", "--output", path, "--chunk-size", "10"]) == 0
+    portfolio = AssetPortfolioLoader.load_asset_portfolio(path, ytm_factor=1.0)
+    assert len(portfolio.book) == 25 and portfolio.market_value() > 0
+    with pytest.raises(ValueError):
+        generate_tape(path, "loans", rows=5)
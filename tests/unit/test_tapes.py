@@ -0,0 +1,222 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mfi_alm.assets import AssetPortfolioLoader
+from mfi_alm.liabilities import load_liability_portfolio, stream_liability_portfolio
+from mfi_alm.tapes import MANIFEST, cached_tape, is_tape, open_tape, read_manifest, write_manifest, write_tape
+
+# Columns of `policyholder_csv` as pandas reads them without declared dtypes.
+CSV_DTYPES = {"policyholder_id": np.int64, "age": np.int64, "benefit": np.int64, "mu": np.float64}
+
+
+@pytest.fixture
+def temp_dir():
+    temp_dir = tempfile.TemporaryDirectory()
+    yield temp_dir.name
+    temp_dir.cleanup()
+
+
+@pytest.fixture
+def policyholder_csv(temp_dir) -> str:
+    filepath = os.path.join(temp_dir, "policyholder_tape.csv")
+    df = pd.DataFrame(
+        {"policyholder_id": [0, 1, 2], "age": [30, 40, 50], "benefit": [1000, 1500, 800], "mu": [0.05, 0.04, 0.05]}
+    )
+    df.to_csv(filepath, index=False)
+    return filepath
+
+
+def test_write_and_open_tape(temp_dir):
+    path = os.path.join(temp_dir, "example.tape")
+    write_tape(path, {"a": np.arange(5), "b": np.linspace(0, 1, 5)})
+    assert is_tape(path)
+
+    columns = open_tape(path)
+    assert isinstance(columns["a"], np.memmap)
+    assert columns["a"].tolist() == [0, 1, 2, 3, 4]
+    assert np.allclose(columns["b"], np.linspace(0, 1, 5))
+    assert read_manifest(path)["rows"] == 5
+
+    write_tape(path, {"a": np.arange(2)})
+    assert list(open_tape(path)) == ["a"]
+
+
+def test_replacing_a_tape_keeps_open_columns_readable(temp_dir):
+    path = os.path.join(temp_dir, "example.tape")
+    write_tape(path, {"a": np.arange(3)})
+    old = open_tape(path)
+    write_tape(path, {"a": np.arange(3) + 10})
+    assert old["a"].tolist() == [0, 1, 2]
+    assert open_tape(path)["a"].tolist() == [10, 11, 12]
+    # Only the published tape, a plain directory, is left behind.
+    assert os.listdir(temp_dir) == ["example.tape"] and not os.path.islink(path)
+
+
+def test_published_tape_can_be_moved(temp_dir):
+    path = os.path.join(temp_dir, "example.tape")
+    write_tape(path, {"a": np.arange(3)})
+    moved = os.path.join(temp_dir, "elsewhere", "moved.tape")
+    shutil.copytree(path, moved)
+    shutil.rmtree(path)
+    assert open_tape(moved)["a"].tolist() == [0, 1, 2]
+
+
+def test_replacing_a_linked_tape(temp_dir):
+    # Tapes used to be published as a link to a hidden sibling directory.
+    path = os.path.join(temp_dir, "example.tape")
+    target = os.path.join(temp_dir, ".tape-old")
+    os.makedirs(target)
+    np.save(os.path.join(target, "a.npy"), np.arange(2))
+    write_manifest(target, {"a": np.int64}, 2)
+    os.symlink(".tape-old", path)
+    assert sorted(os.listdir(path)) == sorted(["a.npy", MANIFEST])
+    write_tape(path, {"a": np.arange(4)})
+    assert open_tape(path)["a"].tolist() == [0, 1, 2, 3]
+    assert os.listdir(temp_dir) == ["example.tape"] and not os.path.islink(path)
+
+
+def test_concurrent_writers_do_not_fail(temp_dir):
+    path = os.path.join(temp_dir, "example.tape")
+    errors = []
+
+    def write(value):
+        try:
+            for _ in range(5):
+                write_tape(path, {"a": np.full(1000, value)})
+                assert len(set(open_tape(path)["a"].tolist())) == 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert open_tape(path)["a"][0] in range(4)
+
+
+def test_write_tape_mismatched_columns(temp_dir):
+    with pytest.raises(ValueError):
+        write_tape(os.path.join(temp_dir, "bad.tape"), {"a": np.arange(3), "b": np.arange(2)})
+
+
+def test_open_missing_tape(temp_dir):
+    with pytest.raises(FileNotFoundError):
+        open_tape(os.path.join(temp_dir, "missing.tape"))
+
+
+def test_cached_tape_reuse_and_invalidation(temp_dir, policyholder_csv):
+    cache_dir = os.path.join(temp_dir, "cache")
+    calls = []
+
+    def read_csv(path):
+        calls.append(path)
+        return {name: df.to_numpy() for name, df in pd.read_csv(path).items()}
+
+    def cached():
+        return cached_tape(policyholder_csv, read_csv=read_csv, cache_dir=cache_dir, dtypes=CSV_DTYPES)
+
+    first = cached()
+    second = cached()
+    assert len(calls) == 1
+    assert np.array_equal(first["age"], second["age"])
+
+    # Touching the file without changing its content re-validates by hash and keeps the tape.
+    stat = os.stat(policyholder_csv)
+    os.utime(policyholder_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cached()
+    assert len(calls) == 1
+
+    df = pd.read_csv(policyholder_csv)
+    df.loc[0, "age"] = 31
+    df.to_csv(policyholder_csv, index=False)
+    os.utime(policyholder_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    changed = cached()
+    assert len(calls) == 2
+    assert changed["age"][0] == 31
+
+
+def test_cached_tape_is_keyed_and_checked_on_schema(temp_dir, policyholder_csv):
+    cache_dir = os.path.join(temp_dir, "cache")
+    as_floats = {name: np.float64 for name in CSV_DTYPES}
+
+    def read_csv(path):
+        return {name: df.to_numpy() for name, df in pd.read_csv(path).items()}
+
+    def read_floats(path):
+        return {name: values.astype(np.float64) for name, values in read_csv(path).items()}
+
+    ints = cached_tape(policyholder_csv, read_csv=read_csv, cache_dir=cache_dir, dtypes=CSV_DTYPES)
+    floats = cached_tape(policyholder_csv, read_csv=read_floats, cache_dir=cache_dir, dtypes=as_floats)
+    assert ints["age"].dtype == np.int64 and floats["age"].dtype == np.float64
+    assert len(os.listdir(cache_dir)) == 2
+
+    # A reader returning other columns than it declares is rejected rather than cached.
+    with pytest.raises(ValueError, match="expected"):
+        cached_tape(policyholder_csv, read_csv=read_csv, cache_dir=cache_dir, dtypes={"age": np.int64})
+
+    # A tape whose columns no longer match its manifest (say, written before a schema change) is rebuilt.
+    tape_paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+    (tape_path,) = [path for path in tape_paths if read_manifest(path)["dtypes"]["age"] == "<i8"]
+    np.save(os.path.join(tape_path, "age.npy"), np.array([30.0, 40.0, 50.0]))
+    rebuilt = cached_tape(policyholder_csv, read_csv=read_csv, cache_dir=cache_dir, dtypes=CSV_DTYPES)
+    assert rebuilt["age"].dtype == np.int64
+
+
+def test_loaders_use_separate_cached_tapes(temp_dir, policyholder_csv):
+    # One CSV holding both schemas, read through both loaders with the same cache.
+    combined = os.path.join(temp_dir, "combined.csv")
+    df = pd.read_csv(policyholder_csv)
+    df[["face", "coupon", "maturity", "freq", "ytm"]] = [1000.0, 0.05, 5.0, 2, 0.04]
+    df.to_csv(combined, index=False)
+
+    cache_dir = os.path.join(temp_dir, "cache")
+    liabilities = load_liability_portfolio(filepath=combined, mortality_factor=1.0, interest=0.03, cache_dir=cache_dir)
+    assets = AssetPortfolioLoader.load_asset_portfolio(file_path=combined, ytm_factor=1.0, cache_dir=cache_dir)
+    assert len(liabilities.book) == 3
+    assert np.isclose(assets.market_value(), 3 * 1_043.05899897892)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_loaders_accept_tapes_and_cache(temp_dir, policyholder_csv):
+    cache_dir = os.path.join(temp_dir, "cache")
+    from_csv = load_liability_portfolio(filepath=policyholder_csv, mortality_factor=1.0, interest=0.03)
+    cached = load_liability_portfolio(
+        filepath=policyholder_csv, mortality_factor=1.0, interest=0.03, cache_dir=cache_dir
+    )
+    assert np.isclose(cached.insurance_apv(), from_csv.insurance_apv())
+
+    tape_path = os.path.join(temp_dir, "policyholders.tape")
+    write_tape(tape_path, {name: df.to_numpy() for name, df in pd.read_csv(policyholder_csv).items()})
+    from_tape = load_liability_portfolio(filepath=tape_path, mortality_factor=1.0, interest=0.03)
+    streamed = stream_liability_portfolio(filepath=tape_path, mortality_factor=1.0, interest=0.03, chunk_size=2)
+    assert np.isclose(from_tape.insurance_apv(), from_csv.insurance_apv())
+    assert np.isclose(streamed.insurance_apv(), from_csv.insurance_apv())
+
+    asset_tape = os.path.join(temp_dir, "assets.tape")
+    write_tape(
+        asset_tape,
+        {
+            "face": np.array([1000.0]),
+            "coupon": np.array([0.05]),
+            "maturity": np.array([5.0]),
+            "freq": np.array([2]),
+            "ytm": np.array([0.04]),
+        },
+    )
+    portfolio = AssetPortfolioLoader.load_asset_portfolio(file_path=asset_tape, ytm_factor=1.0)
+    assert np.isclose(portfolio.market_value(), 1_043.05899897892)
+
+
+def test_tape_missing_column(temp_dir):
+    tape_path = os.path.join(temp_dir, "policyholders.tape")
+    write_tape(tape_path, {"policyholder_id": np.arange(2), "age": np.array([30.0, 40.0])})
+    with pytest.raises(ValueError, match="missing"):
+        load_liability_portfolio(filepath=tape_path, mortality_factor=1.0, interest=0.03)